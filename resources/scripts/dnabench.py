@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+"""
+dnabench
+========
+    Benchmarks for the dnaplotlib modules and plotting scripts. Each benchmark
+    reports timings as a dict and can be run from the command line:
+
+    python dnabench.py BENCHMARK [BENCHMARK ...] [-repeat 5] [-json]
+                      [-save RESULTS_FILENAME]
+                      [-compare BASELINE_FILENAME [-threshold 0.25]
+                       [-memory_threshold 0.1] [-min_time 0.005]]
+
+    startup: cold import time of each module, measured in a fresh interpreter
+    for every repeat (so nothing is already loaded or cached in memory), along
+    with whether the import pulled in matplotlib.
+
+    loaders: time taken by the plot_SBOL_designs loaders to parse the inputs
+    of synthetic assignments of 100 designs and resolve their regulation.
+
+    render: time taken by each stage of drawing synthetic designs of a range
+    of sizes (parts per design, designs per figure, regulation arcs per part
+    and with or without labels): the loaders, layout, renderDNA, tight_layout,
+    savefig to PDF, PNG and SVG, and SVG output without matplotlib.
+
+    Each case of the loaders and render benchmarks is run in a fresh
+    interpreter and also reports the peak memory it used (MB). The synthetic
+    inputs are generated from a fixed seed, so they are the same for every
+    run and nothing needs to be downloaded.
+
+    Results are saved as JSON with -save. With -compare, timings (the fastest
+    of the repeats) more than threshold slower than those of a saved baseline,
+    or peak memory more than memory_threshold larger, are reported as
+    regressions and the exit status is 1. Timings below min_time in both runs
+    are too short to compare reliably and are skipped.
+"""
+#    dnabench
+#    Copyright (C) 2014 by
+#    Thomas E. Gorochowski <tom@chofski.co.uk>
+#    Bryan Der <bder@mit.edu>
+#    All rights reserved.
+#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
+
+from argparse import ArgumentParser
+from StringIO import StringIO
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
+               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
+__license__ = 'OSI Non-Profit OSL 3.0'
+__version__ = '1.0'
+
+# Modules whose import time is measured (numpy and matplotlib for reference)
+STARTUP_MODULES = ['numpy', 'matplotlib.pyplot', 'dnalayout', 'dnasvg', 'dnathumb',
+                   'dnaplotlib', 'plot_SBOL_designs', 'quick']
+
+# Run in a fresh interpreter to time a single import
+IMPORT_TIMER = '''
+import sys, time, json
+sys.path.insert(0, %r)
+start = time.time()
+import %s
+print(json.dumps({'time': time.time()-start, 'matplotlib': 'matplotlib' in sys.modules}))
+'''
+
+# Synthetic assignments parsed by the loaders benchmark (parts per design,
+# designs, regulation rows per part of a design and whether parts are labelled)
+LOADER_CASES = [
+	{'name': 'designs_100',      'parts': 20,  'designs': 100, 'arcs': 10.0, 'labels': False},
+	{'name': 'large_designs_100','parts': 150, 'designs': 100, 'arcs': 6.67, 'labels': False}]
+
+# Synthetic figures drawn by the render benchmark
+RENDER_CASES = [
+	{'name': 'small',      'parts': 10,  'designs': 1,  'arcs': 0.2,  'labels': False},
+	{'name': 'labels',     'parts': 40,  'designs': 10, 'arcs': 0.2,  'labels': True},
+	{'name': 'dense_arcs', 'parts': 40,  'designs': 10, 'arcs': 1.0,  'labels': False},
+	{'name': 'long',       'parts': 400, 'designs': 2,  'arcs': 0.05, 'labels': False},
+	{'name': 'many',       'parts': 20,  'designs': 40, 'arcs': 0.1,  'labels': False}]
+
+# Run in a fresh interpreter to time the stages of a single case
+CASE_TIMER = '''
+import sys, json
+sys.path.insert(0, %r)
+import dnabench
+print(json.dumps(dnabench.run_case(json.loads(%r), %d)))
+'''
+
+# Stages timed by the profiler while a figure is drawn (see plot_SBOL_designs)
+PROFILED_STAGES = ['renderDNA', 'tight_layout', 'savefig_pdf', 'savefig_png',
+                   'savefig_svg']
+
+# Default regression thresholds (fraction slower or larger than the baseline)
+# and shortest timing compared (seconds)
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.1
+DEFAULT_MIN_TIME = 0.005
+
+###############################################################################
+# Summary statistics
+###############################################################################
+
+def median (values):
+	""" Median of a list of numbers.
+	"""
+	values = sorted(values)
+	mid = len(values)//2
+	if len(values) % 2 == 1:
+		return values[mid]
+	return (values[mid-1]+values[mid])/2.0
+
+def timing_stats (times):
+	""" Fastest and median of a list of timings (seconds).
+	"""
+	return {'min': min(times), 'median': median(times)}
+
+def peak_memory ():
+	""" Peak resident memory of this process (MB).
+	"""
+	import resource
+	return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024.0
+
+###############################################################################
+# Startup
+###############################################################################
+
+def cold_import (module, python=None):
+	""" Time taken to import a module in a fresh interpreter and whether it
+	    loaded matplotlib ({'time': seconds, 'matplotlib': bool}).
+	"""
+	if python == None:
+		python = sys.executable
+	script_dir = os.path.dirname(os.path.abspath(__file__))
+	out = subprocess.check_output([python, '-c', IMPORT_TIMER % (script_dir, module)])
+	return json.loads(out.decode('utf-8').strip().split('\n')[-1])
+
+def bench_startup (modules=None, repeat=5, python=None):
+	""" Cold import time of each module (fastest and median of repeat fresh
+	    interpreters, in seconds) and whether matplotlib was loaded.
+	"""
+	if modules == None:
+		modules = STARTUP_MODULES
+	results = {}
+	for module in modules:
+		times = []
+		for i in range(repeat):
+			timing = cold_import(module, python)
+			times.append(timing['time'])
+		results[module] = timing_stats(times)
+		results[module]['matplotlib'] = timing['matplotlib']
+	return results
+
+###############################################################################
+# Synthetic designs
+###############################################################################
+
+# Part types in the order they repeat along a synthetic design
+SYNTHETIC_TYPES = ['Promoter', 'RBS', 'CDS', 'Terminator']
+
+def synthetic_inputs (num_parts, num_designs, arcs=0.0, labels=False, seed=0):
+	""" CSV data of the plot parameters, parts, designs and regulation of a
+	    synthetic assignment. Each design has num_parts parts (repeating
+	    promoter, RBS, CDS and terminator, some reversed) drawn from a catalogue
+	    of num_parts parts, and there are arcs regulation rows per part (from
+	    CDSs to promoters). The same seed always gives the same inputs.
+	"""
+	rng = random.Random(seed)
+	params = 'parameter,value\nlinewidth,1\naxis_y,35\nshow_title,N'
+	# Catalogue of parts of each type
+	catalogue = {}
+	parts = ['part_name,type,color,label']
+	for i in range(max(num_parts, len(SYNTHETIC_TYPES))):
+		part_type = SYNTHETIC_TYPES[i % len(SYNTHETIC_TYPES)]
+		part_name = '%s%d' % (part_type, i)
+		catalogue.setdefault(part_type, []).append(part_name)
+		color = '%.2f;%.2f;%.2f' % (rng.random(), rng.random(), rng.random())
+		label = ''
+		if labels == True:
+			label = part_name
+		parts.append('%s,%s,%s,%s' % (part_name, part_type, color, label))
+	designs = ['design_name,parts']
+	for i in range(num_designs):
+		row = ['design%04d' % i]
+		for j in range(num_parts):
+			part_name = rng.choice(catalogue[SYNTHETIC_TYPES[j % len(SYNTHETIC_TYPES)]])
+			if rng.random() < 0.2:
+				part_name = '-' + part_name
+			row.append(part_name)
+		designs.append(','.join(row))
+	regs = ['from_partname,type,to_partname,color']
+	for i in range(int(round(arcs*num_parts))):
+		reg_type = rng.choice(['Repression', 'Activation'])
+		regs.append('%s,%s,%s,%.2f;%.2f;%.2f' % (rng.choice(catalogue['CDS']), reg_type,
+			        rng.choice(catalogue['Promoter']), rng.random(), rng.random(),
+			        rng.random()))
+	return tuple(['\n'.join(x)+'\n' for x in [[params], parts, designs, regs]])
+
+###############################################################################
+# Loaders and rendering
+###############################################################################
+
+def run_case (case, repeat=5):
+	""" Time each stage of loading (and unless case['render'] is False,
+	    drawing) a synthetic case (fastest and median of repeat runs, in
+	    seconds) along with the number of regulation arcs and the peak memory
+	    used (MB). Intended to be run in a fresh interpreter (see bench_cases).
+	"""
+	import plot_SBOL_designs as psd
+	import dnaplotlib as dpl
+	params_data, parts_data, designs_data, regs_data = synthetic_inputs(case['parts'],
+		case['designs'], case['arcs'], case['labels'])
+	render = case.get('render', True)
+	out_dir = tempfile.mkdtemp()
+	times = {}
+	def add_time (stage, start):
+		times.setdefault(stage, []).append(time.time()-start)
+	try:
+		for i in range(repeat):
+			start = time.time()
+			plot_params = psd.load_plot_parameters(StringIO(params_data))
+			add_time('load_params', start)
+			start = time.time()
+			part_info = psd.load_part_information(StringIO(parts_data))
+			add_time('load_parts', start)
+			start = time.time()
+			dna_designs = psd.load_dna_designs(StringIO(designs_data), part_info)
+			add_time('load_designs', start)
+			start = time.time()
+			regs_info = psd.load_regulatory_information(StringIO(regs_data), part_info,
+				                                        dna_designs)
+			add_time('load_regulation', start)
+			if render == False:
+				continue
+			# Layout alone (as for dnasvg and dnathumb)
+			dr = psd.design_renderer(plot_params)
+			part_renderers = dr.SBOL_part_renderers()
+			reg_renderers = dr.std_reg_renderers()
+			design_list = sorted(dna_designs.keys())
+			start = time.time()
+			for j in range(len(design_list)):
+				dr.layout(dna_designs[design_list[j]], part_renderers, regs_info[j],
+					      reg_renderers)
+			add_time('layout', start)
+			# The stages of drawing a figure with matplotlib
+			plot_params['output_formats'] = 'pdf;png;svg'
+			profiler = dpl.Profiler()
+			psd.profiler = profiler
+			try:
+				psd.plot_dna(dna_designs, os.path.join(out_dir, 'out.pdf'), plot_params,
+					         regs_info)
+			finally:
+				psd.profiler = None
+			for stage in PROFILED_STAGES:
+				times.setdefault(stage, []).append(profiler.totals[('stage', stage)][1])
+			start = time.time()
+			psd.plot_dna_svg(dna_designs, os.path.join(out_dir, 'out_dnasvg.svg'),
+				             plot_params, regs_info)
+			add_time('dnasvg', start)
+	finally:
+		shutil.rmtree(out_dir, True)
+	results = {}
+	for stage in times.keys():
+		results[stage] = timing_stats(times[stage])
+	results['arcs'] = sum([len(r) for r in regs_info.values()])
+	results['peak_memory_mb'] = peak_memory()
+	return results
+
+def bench_cases (cases, repeat=5, python=None):
+	""" Results of run_case for each case (by name), each run in a fresh
+	    interpreter.
+	"""
+	if python == None:
+		python = sys.executable
+	script_dir = os.path.dirname(os.path.abspath(__file__))
+	results = {}
+	for case in cases:
+		out = subprocess.check_output([python, '-c', CASE_TIMER % (script_dir,
+			                          json.dumps(case), repeat)])
+		results[case['name']] = json.loads(out.decode('utf-8').strip().split('\n')[-1])
+	return results
+
+def bench_loaders (repeat=5, python=None):
+	""" Time taken to load the synthetic assignments of LOADER_CASES.
+	"""
+	cases = []
+	for case in LOADER_CASES:
+		case = dict(case)
+		case['render'] = False
+		cases.append(case)
+	return bench_cases(cases, repeat, python)
+
+def bench_render (repeat=5, python=None):
+	""" Time taken by each stage of drawing the synthetic figures of RENDER_CASES.
+	"""
+	return bench_cases(RENDER_CASES, repeat, python)
+
+###############################################################################
+# Regressions
+###############################################################################
+
+def flatten_results (results, prefix=''):
+	""" Numeric results keyed by their path (e.g., 'render/small/layout/min').
+	"""
+	flat = {}
+	for k in results.keys():
+		v = results[k]
+		if isinstance(v, dict):
+			flat.update(flatten_results(v, prefix+k+'/'))
+		elif isinstance(v, (int, long, float)) and not isinstance(v, bool):
+			flat[prefix+k] = v
+	return flat
+
+def compare_results (results, baseline, threshold=DEFAULT_THRESHOLD,
+	                 memory_threshold=DEFAULT_MEMORY_THRESHOLD,
+	                 min_time=DEFAULT_MIN_TIME):
+	""" Regressions against baseline results (both by benchmark name) as a list
+	    of (metric, baseline value, value). Only the fastest timings and peak
+	    memory of metrics present in both are compared.
+	"""
+	new = flatten_results(results)
+	old = flatten_results(baseline)
+	regressions = []
+	for metric in sorted(new.keys()):
+		if metric not in old:
+			continue
+		if metric.endswith('/min'):
+			if new[metric] < min_time and old[metric] < min_time:
+				continue
+			limit = old[metric]*(1.0+threshold)
+		elif metric.endswith('/peak_memory_mb'):
+			limit = old[metric]*(1.0+memory_threshold)
+		else:
+			continue
+		if new[metric] > limit:
+			regressions.append((metric, old[metric], new[metric]))
+	return regressions
+
+def environment ():
+	""" Versions of the software the benchmarks were run with.
+	"""
+	import matplotlib
+	import numpy
+	return {'python': platform.python_version(), 'platform': platform.platform(),
+	        'matplotlib': matplotlib.__version__, 'numpy': numpy.__version__}
+
+###############################################################################
+# Command line
+###############################################################################
+
+BENCHMARKS = {'startup': bench_startup,
+              'loaders': bench_loaders,
+              'render':  bench_render}
+
+def print_results (benchmark, results):
+	""" Print the results of a benchmark as a table.
+	"""
+	if benchmark == 'startup':
+		for name in sorted(results.keys()):
+			result = results[name]
+			loaded = 'not loaded'
+			if result['matplotlib'] == True:
+				loaded = 'loaded'
+			print '%-20s min %7.3fs  median %7.3fs  matplotlib %s' % (name, result['min'],
+				  result['median'], loaded)
+		return
+	for name in sorted(results.keys()):
+		result = results[name]
+		print '%s (%d arcs, peak memory %.1f MB)' % (name, result['arcs'],
+			  result['peak_memory_mb'])
+		for stage in sorted(result.keys()):
+			if isinstance(result[stage], dict):
+				print '  %-18s min %7.3fs  median %7.3fs' % (stage, result[stage]['min'],
+					  result[stage]['median'])
+
+def main():
+	parser = ArgumentParser(description="Benchmark dnaplotlib")
+	parser.add_argument('benchmarks', nargs='+', choices=sorted(BENCHMARKS.keys()),
+		                help="benchmarks to run", metavar="BENCHMARK")
+	parser.add_argument('-repeat', dest='repeat', type=int, default=5,
+		                help="times each measurement is repeated (default 5)")
+	parser.add_argument('-json', dest='json', action='store_true',
+		                help="print the results as JSON")
+	parser.add_argument('-save', dest='save', required=False,
+		                help="save the results as JSON", metavar="FILE")
+	parser.add_argument('-compare', dest='compare', required=False,
+		                help="report regressions against results saved before",
+		                metavar="FILE")
+	parser.add_argument('-threshold', dest='threshold', type=float,
+		                default=DEFAULT_THRESHOLD,
+		                help="fraction slower than the baseline that is a regression "
+		                "(default %.2f)" % DEFAULT_THRESHOLD)
+	parser.add_argument('-memory_threshold', dest='memory_threshold', type=float,
+		                default=DEFAULT_MEMORY_THRESHOLD,
+		                help="fraction more memory than the baseline that is a "
+		                "regression (default %.2f)" % DEFAULT_MEMORY_THRESHOLD)
+	parser.add_argument('-min_time', dest='min_time', type=float,
+		                default=DEFAULT_MIN_TIME,
+		                help="shortest timing compared in seconds (default %.3f)" %
+		                DEFAULT_MIN_TIME)
+	args = parser.parse_args()
+	baseline = None
+	if args.compare:
+		if not os.path.exists(args.compare):
+			parser.error("The file %s does not exist!" % args.compare)
+		f = open(args.compare, 'r')
+		baseline = json.load(f)['results']
+		f.close()
+	results = {}
+	for benchmark in args.benchmarks:
+		results[benchmark] = BENCHMARKS[benchmark](repeat=args.repeat)
+	if args.save:
+		f = open(args.save, 'w')
+		json.dump({'environment': environment(), 'repeat': args.repeat,
+			       'results': results}, f, indent=2, sort_keys=True)
+		f.close()
+	if args.json:
+		print json.dumps(results, indent=2, sort_keys=True)
+	else:
+		for benchmark in args.benchmarks:
+			print '%s:' % benchmark
+			print_results(benchmark, results[benchmark])
+	if baseline != None:
+		regressions = compare_results(results, baseline, args.threshold,
+			                          args.memory_threshold, args.min_time)
+		for metric, old, new in regressions:
+			print 'REGRESSION %-45s %9.3f -> %9.3f (%+.0f%%)' % (metric, old, new,
+				  100.0*(new-old)/old)
+		if len(regressions) > 0:
+			sys.exit(1)
+		print 'no regressions against %s' % args.compare
+
+if __name__ == "__main__":
+	main()
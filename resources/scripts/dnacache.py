@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+"""
+dnacache
+========
+    This module provides a size-bounded on-disk cache of rendered designs.
+    Entries are addressed by a hash of everything that affects a figure (the
+    designs with their resolved part options, the regulation, the plot
+    parameters, the output format, the renderer source code and the versions
+    of matplotlib and numpy), so identical designs are only drawn once however
+    they are submitted.
+
+    >  import dnacache
+    >  cache = dnacache.RenderCache('cache_dir', max_bytes=100*1024*1024)
+    >  key = cache.key(dna_designs, regs_info, plot_params, 'pdf')
+    >  if not cache.fetch(key, 'out.pdf'):
+    >      ... render to tmp_dir/out.pdf (and any other files out.*) ...
+    >      cache.store(key, tmp_dir)
+    >      cache.fetch(key, 'out.pdf')
+
+    Entries are evicted least recently used first once the cache grows beyond
+    max_bytes. Hit and miss counts are kept in a small file in the cache
+    directory so they accumulate across processes.
+"""
+#    dnacache
+#    Copyright (C) 2014 by
+#    Thomas E. Gorochowski <tom@chofski.co.uk>
+#    Bryan Der <bder@mit.edu>
+#    All rights reserved.
+#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+try:
+	import fcntl
+except ImportError:
+	# Not available on Windows (hit and miss counts are then not locked)
+	fcntl = None
+
+__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
+               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
+__license__ = 'OSI Non-Profit OSL 3.0'
+__version__ = '1.0'
+
+# Default maximum size of the cache (bytes)
+DEFAULT_MAX_BYTES = 512*1024*1024
+
+# Name rendered files must start with when stored (e.g., out.pdf, out.png)
+ENTRY_ROOT = 'out'
+
+# Modules whose source code affects rendered figures (alongside this one)
+RENDERER_MODULES = ['dnaplotlib', 'dnadesign', 'dnalayout', 'dnasvg', 'dnathumb',
+                    'plot_SBOL_designs']
+
+# Libraries whose version affects rendered figures
+RENDERER_LIBRARIES = ['matplotlib', 'numpy']
+
+# File in the cache directory holding the hit and miss counts
+STATS_FILE = 'stats.json'
+
+###############################################################################
+# Normalised inputs
+###############################################################################
+
+def normalise_part (part):
+	""" JSON-able form of a part (ignores its name and keys added while drawing).
+	"""
+	norm = {}
+	for k in ['type', 'fwd', 'start', 'end', 'opts']:
+		if k in part.keys():
+			norm[k] = part[k]
+	return norm
+
+def normalise_designs (dna_designs, regs_info=None, with_names=False):
+	""" JSON-able form of designs (in the order drawn) and their regulation.
+	    Regulation refers to parts by their position in the design. Design names
+	    are only included if with_names is True (i.e., they are drawn).
+	"""
+	norm = []
+	design_list = sorted(dna_designs.keys())
+	for i in range(len(design_list)):
+		design = dna_designs[design_list[i]]
+		part_idx = {}
+		for j in range(len(design)):
+			part_idx[id(design[j])] = j
+		regs = []
+		if regs_info != None:
+			for reg in regs_info[i]:
+				norm_reg = {}
+				for k in reg.keys():
+					if k in ['from_part', 'to_part']:
+						norm_reg[k] = part_idx.get(id(reg[k]), normalise_part(reg[k]))
+					else:
+						norm_reg[k] = reg[k]
+				regs.append(norm_reg)
+		design_name = None
+		if with_names == True:
+			design_name = design_list[i]
+		norm.append([design_name, [normalise_part(p) for p in design], regs])
+	return norm
+
+def library_version (name):
+	""" Version of an installed library (None if it is not installed).
+	"""
+	try:
+		return __import__(name).__version__
+	except ImportError:
+		return None
+
+def renderer_version ():
+	""" Digest of the source code of the renderer modules and the versions of
+	    the libraries they draw with.
+	"""
+	digest = hashlib.sha1()
+	for name in RENDERER_LIBRARIES:
+		digest.update('%s %s\n' % (name, library_version(name)))
+	script_dir = os.path.dirname(os.path.abspath(__file__))
+	for name in RENDERER_MODULES:
+		filename = os.path.join(script_dir, name + '.py')
+		if os.path.exists(filename):
+			f = open(filename, 'rb')
+			digest.update(f.read())
+			f.close()
+	return digest.hexdigest()
+
+###############################################################################
+# Render cache
+###############################################################################
+
+class RenderCache:
+	""" Content addressed on-disk cache of rendered figures.
+	"""
+
+	def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+		""" Constructor to open (or create) a RenderCache.
+
+		Parameters
+	    ----------
+	    cache_dir : string
+	        Directory the cache is stored in.
+
+	    max_bytes : int (default=DEFAULT_MAX_BYTES)
+	    	Size the cache is kept within.
+		"""
+		self.cache_dir = cache_dir
+		self.max_bytes = max_bytes
+		self.version = None
+		self.entries_dir = os.path.join(cache_dir, 'entries')
+		if not os.path.isdir(self.entries_dir):
+			try:
+				os.makedirs(self.entries_dir)
+			except OSError:
+				# Created by another process
+				if not os.path.isdir(self.entries_dir):
+					raise
+
+	def key (self, dna_designs, regs_info, plot_params, out_format):
+		""" Cache key of a set of designs rendered with the given parameters.
+		"""
+		if self.version == None:
+			self.version = renderer_version()
+		# Design names are drawn as titles or as contact sheet captions
+		with_names = False
+		for k in ['show_title', 'contact_sheet']:
+			if k in plot_params.keys() and plot_params[k] == 'Y':
+				with_names = True
+		norm = {'designs': normalise_designs(dna_designs, regs_info, with_names),
+		        'params': plot_params, 'format': out_format, 'version': self.version}
+		return hashlib.sha1(json.dumps(norm, sort_keys=True)).hexdigest()
+
+	def entry_dir (self, key):
+		return os.path.join(self.entries_dir, key)
+
+	def read_counts (self, f):
+		""" Hit and miss counts held in an open stats file.
+		"""
+		counts = {'hits': 0, 'misses': 0}
+		f.seek(0)
+		data = f.read()
+		if data != '':
+			try:
+				counts.update(json.loads(data))
+			except ValueError:
+				# Corrupt (e.g., written without a lock), so counting restarts
+				pass
+		return counts
+
+	def count (self, event):
+		""" Record a cache hit or miss. The counts are updated in place with the
+		    stats file locked, so concurrent processes do not lose events.
+		"""
+		fd = os.open(os.path.join(self.cache_dir, STATS_FILE), os.O_RDWR | os.O_CREAT)
+		f = os.fdopen(fd, 'r+')
+		try:
+			if fcntl != None:
+				fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+			counts = self.read_counts(f)
+			counts[event] += 1
+			f.seek(0)
+			f.write(json.dumps(counts, sort_keys=True))
+			f.truncate()
+		finally:
+			# Closing releases the lock
+			f.close()
+
+	def fetch (self, key, out_filename):
+		""" Copy the files of a cached entry to out_filename (and the files
+		    alongside it) if present. Returns True on a hit.
+		"""
+		entry = self.entry_dir(key)
+		try:
+			names = os.listdir(entry)
+		except OSError:
+			self.count('misses')
+			return False
+		root = os.path.splitext(out_filename)[0]
+		try:
+			for name in names:
+				shutil.copyfile(os.path.join(entry, name), root+name[len(ENTRY_ROOT):])
+		except (IOError, OSError):
+			# Evicted while being copied
+			self.count('misses')
+			return False
+		# Mark as recently used
+		now = time.time()
+		try:
+			os.utime(entry, (now, now))
+		except OSError:
+			pass
+		self.count('hits')
+		return True
+
+	def store (self, key, render_dir):
+		""" Store the files rendered to render_dir (named ENTRY_ROOT.*) and
+		    evict old entries if the cache has grown too large.
+		"""
+		entry = self.entry_dir(key)
+		if os.path.isdir(entry):
+			return
+		tmp_dir = tempfile.mkdtemp(dir=self.cache_dir)
+		for name in os.listdir(render_dir):
+			if name.startswith(ENTRY_ROOT):
+				shutil.copyfile(os.path.join(render_dir, name), os.path.join(tmp_dir, name))
+		try:
+			os.rename(tmp_dir, entry)
+		except OSError:
+			# Stored by another process
+			shutil.rmtree(tmp_dir, True)
+		self.evict()
+
+	def entries (self):
+		""" (last use, size in bytes, key) of every entry.
+		"""
+		entries = []
+		for key in os.listdir(self.entries_dir):
+			entry = self.entry_dir(key)
+			try:
+				size = 0
+				for name in os.listdir(entry):
+					size += os.path.getsize(os.path.join(entry, name))
+				entries.append((os.path.getmtime(entry), size, key))
+			except OSError:
+				# Evicted by another process
+				pass
+		return entries
+
+	def evict (self):
+		""" Remove least recently used entries until within max_bytes.
+		"""
+		entries = self.entries()
+		total = sum([e[1] for e in entries])
+		entries.sort()
+		for last_use, size, key in entries:
+			if total <= self.max_bytes:
+				break
+			shutil.rmtree(self.entry_dir(key), True)
+			total -= size
+
+	def stats (self):
+		""" Hits, misses, number of entries and size (bytes) of the cache.
+		"""
+		stats = {'hits': 0, 'misses': 0}
+		filename = os.path.join(self.cache_dir, STATS_FILE)
+		if os.path.exists(filename):
+			f = open(filename, 'r')
+			try:
+				if fcntl != None:
+					fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+				stats = self.read_counts(f)
+			finally:
+				f.close()
+		entries = self.entries()
+		stats['entries'] = len(entries)
+		stats['bytes'] = sum([e[1] for e in entries])
+		stats['max_bytes'] = self.max_bytes
+		return stats
+
+	def purge (self):
+		""" Remove all entries and reset the statistics.
+		"""
+		for key in os.listdir(self.entries_dir):
+			shutil.rmtree(self.entry_dir(key), True)
+		filename = os.path.join(self.cache_dir, STATS_FILE)
+		if os.path.exists(filename):
+			os.remove(filename)
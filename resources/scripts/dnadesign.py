@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+"""
+dnadesign
+=========
+    This module provides a compact container for designs. Rather than a dict
+    per part, a CompactDesign stores the type code, orientation, start and end
+    and style index of its parts in typed arrays. The part types and options
+    are held once in a StyleTable that can be shared by any number of designs
+    (e.g., all the designs drawn from a part catalogue).
+
+    >  import dnadesign
+    >  table = dnadesign.StyleTable()
+    >  design = dnadesign.CompactDesign.from_parts(parts, table)
+    >  start, end = dr.renderDNA(ax, design, part_renderers, regs, reg_renderers)
+    >  parts = design.to_parts()
+
+    DNARenderer.renderDNA() and dnalayout accept a CompactDesign wherever a
+    list of part dicts is used, and regulation can refer to its parts by their
+    index in the design. Both read the arrays directly (see part_records), so
+    part dicts are only built for parts that are regulated (to pass to the
+    regulation renderers). Converting to and from part dicts is lossless.
+"""
+#    dnadesign
+#    Copyright (C) 2014 by
+#    Thomas E. Gorochowski <tom@chofski.co.uk>
+#    Bryan Der <bder@mit.edu>
+#    All rights reserved.
+#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
+
+from array import array
+from itertools import izip
+
+__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
+               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
+__license__ = 'OSI Non-Profit OSL 3.0'
+__version__ = '1.0'
+
+# Flags recording which keys a part has (and their form)
+FLAG_FWD       = 1
+FLAG_FWD_TRUE  = 2
+FLAG_START     = 4
+FLAG_START_INT = 8
+FLAG_END       = 16
+FLAG_END_INT   = 32
+FLAG_NAME      = 64
+
+# Keys stored in the arrays of a CompactDesign
+PART_KEYS = ['type', 'name', 'fwd', 'start', 'end', 'opts']
+
+###############################################################################
+# Style table
+###############################################################################
+
+def style_key (opts):
+	""" Hashable form of part options that distinguishes lists from tuples (None
+	    if the options hold unhashable values).
+	"""
+	if isinstance(opts, dict):
+		items = []
+		for k in sorted(opts.keys()):
+			v = style_key(opts[k])
+			if v == None and opts[k] != None:
+				return None
+			items.append((k, v))
+		return ('dict', tuple(items))
+	if isinstance(opts, (list, tuple)):
+		values = []
+		for x in opts:
+			v = style_key(x)
+			if v == None and x != None:
+				return None
+			values.append(v)
+		return (type(opts).__name__, tuple(values))
+	try:
+		hash(opts)
+	except TypeError:
+		return None
+	return (type(opts).__name__, opts)
+
+class StyleTable:
+	""" Part types and options shared by the parts of many designs. Each distinct
+	    type and set of options is stored once and referred to by its index.
+	"""
+
+	def __init__(self):
+		self.types = []
+		self.styles = []
+		self.type_codes = {}
+		self.style_codes = {}
+		# Options seen before (by identity, to skip building their key)
+		self.style_ids = {}
+
+	def type_code (self, part_type):
+		""" Code of a part type (added to the table if new).
+		"""
+		if part_type not in self.type_codes:
+			self.type_codes[part_type] = len(self.types)
+			self.types.append(part_type)
+		return self.type_codes[part_type]
+
+	def style_index (self, opts):
+		""" Index of a set of part options (added to the table if new). Options
+		    equal to some already in the table share their entry.
+		"""
+		if id(opts) in self.style_ids:
+			return self.style_ids[id(opts)]
+		key = style_key(opts)
+		if key != None and key in self.style_codes:
+			index = self.style_codes[key]
+		else:
+			index = len(self.styles)
+			self.styles.append(opts)
+			if key != None:
+				self.style_codes[key] = index
+		# The options are held by the table, so their id stays valid
+		if self.styles[index] is opts:
+			self.style_ids[id(opts)] = index
+		return index
+
+###############################################################################
+# Compact designs
+###############################################################################
+
+class CompactDesign (object):
+	""" Design stored as typed arrays (one entry per part) and a StyleTable.
+
+	    - types: type code of each part (-1 if the part has no type).
+	    - flags: which of name, fwd, start and end each part has (see FLAG_*).
+	    - starts, ends: start and end of each part (0.0 if not given).
+	    - styles: style index of the options of each part (-1 if none).
+	    - names: name of each part (None if not given).
+	    - extras: dict of any other keys (or non-standard values) by part index.
+	"""
+	__slots__ = ['table', 'types', 'flags', 'starts', 'ends', 'styles', 'names',
+	             'extras']
+
+	def __init__(self, table=None):
+		""" Constructor to generate an empty CompactDesign.
+
+		Parameters
+	    ----------
+	    table : StyleTable (default=None)
+	    	Table of part types and options (a new table if None).
+		"""
+		if table == None:
+			table = StyleTable()
+		self.table = table
+		self.types = array('i')
+		self.flags = array('B')
+		self.starts = array('d')
+		self.ends = array('d')
+		self.styles = array('i')
+		self.names = []
+		self.extras = {}
+
+	@classmethod
+	def from_parts (cls, parts, table=None):
+		""" CompactDesign holding a list of part dicts.
+		"""
+		design = cls(table)
+		for part in parts:
+			design.append(part)
+		return design
+
+	def append (self, part):
+		""" Add a part (given as a part dict) to the end of the design.
+		"""
+		extra = {}
+		for k in part.keys():
+			if k not in PART_KEYS:
+				extra[k] = part[k]
+		type_code = -1
+		if 'type' in part.keys():
+			type_code = self.table.type_code(part['type'])
+		flags = 0
+		if 'name' in part.keys():
+			flags |= FLAG_NAME
+		if 'fwd' in part.keys():
+			if part['fwd'] is True:
+				flags |= FLAG_FWD | FLAG_FWD_TRUE
+			elif part['fwd'] is False:
+				flags |= FLAG_FWD
+			else:
+				extra['fwd'] = part['fwd']
+		start = 0.0
+		end = 0.0
+		for key, flag, int_flag in [('start', FLAG_START, FLAG_START_INT),
+			                        ('end', FLAG_END, FLAG_END_INT)]:
+			if key in part.keys():
+				value = part[key]
+				if type(value) == int and int(float(value)) == value:
+					flags |= flag | int_flag
+				elif type(value) == float:
+					flags |= flag
+				else:
+					extra[key] = value
+					continue
+				if key == 'start':
+					start = float(value)
+				else:
+					end = float(value)
+		style = -1
+		if 'opts' in part.keys():
+			style = self.table.style_index(part['opts'])
+		if len(extra) > 0:
+			self.extras[len(self.types)] = extra
+		self.types.append(type_code)
+		self.flags.append(flags)
+		self.starts.append(start)
+		self.ends.append(end)
+		self.styles.append(style)
+		self.names.append(part.get('name'))
+
+	def part (self, i):
+		""" Part dict of part i (equal to the one it was built from).
+		"""
+		part = {}
+		if self.types[i] != -1:
+			part['type'] = self.table.types[self.types[i]]
+		flags = self.flags[i]
+		if flags & FLAG_NAME:
+			part['name'] = self.names[i]
+		if flags & FLAG_FWD:
+			part['fwd'] = flags & FLAG_FWD_TRUE != 0
+		if flags & FLAG_START:
+			if flags & FLAG_START_INT:
+				part['start'] = int(self.starts[i])
+			else:
+				part['start'] = self.starts[i]
+		if flags & FLAG_END:
+			if flags & FLAG_END_INT:
+				part['end'] = int(self.ends[i])
+			else:
+				part['end'] = self.ends[i]
+		if self.styles[i] != -1:
+			part['opts'] = self.table.styles[self.styles[i]]
+		if i in self.extras:
+			part.update(self.extras[i])
+		return part
+
+	def records (self):
+		""" Generator of the part records (see part_records) of the design.
+		"""
+		types = self.table.types
+		styles = self.table.styles
+		extras = self.extras
+		i = 0
+		for type_code, name, flags, start, end, style in izip(self.types, self.names,
+			                                                  self.flags, self.starts,
+			                                                  self.ends, self.styles):
+			part_type = None
+			if type_code != -1:
+				part_type = types[type_code]
+			fwd = None
+			if flags & FLAG_FWD:
+				fwd = flags & FLAG_FWD_TRUE != 0
+			if not flags & FLAG_START:
+				start = None
+			elif flags & FLAG_START_INT:
+				start = int(start)
+			if not flags & FLAG_END:
+				end = None
+			elif flags & FLAG_END_INT:
+				end = int(end)
+			opts = None
+			if style != -1:
+				opts = styles[style]
+			extra = None
+			if i in extras:
+				extra = extras[i]
+				fwd = extra.get('fwd', fwd)
+				start = extra.get('start', start)
+				end = extra.get('end', end)
+			yield (i, part_type, name, fwd, start, end, opts, extra)
+			i += 1
+
+	def __len__ (self):
+		return len(self.types)
+
+	def __getitem__ (self, i):
+		if i < 0:
+			i += len(self.types)
+		if i < 0 or i >= len(self.types):
+			raise IndexError('part index out of range')
+		return self.part(i)
+
+	def __iter__ (self):
+		for i in range(len(self.types)):
+			yield self.part(i)
+
+	def to_parts (self):
+		""" List of part dicts equal to those the design was built from. The
+		    options of parts are those held by the style table.
+		"""
+		return [self.part(i) for i in range(len(self.types))]
+
+###############################################################################
+# Part records
+###############################################################################
+
+def part_record (part):
+	""" Record (see part_records) of a part dict.
+	"""
+	return (id(part), part.get('type'), part.get('name'), part.get('fwd'),
+		    part.get('start'), part.get('end'), part.get('opts'), part)
+
+def part_records (parts):
+	""" Generator of a record for each part of a design (a list of part dicts
+	    or a CompactDesign), read without building any part dicts:
+
+	    (key, type, name, fwd, start, end, opts, extra)
+
+	    where missing values are None. The key is the id of the part dict (or
+	    the index of the part in a CompactDesign, see part_key) and extra is a
+	    dict holding any other keys of the part (e.g., a custom renderer), None
+	    if there are none. For part dicts, extra is the part itself.
+	"""
+	if isinstance(parts, CompactDesign):
+		return parts.records()
+	return (part_record(part) for part in parts)
+
+def part_key (parts, part):
+	""" Key of the part record (see part_records) regulation refers to, given
+	    the part dict or the index of the part in the design.
+	"""
+	if isinstance(part, (int, long)) and not isinstance(part, bool):
+		if isinstance(parts, CompactDesign):
+			return part
+		return id(parts[part])
+	return id(part)
+
+###############################################################################
+# Regulation
+###############################################################################
+
+def compact_regulation (parts, regs):
+	""" Copy of regulation with its from_part and to_part given by their index
+	    in a list of part dicts (e.g., to go with a CompactDesign of the parts).
+	"""
+	part_idx = {}
+	for i in range(len(parts)):
+		part_idx[id(parts[i])] = i
+	compact_regs = []
+	for reg in regs:
+		compact_reg = dict(reg)
+		for k in ['from_part', 'to_part']:
+			if k in reg.keys() and id(reg[k]) in part_idx:
+				compact_reg[k] = part_idx[id(reg[k])]
+		compact_regs.append(compact_reg)
+	return compact_regs
+
+def resolve_design (parts, regs=None):
+	""" Parts (as a list of dicts) and regulation of a design in the form used
+	    when drawing. The part dicts of a CompactDesign are built for the drawing
+	    only, and regulation referring to parts by index is given a copy that
+	    refers to the parts themselves.
+	"""
+	if isinstance(parts, CompactDesign):
+		parts = parts.to_parts()
+	if regs != None:
+		resolved = None
+		for i in range(len(regs)):
+			reg = regs[i]
+			for k in ['from_part', 'to_part']:
+				if k in reg.keys() and isinstance(reg[k], (int, long)) and not isinstance(reg[k], bool):
+					if resolved == None:
+						resolved = list(regs)
+					if resolved[i] is reg:
+						resolved[i] = dict(reg)
+					resolved[i][k] = parts[reg[k]]
+		if resolved != None:
+			regs = resolved
+	return parts, regs
@@ -0,0 +1,601 @@
+#!/usr/bin/env python
+"""
+dnalayout
+=========
+    This module computes where dnaplotlib will place each part of a design,
+    without drawing anything and without importing matplotlib. This makes it
+    cheap to work out figure sizes, hit-boxes and regulation arc routing for
+    large numbers of designs and only draw those that are needed.
+
+    Designs and regulation use the same format as dnaplotlib:
+
+    >  import dnalayout
+    >  layout = dnalayout.layout_design(design, regs)
+    >  start, end = layout.start, layout.end
+
+    The extents are identical to those the built-in SBOL renderers return from
+    DNARenderer.renderDNA() and the arc height indexes are those used to draw
+    the regulation. Neither the design nor the regulation are modified.
+"""
+#    dnalayout
+#    Copyright (C) 2014 by
+#    Thomas E. Gorochowski <tom@chofski.co.uk>
+#    Emerson Glassey <eglassey@mit.edu>
+#    Bryan Der <bder@mit.edu>
+#    All rights reserved.
+#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
+
+import dnadesign
+import math
+
+__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
+               Emerson Glassey <eglassey@mit.edu>, Voigt Lab, MIT\n\
+               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
+__license__ = 'OSI Non-Profit OSL 3.0'
+__version__ = '1.0'
+
+###############################################################################
+# Layout rules for the built-in renderers
+###############################################################################
+
+# Default options of each built-in SBOL part renderer that affect its position.
+# - width: how the glyph width is found ('x_extent', 'blunt_site' = two sites
+#   and the space between them, 'sticky_site' = x_extent and end spaces,
+#   'linewidth' = width of a single line, 'space' = x_extent without padding)
+# - directional: reverse parts are drawn mirrored
+# - shape: vertical form of the glyph (used for bounding boxes)
+SBOL_LAYOUT_RULES = {
+	'Promoter'         : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':10.0, 'y_extent':10.0,
+	                      'arrowhead_height':2.0, 'width':'x_extent', 'directional':True,
+	                      'shape':'arrow_above'},
+	'CDS'              : {'start_pad':1.0, 'end_pad':1.0, 'x_extent':30.0, 'y_extent':5.0,
+	                      'arrowhead_height':4.0, 'width':'x_extent', 'directional':True,
+	                      'shape':'arrow_centred'},
+	'Terminator'       : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':8.0, 'y_extent':10.0,
+	                      'width':'x_extent', 'directional':True, 'shape':'above'},
+	'RBS'              : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':10.0,
+	                      'width':'x_extent', 'directional':True, 'shape':'dome'},
+	'Scar'             : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':6.0, 'y_extent':1.0,
+	                      'width':'x_extent', 'directional':False, 'shape':'centred'},
+	'Spacer'           : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':6.0,
+	                      'width':'x_extent', 'directional':False, 'shape':'circle'},
+	'EmptySpace'       : {'start_pad':0.0, 'end_pad':0.0, 'x_extent':12.0,
+	                      'width':'space', 'directional':False, 'shape':'none'},
+	'Ribozyme'         : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':5.0, 'y_extent':10.0,
+	                      'width':'x_extent', 'directional':True, 'shape':'stick'},
+	'Ribonuclease'     : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':5.0, 'y_extent':10.0,
+	                      'width':'x_extent', 'directional':True, 'shape':'stick'},
+	'ProteinStability' : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':5.0, 'y_extent':10.0,
+	                      'width':'x_extent', 'directional':True, 'shape':'stick'},
+	'Protease'         : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':5.0, 'y_extent':10.0,
+	                      'width':'x_extent', 'directional':True, 'shape':'stick'},
+	'Operator'         : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':6.0, 'y_extent':3.0,
+	                      'width':'x_extent', 'directional':False, 'shape':'centred'},
+	'Origin'           : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':10.0,
+	                      'width':'x_extent', 'directional':False, 'shape':'circle'},
+	'Insulator'        : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':8.0, 'y_extent':4.0,
+	                      'width':'x_extent', 'directional':False, 'shape':'centred'},
+	'5Overhang'        : {'start_pad':0.0, 'end_pad':2.0, 'x_extent':6.0, 'y_extent':1.0,
+	                      'width':'x_extent', 'directional':False, 'shape':'centred'},
+	'3Overhang'        : {'start_pad':2.0, 'end_pad':0.0, 'x_extent':6.0, 'y_extent':1.0,
+	                      'width':'x_extent', 'directional':False, 'shape':'centred'},
+	'RestrictionSite'  : {'start_pad':2.0, 'end_pad':2.0, 'y_extent':4.0,
+	                      'width':'linewidth', 'directional':False, 'shape':'centred'},
+	'BluntRestrictionSite'   : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':1.5, 'site_space':1.5,
+	                            'y_extent':4.0, 'width':'blunt_site', 'directional':False,
+	                            'shape':'centred'},
+	'PrimerBindingSite'      : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':8.0, 'y_extent':2.0,
+	                            'y_offset':1.5, 'width':'x_extent', 'directional':True,
+	                            'shape':'offset_above'},
+	'5StickyRestrictionSite' : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':8.0, 'end_space':1.0,
+	                            'y_extent':4.0, 'width':'sticky_site', 'directional':False,
+	                            'shape':'centred'},
+	'3StickyRestrictionSite' : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':8.0, 'end_space':1.0,
+	                            'y_extent':4.0, 'width':'sticky_site', 'directional':False,
+	                            'shape':'centred'},
+	'UserDefined'      : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':12.0, 'y_extent':3.0,
+	                      'width':'x_extent', 'directional':False, 'shape':'centred'},
+	'Signature'        : {'start_pad':2.0, 'end_pad':2.0, 'x_extent':12.0, 'y_extent':3.0,
+	                      'width':'x_extent', 'directional':True, 'shape':'centred'}}
+
+# Trace renderers draw parts at their given start/end (in bp) without padding
+TRACE_LAYOUT_RULES = {
+	'Promoter'         : {'y_extent':6.0, 'width':'trace', 'directional':True, 'shape':'above'},
+	'CDS'              : {'y_extent':2.5, 'width':'trace', 'directional':True, 'shape':'centred'},
+	'Terminator'       : {'y_extent':3.5, 'width':'trace', 'directional':True, 'shape':'above'},
+	'RBS'              : {'y_extent':4.2, 'width':'trace', 'directional':True, 'shape':'above'}}
+
+# Regulation arcs (see dnaplotlib.regulation)
+ARC_START_HEIGHT = 10
+ARC_BASE_HEIGHT = 15
+ARC_HEIGHT_STEP = 5
+
+###############################################################################
+# Regulation arc heights
+###############################################################################
+
+class ArcHeightTree:
+	""" Segment tree over a fixed number of slots that records, for every slot, the
+	    highest arc placed over it. Both placing an arc over a range of slots and
+	    finding the highest arc over a range take O(log n) time.
+	"""
+
+	def __init__(self, size):
+		self.size = max(size, 1)
+		# Height applied to the whole range of a node
+		self.tag = [0]*(4*self.size)
+		# Highest height anywhere within the range of a node
+		self.sub = [0]*(4*self.size)
+
+	def update(self, lo, hi, height, node=1, node_lo=0, node_hi=None):
+		""" Raise every slot in [lo, hi] to at least height.
+		"""
+		if node_hi == None:
+			node_hi = self.size-1
+		if hi < node_lo or lo > node_hi:
+			return
+		if height > self.sub[node]:
+			self.sub[node] = height
+		if lo <= node_lo and node_hi <= hi:
+			if height > self.tag[node]:
+				self.tag[node] = height
+			return
+		mid = (node_lo+node_hi) // 2
+		self.update(lo, hi, height, 2*node, node_lo, mid)
+		self.update(lo, hi, height, 2*node+1, mid+1, node_hi)
+
+	def query(self, lo, hi, node=1, node_lo=0, node_hi=None):
+		""" Return the highest height over any slot in [lo, hi] (0 if none).
+		"""
+		if node_hi == None:
+			node_hi = self.size-1
+		if hi < node_lo or lo > node_hi:
+			return 0
+		if lo <= node_lo and node_hi <= hi:
+			return self.sub[node]
+		mid = (node_lo+node_hi) // 2
+		return max(self.tag[node],
+		           self.query(lo, hi, 2*node, node_lo, mid),
+		           self.query(lo, hi, 2*node+1, mid+1, node_hi))
+
+def arc_height_indices (arcs):
+	""" Assign a height index to each regulation arc so that clashing arcs are
+	    stacked. Arcs are processed in the order given and each arc is placed one
+	    level above the highest earlier arc on the same side of the backbone that
+	    it clashes with (or at level 1 if there is none). Arcs above the backbone
+	    clash when their closed ranges overlap, arcs below when their open ranges
+	    overlap. Runs in O(n log n) time.
+
+	Parameters
+    ----------
+    arcs : list(tuple)
+    	(arc_min, arc_max, above) for each arc, where above is True if the arc
+    	is drawn above the backbone.
+
+    Returns
+    -------
+    heights : list(int)
+    	The arc height index of each arc.
+	"""
+	points = sorted(set([a[0] for a in arcs] + [a[1] for a in arcs]))
+	point_idx = {}
+	for i in range(len(points)):
+		point_idx[points[i]] = i
+	# Above: slots are the arc end points (touching arcs clash)
+	above = ArcHeightTree(len(points))
+	# Below: even slots are end points and odd slots the gaps between them.
+	# Arcs of zero length are kept apart as they never clash with each other.
+	below_spans = ArcHeightTree(2*len(points))
+	below_points = ArcHeightTree(2*len(points))
+	heights = []
+	for arc_min, arc_max, is_above in arcs:
+		lo = point_idx[arc_min]
+		hi = point_idx[arc_max]
+		if is_above:
+			height = above.query(lo, hi) + 1
+			above.update(lo, hi, height)
+		elif lo == hi:
+			height = below_spans.query(2*lo, 2*lo) + 1
+			below_points.update(2*lo, 2*lo, height)
+		else:
+			height = max(below_spans.query(2*lo+1, 2*hi-1),
+			             below_points.query(2*lo+1, 2*hi-1)) + 1
+			below_spans.update(2*lo+1, 2*hi-1, height)
+		heights.append(height)
+	return heights
+
+###############################################################################
+# Layout of a design
+###############################################################################
+
+def part_opt (rule, opts, key):
+	""" Value of a part option, falling back to the default of its renderer.
+	"""
+	if opts != None and key in opts:
+		return opts[key]
+	return rule[key]
+
+def part_width (rule, opts, linewidth):
+	""" Width of the glyph drawn for a part (excluding padding).
+	"""
+	width = rule['width']
+	if width == 'blunt_site':
+		x_extent = part_opt(rule, opts, 'x_extent')
+		return x_extent+part_opt(rule, opts, 'site_space')+x_extent
+	elif width == 'sticky_site':
+		end_space = part_opt(rule, opts, 'end_space')
+		return end_space+part_opt(rule, opts, 'x_extent')+end_space
+	elif width == 'linewidth':
+		if opts != None and 'linewidth' in opts.keys():
+			return opts['linewidth']
+		return linewidth
+	return part_opt(rule, opts, 'x_extent')
+
+def glyph_y_range (rule, opts, fwd):
+	""" Vertical extent of a glyph (ignoring line widths and labels).
+	"""
+	shape = rule['shape']
+	y_min = 0.0
+	y_max = 0.0
+	if shape == 'arrow_above':
+		y_max = part_opt(rule, opts, 'y_extent')+part_opt(rule, opts, 'arrowhead_height')
+	elif shape == 'arrow_centred':
+		y_max = part_opt(rule, opts, 'y_extent')+part_opt(rule, opts, 'arrowhead_height')
+		y_min = -y_max
+	elif shape == 'above':
+		y_max = part_opt(rule, opts, 'y_extent')
+	elif shape == 'dome':
+		y_max = part_opt(rule, opts, 'x_extent')/2.0
+	elif shape == 'stick':
+		y_max = part_opt(rule, opts, 'y_extent')*1.25
+		y_max = max(y_max, part_opt(rule, opts, 'y_extent')+part_opt(rule, opts, 'x_extent')/2.0)
+	elif shape == 'circle':
+		y_max = part_opt(rule, opts, 'x_extent')/2.0
+		y_min = -y_max
+	elif shape == 'centred':
+		y_max = part_opt(rule, opts, 'y_extent')
+		y_min = -y_max
+	elif shape == 'offset_above':
+		y_min = part_opt(rule, opts, 'y_offset')
+		y_max = y_min+part_opt(rule, opts, 'y_extent')
+	# Single sided glyphs are mirrored below the backbone for reverse parts
+	if rule['directional'] == True and fwd == False and y_min >= 0.0:
+		return -y_max, -y_min
+	return y_min, y_max
+
+class PartLayout:
+	""" Position of a single part in a design.
+
+	    - index: position of the part in the design list.
+	    - type, name: taken from the part.
+	    - given_fwd: fwd of the part (None if not given).
+	    - fwd: True if the part is drawn in the forward orientation.
+	    - extent_start, extent_end: x-range used by the part including padding
+	      (the start and end returned by the renderer).
+	    - glyph_start, glyph_end: x-range of the glyph itself (glyph_start >
+	      glyph_end for reverse parts of directional types).
+	    - anchor: x-position regulation arcs attach to.
+	    - label_x: x-position part labels are centred on.
+	    - y_min, y_max: vertical extent of the glyph.
+	"""
+
+	def __init__(self, index, record, fwd, extent_start, extent_end, glyph_start,
+		         glyph_end, y_min=0.0, y_max=0.0):
+		self.index = index
+		self.type = record[1]
+		self.name = record[2]
+		self.given_fwd = record[3]
+		self.fwd = fwd
+		self.extent_start = extent_start
+		self.extent_end = extent_end
+		self.glyph_start = glyph_start
+		self.glyph_end = glyph_end
+		self.anchor = (extent_start + extent_end) / 2
+		self.label_x = extent_start+((extent_end-extent_start)/2.0)
+		self.y_min = y_min
+		self.y_max = y_max
+
+	def hitbox (self):
+		""" Bounding box (x_min, y_min, x_max, y_max) of the glyph.
+		"""
+		return (min(self.glyph_start, self.glyph_end), self.y_min,
+		        max(self.glyph_start, self.glyph_end), self.y_max)
+
+class ArcLayout:
+	""" Routing of a single regulation arc.
+
+	    - index: position of the arc in the order arcs are drawn (shortest first).
+	    - reg: the regulation dict.
+	    - type: regulation type.
+	    - from_index, to_index: design index of the parts linked (None if a part
+	      was not placed).
+	    - start, end: x-positions the arc leaves and arrives at.
+	    - above: True if the arc is drawn above the backbone.
+	    - height_index: arc height index given to the regulation renderer.
+	    - top: y-position of the horizontal section of the arc.
+	"""
+
+	def __init__(self, index, reg, from_index, to_index, start, end, above, height_index):
+		self.index = index
+		self.reg = reg
+		self.type = reg['type']
+		self.from_index = from_index
+		self.to_index = to_index
+		self.start = start
+		self.end = end
+		self.above = above
+		self.height_index = height_index
+		self.top = ARC_BASE_HEIGHT + height_index*ARC_HEIGHT_STEP
+		if above == False:
+			self.top = -self.top
+
+class DesignLayout:
+	""" Layout of a design built up one part at a time.
+	"""
+
+	def __init__(self, linewidth=1.0, backbone_pad_left=0.0, backbone_pad_right=0.0):
+		""" Constructor to generate an empty DesignLayout.
+
+		Parameters
+	    ----------
+	    linewidth : float (default=1.0)
+	    	The default linewidth for all part drawing.
+
+	    backbone_pad_left : float (default=0.0)
+	    	Padding to add to the left side of the backbone.
+
+	    backbone_pad_right : float (default=0.0)
+	    	Padding to add to the right side of the backbone.
+		"""
+		self.linewidth = linewidth
+		self.backbone_pad_left = backbone_pad_left
+		self.backbone_pad_right = backbone_pad_right
+		self.parts = []
+		self.arcs = []
+		self.start = 0
+		self.end = 0
+		self.part_map = {}
+
+	def part_direction (self, part_num, part):
+		""" Start and end passed to the renderer of a part (start > end if reverse).
+		"""
+		return self.record_direction(part_num, dnadesign.part_record(part))
+
+	def record_direction (self, part_num, record):
+		""" Start and end passed to the renderer of a part given as a record (see
+		    dnadesign.part_records).
+		"""
+		key, part_type, name, fwd, start, end, opts, extra = record
+		fwd = fwd == True
+		if start == None:
+			if fwd == True:
+				start = part_num
+			else:
+				start = part_num+1
+		if end == None:
+			if fwd == True:
+				end = part_num+1
+			else:
+				end = part_num
+		return start, end
+
+	def add_part (self, part_num, part, extent_start, extent_end, glyph_start=None,
+		          glyph_end=None, fwd=None, y_min=0.0, y_max=0.0):
+		""" Add a part at a known position (e.g., one measured when drawing).
+		"""
+		return self.add_record(part_num, dnadesign.part_record(part), extent_start,
+			                   extent_end, glyph_start, glyph_end, fwd, y_min, y_max)
+
+	def add_record (self, part_num, record, extent_start, extent_end, glyph_start=None,
+		            glyph_end=None, fwd=None, y_min=0.0, y_max=0.0):
+		""" Add a part given as a record (see dnadesign.part_records) at a known
+		    position.
+		"""
+		if glyph_start == None:
+			glyph_start = extent_start
+		if glyph_end == None:
+			glyph_end = extent_end
+		if fwd == None:
+			start, end = self.record_direction(part_num, record)
+			fwd = not (start > end)
+		placed = PartLayout(part_num, record, fwd, extent_start, extent_end, glyph_start,
+			                glyph_end, y_min, y_max)
+		if len(self.parts) == 0:
+			self.start = extent_start
+		self.parts.append(placed)
+		self.part_map[record[0]] = placed
+		self.end = extent_end
+		return placed
+
+	def place_part (self, part_num, part, rule):
+		""" Place a part after the last one using the layout rule of its renderer.
+		"""
+		return self.place_record(part_num, dnadesign.part_record(part), rule)
+
+	def place_record (self, part_num, record, rule):
+		""" Place a part given as a record (see dnadesign.part_records) after the
+		    last one using the layout rule of its renderer.
+		"""
+		opts = record[6]
+		start, end = self.record_direction(part_num, record)
+		fwd = not (start > end)
+		if rule['width'] == 'trace':
+			extent_start = min(start, end)
+			extent_end = max(start, end)
+			y_min, y_max = glyph_y_range(rule, opts, fwd)
+			return self.add_record(part_num, record, extent_start, extent_end, start, end,
+				                   fwd, y_min, y_max)
+		prev_end = self.end
+		width = part_width(rule, opts, self.linewidth)
+		if rule['width'] == 'space':
+			start_pad = 0.0
+			end_pad = 0.0
+		else:
+			start_pad = part_opt(rule, opts, 'start_pad')
+			end_pad = part_opt(rule, opts, 'end_pad')
+		if rule['directional'] == True and fwd == False:
+			glyph_end = prev_end+end_pad
+			glyph_start = glyph_end+width
+			extent_end = glyph_start+start_pad
+		else:
+			glyph_start = prev_end+start_pad
+			glyph_end = glyph_start+width
+			extent_end = glyph_end+end_pad
+		y_min, y_max = glyph_y_range(rule, opts, fwd)
+		return self.add_record(part_num, record, prev_end, extent_end, glyph_start, glyph_end,
+			                   fwd, y_min, y_max)
+
+	def placed_part (self, part, parts=None):
+		""" PartLayout of a part in the design, given as its dict or (with the
+		    design parts) its index (None if it was not placed).
+		"""
+		return self.part_map.get(dnadesign.part_key(parts, part))
+
+	def part_anchor (self, part, drawn_parts=None, parts=None):
+		""" x-position regulation arcs attach to for a part (given as for
+		    placed_part). Parts that were not placed use the start and end of
+		    their drawn copy (if given).
+		"""
+		key = dnadesign.part_key(parts, part)
+		placed = self.part_map.get(key)
+		if placed != None:
+			return placed.anchor
+		if drawn_parts != None and key in drawn_parts:
+			drawn_part = drawn_parts[key]
+			return (drawn_part['start'] + drawn_part['end']) / 2
+		if isinstance(part, dict):
+			name = part.get('name', part.get('type'))
+		else:
+			name = str(part)
+		raise ValueError('Regulation is attached to part %s, which has no layout '
+			             'rule and was not drawn' % name)
+
+	def place_arcs (self, regs, reg_types=None, drawn_parts=None, parts=None):
+		""" Route the regulation arcs between placed parts. Arcs are ordered from
+		    shortest to longest and stacked so that overlapping arcs do not clash.
+
+		Parameters
+	    ----------
+	    regs : list(dict)
+	    	Regulation in the format used by DNARenderer.renderDNA().
+
+	    reg_types : list(string) (default=None)
+	    	Regulation types that are drawn (all if None).
+
+	    drawn_parts : dict(dict) (default=None)
+	    	Copies of the parts as drawn (with their start and end), keyed by
+	    	dnadesign.part_key. Used to attach arcs to parts that were not placed.
+
+	    parts : list(dict) or CompactDesign (default=None)
+	    	The design (needed if regulation refers to parts by their index).
+
+	    Returns
+	    -------
+	    arcs : list(ArcLayout)
+	    	Arcs in the order they should be drawn.
+		"""
+		drawn = []
+		for reg in regs:
+			if 'type' in reg and 'from_part' in reg and 'to_part' in reg:
+				if reg_types == None or reg['type'] in reg_types:
+					arcstart = self.part_anchor(reg['from_part'], drawn_parts, parts)
+					arcend = self.part_anchor(reg['to_part'], drawn_parts, parts)
+					# fwd of the part the arc goes to sets its side of the backbone
+					to_key = dnadesign.part_key(parts, reg['to_part'])
+					if to_key in self.part_map:
+						to_fwd = self.part_map[to_key].given_fwd
+					else:
+						to_fwd = drawn_parts[to_key].get('fwd')
+					drawn.append((math.fabs(arcstart-arcend), arcstart, arcend, reg, to_fwd))
+		# Stable sort keeps the original order of arcs of equal length
+		drawn.sort(key=lambda x: x[0])
+		# Arcs to parts without fwd are drawn above but (as always in renderDNA)
+		# stacked with the arcs below the backbone
+		heights = arc_height_indices([(min(d[1],d[2]), max(d[1],d[2]), d[4] == True)
+			                          for d in drawn])
+		self.arcs = []
+		for i in range(len(drawn)):
+			arclength, arcstart, arcend, reg, to_fwd = drawn[i]
+			from_placed = self.placed_part(reg['from_part'], parts)
+			to_placed = self.placed_part(reg['to_part'], parts)
+			from_index = None
+			to_index = None
+			if from_placed != None:
+				from_index = from_placed.index
+			if to_placed != None:
+				to_index = to_placed.index
+			self.arcs.append(ArcLayout(i, reg, from_index, to_index, arcstart, arcend,
+				                       to_fwd != False, heights[i]))
+		return self.arcs
+
+	def backbone (self):
+		""" x-range of the DNA backbone (including padding).
+		"""
+		return self.start-self.backbone_pad_left, self.end+self.backbone_pad_right
+
+	def bounds (self):
+		""" Bounding box (x_min, y_min, x_max, y_max) of the parts, backbone and
+		    regulation arcs.
+		"""
+		x_min, x_max = self.backbone()
+		y_min = 0.0
+		y_max = 0.0
+		for placed in self.parts:
+			x0, y0, x1, y1 = placed.hitbox()
+			x_min = min(x_min, x0)
+			x_max = max(x_max, x1)
+			y_min = min(y_min, y0)
+			y_max = max(y_max, y1)
+		for arc in self.arcs:
+			y_min = min(y_min, arc.top)
+			y_max = max(y_max, arc.top)
+		return x_min, y_min, x_max, y_max
+
+def layout_design (parts, regs=None, linewidth=1.0, backbone_pad_left=0.0,
+	               backbone_pad_right=0.0, rules=None, reg_types=None):
+	""" Compute the layout of a design without drawing it.
+
+	Parameters
+    ----------
+    parts : list(dict) or CompactDesign
+    	The design in the format used by DNARenderer.renderDNA(). Parts that have
+    	a custom renderer or a type without a layout rule are not placed (and
+    	regulation cannot be attached to them).
+
+    regs : list(dict) (default=None)
+    	Regulation in the format used by DNARenderer.renderDNA().
+
+    linewidth : float (default=1.0)
+    	The default linewidth for all part drawing.
+
+    backbone_pad_left : float (default=0.0)
+    	Padding to add to the left side of the backbone.
+
+    backbone_pad_right : float (default=0.0)
+    	Padding to add to the right side of the backbone.
+
+    rules : dict(dict) (default=None)
+    	Layout rule for each part type (SBOL_LAYOUT_RULES if None).
+
+    reg_types : list(string) (default=None)
+    	Regulation types that are drawn (all if None).
+
+    Returns
+    -------
+    layout : DesignLayout
+    	Positions of the parts and routing of the regulation arcs.
+	"""
+	if rules == None:
+		rules = SBOL_LAYOUT_RULES
+	layout = DesignLayout(linewidth, backbone_pad_left, backbone_pad_right)
+	part_num = 0
+	# Parts are read as records, so no part dicts are built for a CompactDesign
+	for record in dnadesign.part_records(parts):
+		rule = rules.get(record[1])
+		extra = record[7]
+		if rule != None and (extra == None or 'renderer' not in extra):
+			layout.place_record(part_num, record, rule)
+		part_num += 1
+	if regs != None:
+		layout.place_arcs(regs, reg_types, None, parts)
+	return layout
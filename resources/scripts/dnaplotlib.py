@@ -1,2151 +1,3251 @@
-#!/usr/bin/env python
-"""
-dnaplotlib
-==========
-    This module is designed to allow for highly customisable visualisation of DNA
-    fragments. Diagrams can be in the form of conceptual SBOL compliant icons or
-    make use of icons whose width is scaled to allow for easier comparison of part 
-    locations to trace information, such as for corresponding RNA-seq read depth
-    data. All plotting is performed using matplotlib and to an axis object. This 
-    enables the export of publication quality, vector-based figures. Furthermore,
-    all standard renderers can be replaced with user defined versions to allow 
-    for full customisation of the plot.
-
-    To make use of this module it is necessary to create the rendering object 
-    after importing the module:
-
-    >  import dnaplotlib as dpl
-    >  dr = dpl.DNARenderer()
-
-    This object performs all rendering using the renderDNA() method. To describe
-    what should be plotted, dnaplotlib requires the DNA design in a specific 
-    format. For standard SBOL diagrams a design is a list of dictionaries where
-    each dictionary relates to a specific part and as a minimum contains the
-    keys:
-
-    - name: A name that can be potentially used in regulation.
-    - type: The type of part (decides which renderer to use).
-    - fwd: Boolean defing if the part is in a forward orientation.
-
-    Once this list is defined and an axis object is created the design can be
-    draw using standard renders and to a user created matplotlib axes by running:
-
-    > reg_renderers = dr.std_reg_renderers()
-	> part_renderers = dr.SBOL_part_renderers()
-	> regs = None
-	> design = ... Design is created here ...
-	> ax = ... matplotlib axes created here ...
-    > start, end = dr.renderDNA(ax, design, part_renderers, regs, reg_renderers)
-
-    The function returns the start and end point of the design which can then
-    be used for resizing the axes and figure. For more advanced use cases we 
-    advise looking at the gallery distributed with this module.
-"""
-#    dnaplotlib
-#    Copyright (C) 2014 by
-#    Thomas E. Gorochowski <tom@chofski.co.uk>
-#    Emerson Glassey <eglassey@mit.edu>
-#    Bryan Der <bder@mit.edu>
-#    All rights reserved.
-#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
-
-# Set the backend to use (important for headless servers)
-import matplotlib
-matplotlib.use('Agg')
-
-from matplotlib.patches import Polygon, Ellipse, Wedge, Circle, PathPatch
-from matplotlib.path import Path
-from matplotlib.lines import Line2D
-from matplotlib.patheffects import Stroke 
-import math
-
-__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
-               Emerson Glassey <eglassey@mit.edu>, Voigt Lab, MIT\n\
-               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
-__license__ = 'OSI Non-Profit OSL 3.0'
-__version__ = '1.0'
-
-###############################################################################
-# SBOL Compliant Icon Renderers
-###############################################################################
-
-def write_label (ax, label_text, x_pos, opts=None):
-	""" Renders labels on parts.
-	"""
-	label_style = 'normal'
-	label_size = 7
-	label_y_offset = 0
-	label_x_offset = 0
-	if opts != None:
-		if 'label_style' in opts.keys():
-			label_style = opts['label_style']
-		if 'label_size' in opts.keys():
-			label_size = opts['label_size']
-		if 'label_y_offset' in opts.keys():
-			label_y_offset = opts['label_y_offset']
-		if 'label_x_offset' in opts.keys():
-			label_x_offset = opts['label_x_offset']
-	ax.text(x_pos+label_x_offset, label_y_offset, label_text, horizontalalignment='center',
-		    verticalalignment='center', fontsize=label_size, fontstyle=label_style, zorder=30)
-
-def sbol_promoter (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL promoter renderer.
-	"""
-	# Default options
-	color = (0.0,0.0,0.0)
-	start_pad = 2.0
-	end_pad = 2.0
-	y_extent = 10
-	x_extent = 10
-	arrowhead_height = 2
-	arrowhead_length = 4
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'arrowhead_height' in opts.keys():
-			arrowhead_height = opts['arrowhead_height']
-		if 'arrowhead_length' in opts.keys():
-			arrowhead_length = opts['arrowhead_length']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	final_end = end
-	final_start = prev_end
-	if start > end:
-		dir_fac = -1.0
-		start = prev_end+end_pad+x_extent
-		end = prev_end+end_pad
-		final_end = start+start_pad
-	else:
-		start = prev_end+start_pad
-		end = start+x_extent
-		final_end = end+end_pad
-	# Draw the promoter symbol
-	l1 = Line2D([start,start],[0,dir_fac*y_extent], linewidth=linewidth, 
-		        color=color, zorder=9)
-	l2 = Line2D([start,start+dir_fac*x_extent-dir_fac*(arrowhead_length*0.5)],
-                [dir_fac*y_extent,dir_fac*x_extent], linewidth=linewidth, 
-                color=color, zorder=10)
-	ax.add_line(l1)
-	ax.add_line(l2)
-	p1 = Polygon([(start+dir_fac*x_extent-dir_fac*arrowhead_length, 
-		           dir_fac*y_extent+(arrowhead_height)), 
-		          (start+dir_fac*x_extent, dir_fac*y_extent),
-		          (start+dir_fac*x_extent-dir_fac*arrowhead_length, 
-		           dir_fac*y_extent-(arrowhead_height))],
-		          facecolor=color, edgecolor=color, linewidth=linewidth, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0
-	ax.add_patch(p1)
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_cds (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL coding sequence renderer.
-	"""
-	# Default options
-	color = (0.7,0.7,0.7)
-	hatch = ''
-	start_pad = 1.0
-	end_pad = 1.0
-	y_extent = 5
-	x_extent = 30
-	arrowhead_height = 4
-	arrowhead_length = 8
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'hatch' in opts.keys():
-			hatch = opts['hatch']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'arrowhead_height' in opts.keys():
-			arrowhead_height = opts['arrowhead_height']
-		if 'arrowhead_length' in opts.keys():
-			arrowhead_length = opts['arrowhead_length']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	final_end = end
-	final_start = prev_end
-	if start > end:
-		dir_fac = -1.0
-		start = prev_end+end_pad+x_extent
-		end = prev_end+end_pad
-		final_end = start+start_pad
-	else:
-		start = prev_end+start_pad
-		end = start+x_extent
-		final_end = end+end_pad
-	# Draw the CDS symbol
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (end-dir_fac*arrowhead_length, -y_extent),
-		          (end-dir_fac*arrowhead_length, -y_extent-arrowhead_height),
-		          (end, 0),
-		          (end-dir_fac*arrowhead_length, y_extent+arrowhead_height),
-		          (end-dir_fac*arrowhead_length, y_extent)],
-		          edgecolor=(0.0,0.0,0.0), facecolor=color, linewidth=linewidth, 
-		          hatch=hatch, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0
-	ax.add_patch(p1)
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_terminator (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL terminator renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	y_extent = 10.0
-	x_extent = 8.0
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	final_end = end
-	final_start = prev_end
-	if start > end:
-		dir_fac = -1.0
-		start = prev_end+end_pad+x_extent
-		end = prev_end+end_pad
-		final_end = start+start_pad
-	else:
-		start = prev_end+start_pad
-		end = start+x_extent
-		final_end = end+end_pad
-	# Draw the terminator symbol
-	l1 = Line2D([start+dir_fac*(x_extent/2.0),start+dir_fac*(x_extent/2.0)],[0,dir_fac*y_extent], linewidth=linewidth, 
-		        color=color, zorder=8)
-	l2 = Line2D([start,start+(dir_fac*x_extent)],[dir_fac*y_extent,dir_fac*y_extent], 
-		        linewidth=linewidth, color=color, zorder=9)
-	ax.add_line(l1)
-	ax.add_line(l2)
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_rbs (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL ribosome binding site renderer.
-	"""
-	# Default options
-	color = (0.7,0.7,0.7)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 10.0
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	final_end = end
-	final_start = prev_end
-	rbs_center = (0,0)
-	if start > end:
-		start = prev_end+end_pad+x_extent
-		end = prev_end+end_pad
-		final_end = start+start_pad
-		rbs_center = (end+((start-end)/2.0),0)
-		w1 = Wedge(rbs_center, x_extent/2.0, 180, 360, linewidth=linewidth, 
-			       facecolor=color, zorder=8)
-		ax.add_patch(w1)
-	else:
-		start = prev_end+start_pad
-		end = start+x_extent
-		final_end = end+end_pad
-		rbs_center = (start+((end-start)/2.0),0)
-		w1 = Wedge(rbs_center, x_extent/2.0, 0, 180, linewidth=linewidth, 
-			       facecolor=color, zorder=8)
-		ax.add_patch(w1)
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-
-def sbol_ribozyme (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL ribozyme renderer.
-	"""
-	return stick_figure(ax,type,num,start,end,prev_end,scale,linewidth,opts)	
-def sbol_protein_stability (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL protein stability element renderer.
-	"""
-	return stick_figure(ax,type,num,start,end,prev_end,scale,linewidth,opts)	
-def sbol_protease (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL protease site renderer.
-	"""
-	return stick_figure(ax,type,num,start,end,prev_end,scale,linewidth,opts)
-def sbol_ribonuclease (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL ribonuclease site renderer.
-	"""
-	return stick_figure(ax,type,num,start,end,prev_end,scale,linewidth,opts)
-
-def stick_figure (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" General function for drawing stick based parts (e.g., ribozyme and protease sites).
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 5.0
-	y_extent = 10.0
-	linestyle = '-'
-	
-	linetype  = "";
-	shapetype = "";
-	if(type == "Ribozyme"):
-		linetype = 'dash'
-		headgroup = 'O'
-	elif(type == "Protease"):
-		linetype = 'dash'
-		headgroup = 'X'
-	elif(type == "ProteinStability"):
-		linetype = 'solid'
-		headgroup = 'O'
-	elif(type == "Ribonuclease"):
-		linetype = 'solid'
-		headgroup = 'X'
-
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-
-	if start > end:
-		start = prev_end+end_pad+x_extent
-		end = prev_end+end_pad
-		final_end = start+start_pad
-		rbs_center = (end+((start-end)/2.0),-y_extent)
-		c1 = Circle(rbs_center, x_extent/2.0, linewidth=linewidth, edgecolor=color, 
-			        facecolor=(1,1,1), zorder=8)
-		x1 = Line2D([start,end],[-y_extent*1.25,-y_extent/1.5], 
-		        	linewidth=linewidth, color=color, zorder=12, linestyle='-')
-		x2 = Line2D([start,end],[-y_extent/1.5,-y_extent*1.25], 
-		        	linewidth=linewidth, color=color, zorder=12, linestyle='-')
-
-		dash1  = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,-y_extent/4], 
-			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
-		dash2  = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[-y_extent/2,-y_extent+(x_extent/2.0)], 
-			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
-		solidO = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,-y_extent+(x_extent/2.0)], 
-			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
-		solidX = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,-y_extent], 
-			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
-
-		if(headgroup == "O" and linetype == "dash"):
-			ax.add_patch(c1)
-			ax.add_line(dash1)
-			ax.add_line(dash2)
-		elif(headgroup == "X" and linetype == "dash"):
-			ax.add_line(x1)
-			ax.add_line(x2)
-			ax.add_line(dash1)
-			ax.add_line(dash2)
-		elif(headgroup == "O" and linetype == "solid"):
-			ax.add_patch(c1)
-			ax.add_line(solidO)
-		elif(headgroup == "X" and linetype == "solid"):
-			ax.add_line(x1)
-			ax.add_line(x2)
-			ax.add_line(solidX)
-		
-	else:
-		start = prev_end+start_pad
-		end = start+x_extent
-		final_end = end+end_pad
-		rbs_center = (start+((end-start)/2.0),y_extent)
-		c1 = Circle(rbs_center, x_extent/2.0, linewidth=linewidth, edgecolor=color, 
-			        facecolor=(1,1,1), zorder=8)
-		x1 = Line2D([start,end],[y_extent*1.25,y_extent/1.5], 
-		        	linewidth=linewidth, color=color, zorder=12, linestyle='-')
-		x2 = Line2D([start,end],[y_extent/1.5,y_extent*1.25], 
-		        	linewidth=linewidth, color=color, zorder=12, linestyle='-')
-
-		dash1 = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,y_extent/4], 
-			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
-		dash2 = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[y_extent/2,y_extent-(x_extent/2.0)], 
-			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
-		solidO = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,y_extent-(x_extent/2.0)], 
-			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
-		solidX = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,y_extent], 
-			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
-
-		if(headgroup == 'O' and linetype == 'dash'):
-			ax.add_patch(c1)
-			ax.add_line(dash1)
-			ax.add_line(dash2)
-		elif(headgroup == "X" and linetype == "dash"):
-			ax.add_line(x1)
-			ax.add_line(x2)
-			ax.add_line(dash1)
-			ax.add_line(dash2)
-		elif(headgroup == "O" and linetype == "solid"):
-			ax.add_patch(c1)
-			ax.add_line(solidO)
-		elif(headgroup == "X" and linetype == "solid"):
-			ax.add_line(x1)
-			ax.add_line(x2)
-			ax.add_line(solidX)
-	
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-
-def sbol_scar (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL scar renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 6.0
-	y_extent = 1.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-
-	start = prev_end+start_pad
-	end = start+x_extent
-	final_end = end+end_pad
-	
-	l_top    = Line2D([start,start+x_extent],[y_extent,y_extent], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l_bottom = Line2D([start,start+x_extent],[-1*y_extent,-1*y_extent], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	#white rectangle overlays backbone line
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (start+x_extent, -y_extent),
-		          (start+x_extent, y_extent)],
-		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)
-
-	ax.add_patch(p1)
-	ax.add_line(l_top)
-	ax.add_line(l_bottom)
-
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_empty_space (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in empty space renderer.
-	"""
-	# Default options
-	x_extent = 12.0
-	# Reset defaults if provided
-	if opts != None:
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-	# Check direction add start padding
-	final_start = prev_end
-	final_end = final_start+x_extent
-
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-
-def sbol_5_overhang (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL 5' overhang renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 0.0
-	end_pad = 2.0
-	x_extent = 6.0
-	y_extent = 1.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-
-	start = prev_end+start_pad
-	end = start+x_extent
-	final_end = end+end_pad
-	
-	l_top    = Line2D([start,start+x_extent],[y_extent,y_extent], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l_bottom = Line2D([start+(x_extent/2.0),start+x_extent],[-1*y_extent,-1*y_extent], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	#white rectangle overlays backbone line
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (start+x_extent, -y_extent),
-		          (start+x_extent, y_extent)],
-		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-
-	ax.add_patch(p1)
-	ax.add_line(l_top)
-	ax.add_line(l_bottom)
-
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_3_overhang (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL 3' overhang renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 0.0
-	x_extent = 6.0
-	y_extent = 1.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-
-	start = prev_end+start_pad
-	end = start+x_extent
-	final_end = end+end_pad
-	
-	l_top    = Line2D([start,start+x_extent],[y_extent,y_extent], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l_bottom = Line2D([start,start+(x_extent/2.0)],[-1*y_extent,-1*y_extent], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	#white rectangle overlays backbone line
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (start+x_extent, -y_extent),
-		          (start+x_extent, y_extent)],
-		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-
-	ax.add_patch(p1)
-	ax.add_line(l_top)
-	ax.add_line(l_bottom)
-
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_blunt_restriction_site (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL blunt-end restriction site renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	y_extent = 4.0
-	x_extent = 1.5
-	site_space = 1.5
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'site_space' in opts.keys():
-			site_space = opts['site_space']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	
-	# Direction is meaningless for this part => start is always < end
-	if start > end:
-		temp_end = end
-		end = start
-		start = temp_end
-
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-	start = prev_end+start_pad
-	end = start+x_extent+site_space+x_extent
-	final_end = end+end_pad
-	
-	l1        = Line2D([start+x_extent,start+x_extent],[-y_extent,y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l1_top    = Line2D([start,start+x_extent],[y_extent,y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l1_bottom = Line2D([start,start+x_extent],[-y_extent,-y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-
-	l2        = Line2D([end-x_extent,end-x_extent],[-y_extent,y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l2_top    = Line2D([end,end-x_extent],[y_extent,y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l2_bottom = Line2D([end,end-x_extent],[-y_extent,-y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	
-	ax.add_line(l1)
-	ax.add_line(l1_top)
-	ax.add_line(l1_bottom)
-	ax.add_line(l2)
-	ax.add_line(l2_top)
-	ax.add_line(l2_bottom)
-
-	if opts != None and 'label' in opts.keys():
-		write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	return final_start, final_end
-
-def sbol_primer_binding_site (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL primer binding site renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	y_extent = 2.0
-	y_offset = 1.5
-	x_extent = 8.0
-	arrowhead_length = 2.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'y_offset' in opts.keys():
-			y_offset = opts['y_offset']
-		if 'arrowhead_length' in opts.keys():
-			arrowhead_length = opts['arrowhead_length']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	
-	direction = 'F'
-	if start > end:
-		direction = 'R'
-		temp_end = end
-		end = start
-		start = temp_end
-
-	final_end = prev_end
-	final_start = prev_end
-
-	if direction == 'F':
-		final_start = prev_end
-		start = prev_end+start_pad
-		end = start+x_extent
-		final_end = end+end_pad
-	else:
-		final_start = prev_end
-		end = prev_end+end_pad
-		start = end+x_extent
-		final_start = start+start_pad
-
-	if direction == 'F':
-		verts = [(start, y_offset), (end, y_offset), (end-arrowhead_length, y_offset+y_extent)]
-		codes = [Path.MOVETO, Path.LINETO, Path.LINETO]
-		path = Path(verts, codes)
-		patch = PathPatch(path, lw=linewidth, edgecolor=color, facecolor=(1,1,1))
-		ax.add_patch(patch)
-	else:
-		verts = [(start, -y_offset), (end, -y_offset), (end+arrowhead_length, -y_offset-y_extent)]
-		codes = [Path.MOVETO, Path.LINETO, Path.LINETO]
-		path = Path(verts, codes)
-		patch = PathPatch(path, lw=linewidth, edgecolor=color, facecolor=(1,1,1))
-		ax.add_patch(patch)
-
-	if opts != None and 'label' in opts.keys():
-		if start > end:
-			write_label(ax, opts['label'], end+((start-end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], start+((end-start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_5_sticky_restriction_site  (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL 5' sticky-end restriction site renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	y_extent = 4.0
-	x_extent = 8.0
-	end_space = 1.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'end_space' in opts.keys():
-			end_space = opts['end_space']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	
-	# Direction is meaningless for this part => start is always < end
-	if start > end:
-		temp_end = end
-		end = start
-		start = temp_end
-
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-	start = prev_end+start_pad
-	end = start+end_space+x_extent+end_space
-	final_end = end+end_pad
-	
-	l1        = Line2D([start+end_space,start+end_space+x_extent],[0,0], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l1_top    = Line2D([start+end_space,start+end_space],[0,y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l1_bottom = Line2D([start+end_space+x_extent,start+end_space+x_extent],[0,-y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	ax.add_line(l1)
-	ax.add_line(l1_top)
-	ax.add_line(l1_bottom)
-
-	# White rectangle overlays backbone line
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (end, -y_extent),
-		          (end, y_extent)],
-		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-
-	ax.add_patch(p1)
-
-	if opts != None and 'label' in opts.keys():
-		write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	return final_start, final_end
-
-def sbol_3_sticky_restriction_site  (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL 3' sticky-end restriction site renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	y_extent = 4.0
-	x_extent = 8.0
-	end_space = 1.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'end_space' in opts.keys():
-			end_space = opts['end_space']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	
-	# Direction is meaningless for this part => start is always < end
-	if start > end:
-		temp_end = end
-		end = start
-		start = temp_end
-
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-	start = prev_end+start_pad
-	end = start+end_space+x_extent+end_space
-	final_end = end+end_pad
-	
-	l1        = Line2D([start+end_space,start+end_space+x_extent],[0,0], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l1_top    = Line2D([start+end_space+x_extent,start+end_space+x_extent],[0,y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l1_bottom = Line2D([start+end_space,start+end_space],[0,-y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	ax.add_line(l1)
-	ax.add_line(l1_top)
-	ax.add_line(l1_bottom)
-
-	# White rectangle overlays backbone line
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (end, -y_extent),
-		          (end, y_extent)],
-		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-
-	ax.add_patch(p1)
-
-	if opts != None and 'label' in opts.keys():
-		write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	return final_start, final_end
-
-def sbol_user_defined  (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL user-defined element renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 12.0
-	y_extent = 3.0
-	linestyle = '-'
-	fill_color = (1,1,1)
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'fill_color' in opts.keys():
-			fill_color = opts['fill_color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-
-	start = prev_end+start_pad
-	end = start+x_extent
-	final_end = end+end_pad
-	
-	#white rectangle overlays backbone line
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (start+x_extent, -y_extent),
-		          (start+x_extent, y_extent)],
-		          edgecolor=(0.0,0.0,0.0), facecolor=color, linewidth=linewidth, zorder=11, 
-		          #edgecolor=color, facecolor=fill_color, linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-
-	ax.add_patch(p1)
-	
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_signature  (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL signature renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 12.0
-	y_extent = 3.0
-	linestyle = '-'
-	fill_color = (1,1,1)
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'fill_color' in opts.keys():
-			fill_color = opts['fill_color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	
-	direction = 'F'
-	if start > end:
-		direction = 'R'
-		temp_end = end
-		end = start
-		start = temp_end
-
-	final_end = prev_end
-	final_start = prev_end
-
-	if direction == 'F':
-		final_start = prev_end
-		start = prev_end+start_pad
-		end = start+x_extent
-		final_end = end+end_pad
-	else:
-		final_start = prev_end
-		end = prev_end+end_pad
-		start = end+x_extent
-		final_start = start+start_pad
-
-	indent_fac = (y_extent*2.0)*0.3
-	cross_width = (y_extent*2.0)*0.7
-
-	if direction == 'F':
-		p1 = Polygon([(start, y_extent), 
-			          (start, -y_extent),
-			          (start+x_extent, -y_extent),
-			          (start+x_extent, y_extent)],
-			          edgecolor=color, facecolor=fill_color, linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-		ax.add_patch(p1)
-		top1x = start + indent_fac
-		top1y = y_extent - indent_fac
-		top2x = start + cross_width
-		top2y = y_extent - indent_fac
-		bot1x = start + indent_fac
-		bot1y = -y_extent + indent_fac
-		bot2x = start + cross_width
-		bot2y = -y_extent + indent_fac
-		lcross1 = Line2D([top1x,bot2x],[top1y,bot2y], 
-		                  linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-		lcross2 = Line2D([top2x,bot1x],[top2y,bot1y], 
-		                  linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-		ax.add_line(lcross1)
-		ax.add_line(lcross2)
-		lsign = Line2D([bot2x+indent_fac,end-indent_fac],[-y_extent+indent_fac,-y_extent+indent_fac], 
-		               linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-		ax.add_line(lsign)
-	else:
-		p1 = Polygon([(start, y_extent), 
-			          (start, -y_extent),
-			          (start-x_extent, -y_extent),
-			          (start-x_extent, y_extent)],
-			          edgecolor=color, facecolor=fill_color, linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)
-		ax.add_patch(p1)
-		top1x = start - indent_fac
-		top1y = y_extent - indent_fac
-		top2x = start - cross_width
-		top2y = y_extent - indent_fac
-		bot1x = start - indent_fac
-		bot1y = -y_extent + indent_fac
-		bot2x = start - cross_width
-		bot2y = -y_extent + indent_fac
-		lcross1 = Line2D([top1x,bot2x],[top1y,bot2y], 
-		                  linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-		lcross2 = Line2D([top2x,bot1x],[top2y,bot1y], 
-		                  linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-		ax.add_line(lcross1)
-		ax.add_line(lcross2)
-		lsign = Line2D([bot2x-indent_fac,end+indent_fac],[y_extent-indent_fac,y_extent-indent_fac], 
-		               linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-		ax.add_line(lsign)
-
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_restriction_site (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL restriction site renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	y_extent = 4.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-
-	start = prev_end+start_pad
-	end = start + linewidth
-	final_end = end+end_pad
-	
-	l1    = Line2D([start,start],[-y_extent,y_extent], 
-		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	ax.add_line(l1)
-
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-
-def sbol_spacer (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL spacer renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 6.0
-	y_extent = 6.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-	
-	start = prev_end+start_pad
-	end = start+x_extent
-	final_end = end+end_pad
-	rbs_center = (start+((end-start)/2.0),0)
-	center_x = start+(end-start)/2.0
-	radius = x_extent/2
-
-	delta = radius - 0.5 * radius * math.sqrt(2)
-
-	l1 = Line2D([start+delta,end-delta],[radius-delta,-1*radius+delta], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	l2 = Line2D([start+delta,end-delta],[-1*radius+delta,radius-delta], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	c1 = Circle(rbs_center, x_extent/2.0, linewidth=linewidth, edgecolor=color, 
-		        facecolor=(1,1,1), zorder=12)
-	
-	ax.add_patch(c1)
-	ax.add_line(l1)
-	ax.add_line(l2)
-
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-
-def sbol_origin (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL origin renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 10.0
-	y_extent = 10.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-	
-	start = prev_end+start_pad
-	end = start+x_extent
-	final_end = end+end_pad
-	ori_center = (start+((end-start)/2.0),0)
-	
-	c1 = Circle(ori_center, x_extent/2.0, linewidth=linewidth, edgecolor=color, 
-		        facecolor=(1,1,1), zorder=12)
-	
-	ax.add_patch(c1)
-	
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_operator (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL operator renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 6.0
-	y_extent = 3.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-
-	start = prev_end+start_pad
-	end = start+x_extent
-	final_end = end+end_pad
-	
-	#white rectangle overlays backbone line
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (start+x_extent, -y_extent),
-		          (start+x_extent, y_extent)],
-		          edgecolor=(0,0,0), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-
-	ax.add_patch(p1)
-	
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-def sbol_insulator (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	""" Built-in SBOL insulator renderer.
-	"""
-	# Default options
-	color = (0,0,0)
-	start_pad = 2.0
-	end_pad = 2.0
-	x_extent = 8.0
-	y_extent = 4.0
-	linestyle = '-'
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	
-	# Check direction add start padding
-	final_end = end
-	final_start = prev_end
-	start = prev_end+start_pad
-	end = start+x_extent
-	final_end = end+end_pad
-	
-	#white rectangle overlays backbone line
-	p1 = Polygon([(start, y_extent), 
-		          (start, -y_extent),
-		          (start+x_extent, -y_extent),
-		          (start+x_extent, y_extent)],
-		          edgecolor=(0,0,0), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-
-	bits = 5.0
-	gap_size = ((end-start)/bits)
-	x_inset_start = start + gap_size
-	x_inset_end = start + ((bits-1.0)*gap_size)
-
-	# Inside rectangle
-	p2 = Polygon([(x_inset_start,  y_extent-gap_size), 
-		          (x_inset_start, -y_extent+gap_size),
-		          (x_inset_end, -y_extent+gap_size),
-		          (x_inset_end,  y_extent-gap_size)],
-		          edgecolor=(0,0,0), facecolor=(1,1,1), linewidth=linewidth, zorder=12, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)		
-
-	ax.add_patch(p1)
-	ax.add_patch(p2)
-	
-	if opts != None and 'label' in opts.keys():
-		if final_start > final_end:
-			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-# Not used at present
-def temporary_repressor (ax, type, num, start, end, prev_end, scale, linewidth, opts):
-	# Default options
-	color = (0.7,0.7,0.7)
-	start_pad = 2.0
-	end_pad = 2.0
-	y_extent = 10
-	x_extent = 10
-	arrowhead_height = 2
-	arrowhead_length = 4
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'start_pad' in opts.keys():
-			start_pad = opts['start_pad']
-		if 'end_pad' in opts.keys():
-			end_pad = opts['end_pad']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'arrowhead_height' in opts.keys():
-			arrowhead_height = opts['arrowhead_height']
-		if 'arrowhead_length' in opts.keys():
-			arrowhead_length = opts['arrowhead_length']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	final_end = end
-	final_start = prev_end
-	if start > end:
-		dir_fac = -1.0
-		start = prev_end+end_pad+x_extent
-		end = prev_end+end_pad
-		final_end = start+start_pad
-	else:
-		start = prev_end+start_pad
-		end = start+x_extent
-		final_end = end+end_pad
-	
-	e1center = (start+((end-start)/2.0),0)
-	e2center = (start+((end-start)/2.0)+x_extent/3.75,0)
-
-	e1 = Ellipse(e1center, y_extent/2, y_extent, edgecolor=(0,0,0), facecolor=color, 
-				linewidth=linewidth, fill=True, zorder=12)
-	e2 = Ellipse(e2center, y_extent/2, y_extent, edgecolor=(0,0,0), facecolor=color, 
-				linewidth=linewidth, fill=True, zorder=11)
-
-	ax.add_patch(e1)
-	ax.add_patch(e2)
-
-	if final_start > final_end:
-		return prev_end, final_start
-	else:
-		return prev_end, final_end
-
-###############################################################################
-# Regulation renderers
-###############################################################################
-
-def repress (ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts):
-	""" Standard repression regulation renderer.
-	"""
-	regulation(ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts)
-
-def induce (ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts):
-	""" Standard induction regulation renderer.
-	"""
-	regulation(ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts)
-
-def regulation (ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts):
-	""" General function for drawing regulation arcs.
-	"""
-
-	color = (0.0,0.0,0.0)
-	arrowhead_length = 4
-	linestyle = '-'
-	
-	#Warning: change these to params instead of hard-coded numbers
-	arcHeight = 15 + arc_height_index*5
-	startHeight = 10
-	
-	# Reset defaults if provided
-	if opts != None:
-		if 'arrowhead_length' in opts.keys():
-			arrowhead_length = opts['arrowhead_length']
-		if 'linestyle' in opts.keys():
-			linestyle = opts['linestyle']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'color' in opts.keys():
-			color = opts['color']
-	
-	start = (from_part['start'] + from_part['end']) / 2
-	end   = (to_part['start']   + to_part['end']) / 2
-
-	top = arcHeight;
-	base = startHeight;
-	indHeight = arrowhead_length
-	
-	if(to_part['fwd'] == False):
-		base = -1*startHeight
-		top  = -1*arcHeight
-		indHeight = -1*arrowhead_length
-
-	line_away   = Line2D([start,start],[base/1.2,top], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	line_across = Line2D([start,end],[top,top], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	line_toward = Line2D([end,end],[top,base*1.5], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
-	line_rep    = Line2D([end-arrowhead_length,end+arrowhead_length],[base*1.5,base*1.5], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle='-')
-	line_ind1   = Line2D([end-arrowhead_length,end],[base*1.5+indHeight,base*1.5], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle='-')
-	line_ind2    = Line2D([end+arrowhead_length,end],[base*1.5+indHeight,base*1.5], 
-		        linewidth=linewidth, color=color, zorder=12, linestyle='-')
-
-	ax.add_line(line_away)
-	ax.add_line(line_across)
-	ax.add_line(line_toward)
-
-	if(type == 'Repression'):
-		ax.add_line(line_rep)
-
-	if(type == 'Activation'):
-		ax.add_line(line_ind1)
-		ax.add_line(line_ind2)
-
-###############################################################################
-# Trace Icon Renderers (icon width corrisponds to trace data)
-###############################################################################
-
-def trace_promoter (ax, type, num, start_bp, end_bp, prev_end, scale, linewidth, opts):
-	""" Built-in trace-based promoter renderer.
-	"""
-	# Default options
-	color = (0.0,0.0,1.0)
-	y_extent = 6
-	x_extent = 30
-	arrowhead_height = 0.5
-	arrowhead_length = 15
-	highlight_y_extent = 0.8
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'arrowhead_height' in opts.keys():
-			arrowhead_height = opts['arrowhead_height']
-		if 'arrowhead_length' in opts.keys():
-			arrowhead_length = opts['arrowhead_length']
-		if 'highlight_y_extent' in opts.keys():
-			highlight_y_extent = opts['highlight_y_extent']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	if start_bp > end_bp:
-		dir_fac = -1.0
-	# Draw the promoter symbol
-	l1 = Line2D([start_bp,start_bp],[0,dir_fac*y_extent], linewidth=linewidth, 
-		        color=color, zorder=14)
-	l2 = Line2D([start_bp,start_bp+dir_fac*x_extent*scale-dir_fac*arrowhead_length*0.5*scale],
-                [dir_fac*y_extent,dir_fac*y_extent], linewidth=linewidth, 
-                color=color, zorder=14)
-	ax.add_line(l1)
-	ax.add_line(l2)
-	p1 = Polygon([(start_bp+dir_fac*x_extent*scale-dir_fac*arrowhead_length*scale, 
-		           dir_fac*y_extent+(arrowhead_height)), 
-		          (start_bp+dir_fac*(x_extent*scale), dir_fac*y_extent),
-		          (start_bp+dir_fac*x_extent*scale-dir_fac*arrowhead_length*scale, 
-		           dir_fac*y_extent-(arrowhead_height))],
-		          facecolor=color, edgecolor=color, linewidth=linewidth, zorder=14, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)
-	ax.add_patch(p1)
-	# Shade the promoter area (normally smaller than symbol extent)
- 	p2 = Polygon([(start_bp, -highlight_y_extent), 
- 		          (start_bp, highlight_y_extent),
- 		          (end_bp, highlight_y_extent),
- 		          (end_bp, -highlight_y_extent)], facecolor=color, edgecolor=color, linewidth=linewidth, zorder=14, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)
-	ax.add_patch(p2)
-	if opts != None and 'label' in opts.keys():
-		if start_bp > end_bp:
-			write_label(ax, opts['label'], end_bp+((start_bp-end_bp)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], start_bp+((end_bp-start_bp)/2.0), opts=opts)
-	if start_bp > end_bp:
-		return end_bp, start_bp
-	else:
-		return start_bp, end_bp
-
-def trace_rbs (ax, type, num, start_bp, end_bp, prev_end, scale, linewidth, opts):
-	""" Built-in trace-based ribosome binding site renderer.
-	"""
-	# Default options
-	color = (0.16,0.68,0.15)
-	y_extent = 3.5
-	x_extent = 10
-	highlight_y_extent = 0.8
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'highlight_y_extent' in opts.keys():
-			highlight_y_extent = opts['highlight_y_extent']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	if start_bp > end_bp:
-		dir_fac = -1.0
-	# Draw the RBS symbol
-	l1 = Line2D([start_bp,start_bp],[0,dir_fac*y_extent], linewidth=linewidth, color=color, zorder=14)
-	ax.add_line(l1)
-	c1 = Ellipse((start_bp,dir_fac*y_extent),width=(x_extent*scale),height=y_extent*0.4,color=color, zorder=14)
-	ax.add_artist(c1)
- 	# Shade the promoter area (normally smaller than symbol extent)
- 	p2 = Polygon([(start_bp, -highlight_y_extent), 
- 		          (start_bp, highlight_y_extent),
- 		          (end_bp, highlight_y_extent),
- 		          (end_bp, -highlight_y_extent)], facecolor=color, edgecolor=color, linewidth=linewidth, zorder=13, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)
-	ax.add_patch(p2)
-	if opts != None and 'label' in opts.keys():
-		if start_bp > end_bp:
-			write_label(ax, opts['label'], end_bp+((start_bp-end_bp)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], start_bp+((end_bp-start_bp)/2.0), opts=opts)
-	if start_bp > end_bp:
-		return end_bp, start_bp
-	else:
-		return start_bp, end_bp
-
-def trace_cds (ax, type, num, start_bp, end_bp, prev_end, scale, linewidth, opts):
-	""" Built-in trace-based coding sequence renderer.
-	"""
-	# Default options
-	color = (0.7,0.7,0.7)
-	hatch = ''
-	y_extent = 1.5
-	arrowhead_height = 1
-	arrowhead_length = 30
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'hatch' in opts.keys():
-			hatch = opts['hatch']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'arrowhead_height' in opts.keys():
-			arrowhead_height = opts['arrowhead_height']
-		if 'arrowhead_length' in opts.keys():
-			arrowhead_length = opts['arrowhead_length']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	if start_bp > end_bp:
-		dir_fac = -1.0
-	# Draw the CDS symbol
-	p1 = Polygon([(start_bp, y_extent), 
-		          (start_bp, -y_extent),
-		          (end_bp-dir_fac*arrowhead_length*scale, -y_extent),
-		          (end_bp-dir_fac*arrowhead_length*scale, -y_extent-arrowhead_height),
-		          (end_bp, 0),
-		          (end_bp-dir_fac*arrowhead_length*scale, y_extent+arrowhead_height),
-		          (end_bp-dir_fac*arrowhead_length*scale, y_extent)],
-		          edgecolor=(0.0,0.0,0.0), facecolor=color, linewidth=linewidth, 
-		          hatch=hatch, zorder=15, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)
-	ax.add_patch(p1)
-	if opts != None and 'label' in opts.keys():
-		if start_bp > end_bp:
-			write_label(ax, opts['label'], end_bp+((start_bp-end_bp)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], start_bp+((end_bp-start_bp)/2.0), opts=opts)
-	if start_bp > end_bp:
-		return end_bp, start_bp
-	else:
-		return start_bp, end_bp
-
-def trace_terminator (ax, type, num, start_bp, end_bp, prev_end, scale, linewidth, opts):
-	""" Built-in trace-based terminator renderer.
-	"""
-	# Default options
-	color = (1.0,0.0,0.0)
-	y_extent = 3.5
-	x_extent = 10
-	highlight_y_extent = 0.8
-	# Reset defaults if provided
-	if opts != None:
-		if 'color' in opts.keys():
-			color = opts['color']
-		if 'y_extent' in opts.keys():
-			y_extent = opts['y_extent']
-		if 'x_extent' in opts.keys():
-			x_extent = opts['x_extent']
-		if 'highlight_y_extent' in opts.keys():
-			highlight_y_extent = opts['highlight_y_extent']
-		if 'linewidth' in opts.keys():
-			linewidth = opts['linewidth']
-		if 'scale' in opts.keys():
-			scale = opts['scale']
-	# Check direction add start padding
-	dir_fac = 1.0
-	if start_bp > end_bp:
-		dir_fac = -1.0
-	# Draw the terminator symbol
-	l1 = Line2D([start_bp,start_bp],[0,dir_fac*y_extent], linewidth=linewidth, color=color, zorder=8)
-	l2 = Line2D([start_bp-(x_extent*scale),start_bp+(x_extent*scale)],[dir_fac*y_extent,dir_fac*y_extent], linewidth=linewidth, color=color, zorder=14)
-	ax.add_line(l1)
-	ax.add_line(l2)
-	# Shade the terminator area (normally smaller than symbol extent)
- 	p2 = Polygon([(start_bp, -highlight_y_extent), 
- 		          (start_bp, highlight_y_extent),
- 		          (end_bp, highlight_y_extent),
- 		          (end_bp, -highlight_y_extent)], facecolor=color, edgecolor=color, linewidth=linewidth, zorder=13, 
-		          path_effects=[Stroke(joinstyle="miter")]) # This is a work around for matplotlib < 1.4.0)
-	ax.add_patch(p2)
-	if opts != None and 'label' in opts.keys():
-		if start_bp > end_bp:
-			write_label(ax, opts['label'], end_bp+((start_bp-end_bp)/2.0), opts=opts)
-		else:
-			write_label(ax, opts['label'], start_bp+((end_bp-start_bp)/2.0), opts=opts)
-	if start_bp > end_bp:
-		return end_bp, start_bp
-	else:
-		return start_bp, end_bp
-
-###############################################################################
-# The DNA renderer
-###############################################################################
-
-class DNARenderer:
-	""" Class defining the DNA rendering funtionality.
-	"""
-
-	# Standard part types
-	STD_PART_TYPES = ['Promoter',
-	                  'CDS',
-                      'Terminator',
-                      'RBS',
-                      'Scar',
-                      'Spacer',
-                      'Ribozyme',
-                      'Ribonuclease',
-                      'ProteinStability',
-                      'Protease',
-                      'Operator',
-                      'Origin',
-                      'Insulator']
-
-	# Standard regulatory types
-	STD_REG_TYPES = ['Repression',
-	                 'Activation']
-
-	def __init__(self, scale=1.0, linewidth=1.0, 
-		         backbone_pad_left=0.0, backbone_pad_right=0.0):
-		""" Constructor to generate an empty DNARenderer.
-
-		Parameters
-	    ----------
-	    scale : float (default=1.0)
-	        A scaling factor for the plot. Only used if rendering traces.
-
-	    linewidth : float (default=1.0)
-	    	The default linewidth for all part drawing.
-
-	    backbone_pad_left : float (default=0.0)
-	    	Padding to add to the left side of the backbone.
-
-	    backbone_pad_right : float (default=0.0)
-	    	Padding to add to the left side of the backbone.
-		"""
-		self.scale = scale
-		self.linewidth = linewidth
-		self.backbone_pad_left = backbone_pad_left
-		self.backbone_pad_right = backbone_pad_right
-		self.reg_height = 15
-
-	def SBOL_part_renderers (self):
-		""" Return dictionary of all standard built-in SBOL part renderers.
-		"""
-		return {
-			'Promoter'         :sbol_promoter, 
-			'CDS'              :sbol_cds, 
-			'Terminator'       :sbol_terminator,
-			'RBS'              :sbol_rbs,
-			'Scar'             :sbol_scar,
-			'Spacer'	       :sbol_spacer,
-			'EmptySpace'	   :sbol_empty_space,
-			'Ribozyme'         :sbol_ribozyme,
-			'Ribonuclease'     :sbol_ribonuclease,
-			'ProteinStability' :sbol_protein_stability,
-			'Protease'         :sbol_protease,
-			'Operator'         :sbol_operator,
-			'Origin'           :sbol_origin,
-			'Insulator'        :sbol_insulator,
-			'5Overhang'        :sbol_5_overhang,
-			'3Overhang'        :sbol_3_overhang,
-			'RestrictionSite'  :sbol_restriction_site,
-			'BluntRestrictionSite'   :sbol_blunt_restriction_site,
-			'PrimerBindingSite'      :sbol_primer_binding_site,
-			'5StickyRestrictionSite' :sbol_5_sticky_restriction_site,
-			'3StickyRestrictionSite' :sbol_3_sticky_restriction_site,
-			'UserDefined'      :sbol_user_defined,
-			'Signature'        :sbol_signature}
-
-	def trace_part_renderers (self):
-		""" Return dictionary of all standard built-in trace part renderers.
-		"""
-		return {
-			'Promoter'         :trace_promoter, 
-			'CDS'              :trace_cds, 
-			'Terminator'       :trace_terminator,
-			'RBS'              :trace_rbs} 
-
-	def std_reg_renderers (self):
-		""" Return dictionary of all standard built-in regulation renderers.
-		"""
-		return {
-			'Repression' :repress, 
-			'Activation' :induce}
-
-	def renderDNA(self, ax, parts, part_renderers, regs=None, reg_renderers=None):
-		""" Render the parts on the DNA and regulation.
-
-		Parameters
-	    ----------
-	    ax : matplotlib.axes
-	        Axes to draw the design to.
-
-	    parts : list(dict)
-	    	The design to draw. This is a list of dicts, where each dict relates to
-	    	a part and must contain the following keys:
-	    	- name (string)
-	    	- type (string)  
-	    	- fwd (bool)
-	    	These will then be drawn in accordance with the renders selected
-
-	    part_renderers : dict(functions)
-	    	Dict of functions where the key in the part type and the dictionary returns
-	    	the function to be used to draw that part type.
-
-	    regs : list(dict) (default=None)
-	    	Regulation present in the design. This is a list of dicts, where each dict
-	    	relates to a single regulation arc and must contain the following keys:
-	    	- type (string)
-	    	- from_part (int)  
-	    	- to_part (int)
-	    	These will then be drawn in accordance with the renders selected.
-
-	    reg_renderers : dict(functions) (default=None)
-	    	Dict of functions where the key in the regulation type and the dictionary 
-	    	returns the function to be used to draw that regulation type.
-
-	    Returns
-	    -------
-	    start : float
-	    	The x-point in the axis space that drawing begins.
-
-	    end : float
-	    	The x-point in the axis space that drawing ends.
-		"""
-		# Update the matplotlib rendering default for drawing the parts (we want mitered edges)
-		matplotlib.rcParams['lines.dash_joinstyle']  = 'miter'
-		matplotlib.rcParams['lines.dash_capstyle']   = 'butt'
-		matplotlib.rcParams['lines.solid_joinstyle'] = 'miter'
-		matplotlib.rcParams['lines.solid_capstyle']  = 'projecting'
-		# Plot the parts to the axis
-		part_num = 0
-		prev_end = 0
-		first_start = 0
-		first_part = True
-		for part in parts:
-			keys = part.keys()
-			# Check the part has minimal details required
-			if 'type' in keys:
-				if 'fwd' not in keys:
-					part['fwd'] = 'True'
-				if 'start' not in keys:
-					if part['fwd'] == True:
-						part['start'] = part_num
-					else:
-						part['start'] = part_num+1
-				if 'end' not in keys:
-					if part['fwd'] == True:
-						part['end'] = part_num+1
-					else:
-						part['end'] = part_num
-				# Extract custom part options (if available)
-				part_opts = None
-				if 'opts' in part.keys():
-					part_opts = part['opts']
-				# Use the correct renderer
-				if 'renderer' in part.keys():
-					# Use custom renderer
-					prev_start, prev_end = part['renderer'](ax, part['type'], part_num, 
-						             part['start'], part['end'], prev_end,
-						             self.scale, self.linewidth, 
-						             opts=part_opts)
-
-					#update start,end for regulation
-					part['start'] = prev_start
-					part['end'] = prev_end
-
-					if first_part == True:
-						first_start = prev_start
-						first_part = False
-				else:
-					# Use standard renderer, if one exists
-					if part['type'] in part_renderers.keys():
-						prev_start, prev_end = part_renderers[part['type']](ax, 
-							           part['type'], part_num, 
-							           part['start'], part['end'], 
-							           prev_end, self.scale, 
-							           self.linewidth, opts=part_opts)
-						
-						#update start,end for regulation
-						part['start'] = prev_start
-						part['end'] = prev_end
-						
-						if first_part == True:
-							first_start = prev_start
-							first_part = False
-			part_num += 1
-		
-		# first pass to get all of the arcranges
-		if regs != None:
-
-			for reg in regs:
-				keys = reg.keys()
-
-				# Check the part has minimal details required
-				if 'type' in keys and 'from_part' in keys and 'to_part' in keys:
-					# Extract custom part options (if available)
-
-					reg_opts = None
-					if 'opts' in reg.keys():
-						reg_opts = reg['opts']
-					
-					if reg['type'] in reg_renderers.keys():
-						
-						##############################################################################
-						arcstart = (reg['from_part']['start'] + reg['from_part']['end']) / 2
-						arcend   = (reg['to_part']['start']   + reg['to_part']['end']) / 2
-						arcrange = [arcstart,arcend]
-						reg['arclength'] = math.fabs(arcstart-arcend)
-						reg['arc_height_index'] = 1
-						##############################################################################
-
-			#sort regs by arc ranges from shortest to longest
-			regs.sort(key=lambda x: x['arclength'], reverse=False)
-
-			reg_num = 0
-			pos_arc_ranges = [] # arc above DNA backbone if to_part is fwd
-			neg_arc_ranges = [] # arc below DNA backbone if to_part is reverse
-			current_max = 1
-
-			# second pass to render all the arcs
-			for reg in regs:
-				keys = reg.keys()
-
-				# Check the part has minimal details required
-				if 'type' in keys and 'from_part' in keys and 'to_part' in keys:
-					# Extract custom part options (if available)
-
-					reg_opts = None
-					if 'opts' in reg.keys():
-						reg_opts = reg['opts']
-					
-					if reg['type'] in reg_renderers.keys():
-						
-						##############################################################################
-						# arc height algorithm: greedy from left-to-right on DNA design
-						
-						arcstart = (reg['from_part']['start'] + reg['from_part']['end']) / 2
-						arcend   = (reg['to_part']['start']   + reg['to_part']['end']) / 2
-						
-						arcmin = min(arcstart,arcend)
-						arcmax = max(arcstart,arcend)
-						arcrange = [arcmin,arcmax,reg['arc_height_index']]
-						arc_height_index = 1
-						
-						# arc above if to_part is fwd
-						if(reg['to_part']['fwd'] == True):
-							# find max arc height index of ONLY the prior arcs that clash with the current arc
-							current_max = 1
-							for r in pos_arc_ranges:
-								if  (arcrange[0] >= r[0] and arcrange[0] <= r[1]):
-									if(r[2] > current_max):
-										current_max = r[2]
-								elif(arcrange[0] >= r[1] and arcrange[0] <= r[0]):
-									if(r[2] > current_max):
-										current_max = r[2]
-								elif(arcrange[1] >= r[0] and arcrange[0] <= r[1]):
-									if(r[2] > current_max):
-										current_max = r[2]
-								elif(arcrange[1] >= r[1] and arcrange[0] <= r[0]):
-									if(r[2] > current_max):
-										current_max = r[2]
-									
-							# if arcs cross over, increment the arc height index
-							for r in pos_arc_ranges:
-								if  (arcrange[0] >= r[0] and arcrange[0] <= r[1]):
-									reg['arc_height_index'] = current_max + 1
-									arcrange[2] = reg['arc_height_index']
-								elif(arcrange[0] >= r[1] and arcrange[0] <= r[0]):
-									reg['arc_height_index'] = current_max + 1
-									arcrange[2] = reg['arc_height_index']
-								elif(arcrange[1] >= r[0] and arcrange[0] <= r[1]):
-									reg['arc_height_index'] = current_max + 1
-									arcrange[2] = reg['arc_height_index']
-								elif(arcrange[1] >= r[1] and arcrange[0] <= r[0]):
-									reg['arc_height_index'] = current_max + 1
-									arcrange[2] = reg['arc_height_index']
-							pos_arc_ranges.append(arcrange)
-						
-						# arc below if to_part is reverse
-						else:
-							# find max arc height index
-							current_max = 1
-							for r in neg_arc_ranges:
-								if  (arcrange[0] > r[0] and arcrange[0] < r[1]):
-									if(r[2] > current_max):
-										current_max = r[2]
-								elif(arcrange[0] > r[1] and arcrange[0] < r[0]):
-									if(r[2] > current_max):
-										current_max = r[2]
-								elif(arcrange[1] > r[0] and arcrange[0] < r[1]):
-									if(r[2] > current_max):
-										current_max = r[2]
-								elif(arcrange[1] > r[1] and arcrange[0] < r[0]):
-									if(r[2] > current_max):
-										current_max = r[2]
-							
-							# if arcs cross over, increment the arc height index
-							for r in neg_arc_ranges:
-								if  (arcrange[0] > r[0] and arcrange[0] < r[1]):
-									reg['arc_height_index'] = current_max + 1
-									arcrange[2] = reg['arc_height_index']
-								elif(arcrange[0] > r[1] and arcrange[0] < r[0]):
-									reg['arc_height_index'] = current_max + 1
-									arcrange[2] = reg['arc_height_index']
-								elif(arcrange[1] > r[0] and arcrange[0] < r[1]):
-									reg['arc_height_index'] = current_max + 1
-									arcrange[2] = reg['arc_height_index']
-								elif(arcrange[1] > r[1] and arcrange[0] < r[0]):
-									reg['arc_height_index'] = current_max + 1
-									arcrange[2] = reg['arc_height_index']
-							neg_arc_ranges.append(arcrange)
-						##############################################################################
-						
-						reg_renderers[reg['type']](ax, reg['type'], 
-							           reg_num, reg['from_part'], 
-							           reg['to_part'], self.scale, 
-							           self.linewidth, reg['arc_height_index'], opts=reg_opts)
-				reg_num += 1
-		# Plot the backbone (z=1)
-		l1 = Line2D([first_start-self.backbone_pad_left,prev_end+self.backbone_pad_right],[0,0], 
-			        linewidth=self.linewidth, color=(0,0,0), zorder=10)
-		ax.add_line(l1)
-		return first_start, prev_end
+#!/usr/bin/env python
+"""
+dnaplotlib
+==========
+    This module is designed to allow for highly customisable visualisation of DNA
+    fragments. Diagrams can be in the form of conceptual SBOL compliant icons or
+    make use of icons whose width is scaled to allow for easier comparison of part 
+    locations to trace information, such as for corresponding RNA-seq read depth
+    data. All plotting is performed using matplotlib and to an axis object. This 
+    enables the export of publication quality, vector-based figures. Furthermore,
+    all standard renderers can be replaced with user defined versions to allow 
+    for full customisation of the plot.
+
+    To make use of this module it is necessary to create the rendering object 
+    after importing the module:
+
+    >  import dnaplotlib as dpl
+    >  dr = dpl.DNARenderer()
+
+    This object performs all rendering using the renderDNA() method. To describe
+    what should be plotted, dnaplotlib requires the DNA design in a specific 
+    format. For standard SBOL diagrams a design is a list of dictionaries where
+    each dictionary relates to a specific part and as a minimum contains the
+    keys:
+
+    - name: A name that can be potentially used in regulation.
+    - type: The type of part (decides which renderer to use).
+    - fwd: Boolean defing if the part is in a forward orientation.
+
+    Once this list is defined and an axis object is created the design can be
+    draw using standard renders and to a user created matplotlib axes by running:
+
+    > reg_renderers = dr.std_reg_renderers()
+	> part_renderers = dr.SBOL_part_renderers()
+	> regs = None
+	> design = ... Design is created here ...
+	> ax = ... matplotlib axes created here ...
+    > start, end = dr.renderDNA(ax, design, part_renderers, regs, reg_renderers)
+
+    The function returns the start and end point of the design which can then
+    be used for resizing the axes and figure. For more advanced use cases we 
+    advise looking at the gallery distributed with this module.
+
+    Per-bp trace data for whole plasmids or genomes (NumPy arrays, or files
+    memory-mapped with load_trace()) can be drawn alongside trace parts with
+    draw_trace(), which decimates the data to the pixels it covers.
+"""
+#    dnaplotlib
+#    Copyright (C) 2014 by
+#    Thomas E. Gorochowski <tom@chofski.co.uk>
+#    Emerson Glassey <eglassey@mit.edu>
+#    Bryan Der <bder@mit.edu>
+#    All rights reserved.
+#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
+
+import dnadesign
+import dnalayout
+import json
+import math
+import os
+import sys
+import time
+
+__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
+               Emerson Glassey <eglassey@mit.edu>, Voigt Lab, MIT\n\
+               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
+__license__ = 'OSI Non-Profit OSL 3.0'
+__version__ = '1.0'
+
+###############################################################################
+# Deferred matplotlib imports
+###############################################################################
+
+# matplotlib is only imported once something is drawn (see load_matplotlib)
+
+class DeferredClass (object):
+	""" Stands in for a matplotlib class until matplotlib is loaded. Calling it,
+	    accessing its attributes or using it in isinstance() loads matplotlib
+	    (after which the module refers to the class itself).
+	"""
+
+	def __init__(self, module, name):
+		self.module = module
+		self.name = name
+
+	def resolve(self):
+		load_matplotlib()
+		return getattr(sys.modules[self.module], self.name)
+
+	def __call__(self, *args, **kwargs):
+		return self.resolve()(*args, **kwargs)
+
+	def __getattr__(self, name):
+		return getattr(self.resolve(), name)
+
+	def __instancecheck__(self, instance):
+		return isinstance(instance, self.resolve())
+
+Patch           = DeferredClass('matplotlib.patches', 'Patch')
+Polygon         = DeferredClass('matplotlib.patches', 'Polygon')
+Ellipse         = DeferredClass('matplotlib.patches', 'Ellipse')
+Wedge           = DeferredClass('matplotlib.patches', 'Wedge')
+Circle          = DeferredClass('matplotlib.patches', 'Circle')
+PathPatch       = DeferredClass('matplotlib.patches', 'PathPatch')
+Path            = DeferredClass('matplotlib.path', 'Path')
+Line2D          = DeferredClass('matplotlib.lines', 'Line2D')
+LineCollection  = DeferredClass('matplotlib.collections', 'LineCollection')
+PatchCollection = DeferredClass('matplotlib.collections', 'PatchCollection')
+Stroke          = DeferredClass('matplotlib.patheffects', 'Stroke')
+Affine2D        = DeferredClass('matplotlib.transforms', 'Affine2D')
+
+def load_matplotlib ():
+	""" Import the matplotlib classes used for drawing (if not already loaded),
+	    setting the Agg backend the first time. Call this before importing
+	    pyplot.
+	"""
+	global Patch, Polygon, Ellipse, Wedge, Circle, PathPatch, Path, Line2D
+	global LineCollection, PatchCollection, Stroke, Affine2D
+	if not isinstance(Patch, DeferredClass):
+		return
+	# Set the backend to use (important for headless servers)
+	import matplotlib
+	matplotlib.use('Agg')
+	from matplotlib.patches import Patch, Polygon, Ellipse, Wedge, Circle, PathPatch
+	from matplotlib.path import Path
+	from matplotlib.lines import Line2D
+	from matplotlib.collections import LineCollection, PatchCollection
+	from matplotlib.patheffects import Stroke 
+	from matplotlib.transforms import Affine2D
+
+###############################################################################
+# SBOL Compliant Icon Renderers
+###############################################################################
+
+def miter_join ():
+	""" Path effect drawing a patch with mitred joins (a work around for
+	    matplotlib < 1.4.0). It is marked so that ArtistBatch knows a mitred
+	    patch collection draws the same.
+	"""
+	stroke = Stroke(joinstyle='miter')
+	stroke.miter_join = True
+	return stroke
+
+def write_label (ax, label_text, x_pos, opts=None):
+	""" Renders labels on parts.
+	"""
+	label_style = 'normal'
+	label_size = 7
+	label_y_offset = 0
+	label_x_offset = 0
+	if opts != None:
+		if 'label_style' in opts.keys():
+			label_style = opts['label_style']
+		if 'label_size' in opts.keys():
+			label_size = opts['label_size']
+		if 'label_y_offset' in opts.keys():
+			label_y_offset = opts['label_y_offset']
+		if 'label_x_offset' in opts.keys():
+			label_x_offset = opts['label_x_offset']
+	ax.text(x_pos+label_x_offset, label_y_offset, label_text, horizontalalignment='center',
+		    verticalalignment='center', fontsize=label_size, fontstyle=label_style, zorder=30)
+
+def sbol_promoter (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL promoter renderer.
+	"""
+	# Default options
+	color = (0.0,0.0,0.0)
+	start_pad = 2.0
+	end_pad = 2.0
+	y_extent = 10
+	x_extent = 10
+	arrowhead_height = 2
+	arrowhead_length = 4
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'arrowhead_height' in opts.keys():
+			arrowhead_height = opts['arrowhead_height']
+		if 'arrowhead_length' in opts.keys():
+			arrowhead_length = opts['arrowhead_length']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	final_end = end
+	final_start = prev_end
+	if start > end:
+		dir_fac = -1.0
+		start = prev_end+end_pad+x_extent
+		end = prev_end+end_pad
+		final_end = start+start_pad
+	else:
+		start = prev_end+start_pad
+		end = start+x_extent
+		final_end = end+end_pad
+	# Draw the promoter symbol
+	l1 = Line2D([start,start],[0,dir_fac*y_extent], linewidth=linewidth, 
+		        color=color, zorder=9)
+	l2 = Line2D([start,start+dir_fac*x_extent-dir_fac*(arrowhead_length*0.5)],
+                [dir_fac*y_extent,dir_fac*x_extent], linewidth=linewidth, 
+                color=color, zorder=10)
+	ax.add_line(l1)
+	ax.add_line(l2)
+	p1 = Polygon([(start+dir_fac*x_extent-dir_fac*arrowhead_length, 
+		           dir_fac*y_extent+(arrowhead_height)), 
+		          (start+dir_fac*x_extent, dir_fac*y_extent),
+		          (start+dir_fac*x_extent-dir_fac*arrowhead_length, 
+		           dir_fac*y_extent-(arrowhead_height))],
+		          facecolor=color, edgecolor=color, linewidth=linewidth, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0
+	ax.add_patch(p1)
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_cds (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL coding sequence renderer.
+	"""
+	# Default options
+	color = (0.7,0.7,0.7)
+	hatch = ''
+	start_pad = 1.0
+	end_pad = 1.0
+	y_extent = 5
+	x_extent = 30
+	arrowhead_height = 4
+	arrowhead_length = 8
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'hatch' in opts.keys():
+			hatch = opts['hatch']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'arrowhead_height' in opts.keys():
+			arrowhead_height = opts['arrowhead_height']
+		if 'arrowhead_length' in opts.keys():
+			arrowhead_length = opts['arrowhead_length']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	final_end = end
+	final_start = prev_end
+	if start > end:
+		dir_fac = -1.0
+		start = prev_end+end_pad+x_extent
+		end = prev_end+end_pad
+		final_end = start+start_pad
+	else:
+		start = prev_end+start_pad
+		end = start+x_extent
+		final_end = end+end_pad
+	# Draw the CDS symbol
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (end-dir_fac*arrowhead_length, -y_extent),
+		          (end-dir_fac*arrowhead_length, -y_extent-arrowhead_height),
+		          (end, 0),
+		          (end-dir_fac*arrowhead_length, y_extent+arrowhead_height),
+		          (end-dir_fac*arrowhead_length, y_extent)],
+		          edgecolor=(0.0,0.0,0.0), facecolor=color, linewidth=linewidth, 
+		          hatch=hatch, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0
+	ax.add_patch(p1)
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_terminator (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL terminator renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	y_extent = 10.0
+	x_extent = 8.0
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	final_end = end
+	final_start = prev_end
+	if start > end:
+		dir_fac = -1.0
+		start = prev_end+end_pad+x_extent
+		end = prev_end+end_pad
+		final_end = start+start_pad
+	else:
+		start = prev_end+start_pad
+		end = start+x_extent
+		final_end = end+end_pad
+	# Draw the terminator symbol
+	l1 = Line2D([start+dir_fac*(x_extent/2.0),start+dir_fac*(x_extent/2.0)],[0,dir_fac*y_extent], linewidth=linewidth, 
+		        color=color, zorder=8)
+	l2 = Line2D([start,start+(dir_fac*x_extent)],[dir_fac*y_extent,dir_fac*y_extent], 
+		        linewidth=linewidth, color=color, zorder=9)
+	ax.add_line(l1)
+	ax.add_line(l2)
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_rbs (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL ribosome binding site renderer.
+	"""
+	# Default options
+	color = (0.7,0.7,0.7)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 10.0
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	final_end = end
+	final_start = prev_end
+	rbs_center = (0,0)
+	if start > end:
+		start = prev_end+end_pad+x_extent
+		end = prev_end+end_pad
+		final_end = start+start_pad
+		rbs_center = (end+((start-end)/2.0),0)
+		w1 = Wedge(rbs_center, x_extent/2.0, 180, 360, linewidth=linewidth, 
+			       facecolor=color, zorder=8)
+		ax.add_patch(w1)
+	else:
+		start = prev_end+start_pad
+		end = start+x_extent
+		final_end = end+end_pad
+		rbs_center = (start+((end-start)/2.0),0)
+		w1 = Wedge(rbs_center, x_extent/2.0, 0, 180, linewidth=linewidth, 
+			       facecolor=color, zorder=8)
+		ax.add_patch(w1)
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+
+def sbol_ribozyme (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL ribozyme renderer.
+	"""
+	return stick_figure(ax,type,num,start,end,prev_end,scale,linewidth,opts)	
+def sbol_protein_stability (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL protein stability element renderer.
+	"""
+	return stick_figure(ax,type,num,start,end,prev_end,scale,linewidth,opts)	
+def sbol_protease (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL protease site renderer.
+	"""
+	return stick_figure(ax,type,num,start,end,prev_end,scale,linewidth,opts)
+def sbol_ribonuclease (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL ribonuclease site renderer.
+	"""
+	return stick_figure(ax,type,num,start,end,prev_end,scale,linewidth,opts)
+
+def stick_figure (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" General function for drawing stick based parts (e.g., ribozyme and protease sites).
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 5.0
+	y_extent = 10.0
+	linestyle = '-'
+	
+	linetype  = "";
+	shapetype = "";
+	if(type == "Ribozyme"):
+		linetype = 'dash'
+		headgroup = 'O'
+	elif(type == "Protease"):
+		linetype = 'dash'
+		headgroup = 'X'
+	elif(type == "ProteinStability"):
+		linetype = 'solid'
+		headgroup = 'O'
+	elif(type == "Ribonuclease"):
+		linetype = 'solid'
+		headgroup = 'X'
+
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+
+	if start > end:
+		start = prev_end+end_pad+x_extent
+		end = prev_end+end_pad
+		final_end = start+start_pad
+		rbs_center = (end+((start-end)/2.0),-y_extent)
+		c1 = Circle(rbs_center, x_extent/2.0, linewidth=linewidth, edgecolor=color, 
+			        facecolor=(1,1,1), zorder=8)
+		x1 = Line2D([start,end],[-y_extent*1.25,-y_extent/1.5], 
+		        	linewidth=linewidth, color=color, zorder=12, linestyle='-')
+		x2 = Line2D([start,end],[-y_extent/1.5,-y_extent*1.25], 
+		        	linewidth=linewidth, color=color, zorder=12, linestyle='-')
+
+		dash1  = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,-y_extent/4], 
+			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
+		dash2  = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[-y_extent/2,-y_extent+(x_extent/2.0)], 
+			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
+		solidO = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,-y_extent+(x_extent/2.0)], 
+			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
+		solidX = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,-y_extent], 
+			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
+
+		if(headgroup == "O" and linetype == "dash"):
+			ax.add_patch(c1)
+			ax.add_line(dash1)
+			ax.add_line(dash2)
+		elif(headgroup == "X" and linetype == "dash"):
+			ax.add_line(x1)
+			ax.add_line(x2)
+			ax.add_line(dash1)
+			ax.add_line(dash2)
+		elif(headgroup == "O" and linetype == "solid"):
+			ax.add_patch(c1)
+			ax.add_line(solidO)
+		elif(headgroup == "X" and linetype == "solid"):
+			ax.add_line(x1)
+			ax.add_line(x2)
+			ax.add_line(solidX)
+		
+	else:
+		start = prev_end+start_pad
+		end = start+x_extent
+		final_end = end+end_pad
+		rbs_center = (start+((end-start)/2.0),y_extent)
+		c1 = Circle(rbs_center, x_extent/2.0, linewidth=linewidth, edgecolor=color, 
+			        facecolor=(1,1,1), zorder=8)
+		x1 = Line2D([start,end],[y_extent*1.25,y_extent/1.5], 
+		        	linewidth=linewidth, color=color, zorder=12, linestyle='-')
+		x2 = Line2D([start,end],[y_extent/1.5,y_extent*1.25], 
+		        	linewidth=linewidth, color=color, zorder=12, linestyle='-')
+
+		dash1 = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,y_extent/4], 
+			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
+		dash2 = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[y_extent/2,y_extent-(x_extent/2.0)], 
+			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
+		solidO = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,y_extent-(x_extent/2.0)], 
+			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
+		solidX = Line2D([end+((start-end)/2.0),end+((start-end)/2.0)],[0,y_extent], 
+			        linewidth=linewidth, color=color, zorder=8, linestyle=linestyle)
+
+		if(headgroup == 'O' and linetype == 'dash'):
+			ax.add_patch(c1)
+			ax.add_line(dash1)
+			ax.add_line(dash2)
+		elif(headgroup == "X" and linetype == "dash"):
+			ax.add_line(x1)
+			ax.add_line(x2)
+			ax.add_line(dash1)
+			ax.add_line(dash2)
+		elif(headgroup == "O" and linetype == "solid"):
+			ax.add_patch(c1)
+			ax.add_line(solidO)
+		elif(headgroup == "X" and linetype == "solid"):
+			ax.add_line(x1)
+			ax.add_line(x2)
+			ax.add_line(solidX)
+	
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+
+def sbol_scar (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL scar renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 6.0
+	y_extent = 1.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+
+	start = prev_end+start_pad
+	end = start+x_extent
+	final_end = end+end_pad
+	
+	l_top    = Line2D([start,start+x_extent],[y_extent,y_extent], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l_bottom = Line2D([start,start+x_extent],[-1*y_extent,-1*y_extent], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	#white rectangle overlays backbone line
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (start+x_extent, -y_extent),
+		          (start+x_extent, y_extent)],
+		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)
+
+	ax.add_patch(p1)
+	ax.add_line(l_top)
+	ax.add_line(l_bottom)
+
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_empty_space (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in empty space renderer.
+	"""
+	# Default options
+	x_extent = 12.0
+	# Reset defaults if provided
+	if opts != None:
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+	# Check direction add start padding
+	final_start = prev_end
+	final_end = final_start+x_extent
+
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+
+def sbol_5_overhang (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL 5' overhang renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 0.0
+	end_pad = 2.0
+	x_extent = 6.0
+	y_extent = 1.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+
+	start = prev_end+start_pad
+	end = start+x_extent
+	final_end = end+end_pad
+	
+	l_top    = Line2D([start,start+x_extent],[y_extent,y_extent], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l_bottom = Line2D([start+(x_extent/2.0),start+x_extent],[-1*y_extent,-1*y_extent], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	#white rectangle overlays backbone line
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (start+x_extent, -y_extent),
+		          (start+x_extent, y_extent)],
+		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+
+	ax.add_patch(p1)
+	ax.add_line(l_top)
+	ax.add_line(l_bottom)
+
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_3_overhang (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL 3' overhang renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 0.0
+	x_extent = 6.0
+	y_extent = 1.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+
+	start = prev_end+start_pad
+	end = start+x_extent
+	final_end = end+end_pad
+	
+	l_top    = Line2D([start,start+x_extent],[y_extent,y_extent], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l_bottom = Line2D([start,start+(x_extent/2.0)],[-1*y_extent,-1*y_extent], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	#white rectangle overlays backbone line
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (start+x_extent, -y_extent),
+		          (start+x_extent, y_extent)],
+		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+
+	ax.add_patch(p1)
+	ax.add_line(l_top)
+	ax.add_line(l_bottom)
+
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_blunt_restriction_site (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL blunt-end restriction site renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	y_extent = 4.0
+	x_extent = 1.5
+	site_space = 1.5
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'site_space' in opts.keys():
+			site_space = opts['site_space']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	
+	# Direction is meaningless for this part => start is always < end
+	if start > end:
+		temp_end = end
+		end = start
+		start = temp_end
+
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+	start = prev_end+start_pad
+	end = start+x_extent+site_space+x_extent
+	final_end = end+end_pad
+	
+	l1        = Line2D([start+x_extent,start+x_extent],[-y_extent,y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l1_top    = Line2D([start,start+x_extent],[y_extent,y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l1_bottom = Line2D([start,start+x_extent],[-y_extent,-y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+
+	l2        = Line2D([end-x_extent,end-x_extent],[-y_extent,y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l2_top    = Line2D([end,end-x_extent],[y_extent,y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l2_bottom = Line2D([end,end-x_extent],[-y_extent,-y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	
+	ax.add_line(l1)
+	ax.add_line(l1_top)
+	ax.add_line(l1_bottom)
+	ax.add_line(l2)
+	ax.add_line(l2_top)
+	ax.add_line(l2_bottom)
+
+	if opts != None and 'label' in opts.keys():
+		write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	return final_start, final_end
+
+def sbol_primer_binding_site (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL primer binding site renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	y_extent = 2.0
+	y_offset = 1.5
+	x_extent = 8.0
+	arrowhead_length = 2.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'y_offset' in opts.keys():
+			y_offset = opts['y_offset']
+		if 'arrowhead_length' in opts.keys():
+			arrowhead_length = opts['arrowhead_length']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	
+	direction = 'F'
+	if start > end:
+		direction = 'R'
+		temp_end = end
+		end = start
+		start = temp_end
+
+	final_end = prev_end
+	final_start = prev_end
+
+	if direction == 'F':
+		final_start = prev_end
+		start = prev_end+start_pad
+		end = start+x_extent
+		final_end = end+end_pad
+	else:
+		final_start = prev_end
+		end = prev_end+end_pad
+		start = end+x_extent
+		final_start = start+start_pad
+
+	if direction == 'F':
+		verts = [(start, y_offset), (end, y_offset), (end-arrowhead_length, y_offset+y_extent)]
+		codes = [Path.MOVETO, Path.LINETO, Path.LINETO]
+		path = Path(verts, codes)
+		patch = PathPatch(path, lw=linewidth, edgecolor=color, facecolor=(1,1,1))
+		ax.add_patch(patch)
+	else:
+		verts = [(start, -y_offset), (end, -y_offset), (end+arrowhead_length, -y_offset-y_extent)]
+		codes = [Path.MOVETO, Path.LINETO, Path.LINETO]
+		path = Path(verts, codes)
+		patch = PathPatch(path, lw=linewidth, edgecolor=color, facecolor=(1,1,1))
+		ax.add_patch(patch)
+
+	if opts != None and 'label' in opts.keys():
+		if start > end:
+			write_label(ax, opts['label'], end+((start-end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], start+((end-start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_5_sticky_restriction_site  (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL 5' sticky-end restriction site renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	y_extent = 4.0
+	x_extent = 8.0
+	end_space = 1.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'end_space' in opts.keys():
+			end_space = opts['end_space']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	
+	# Direction is meaningless for this part => start is always < end
+	if start > end:
+		temp_end = end
+		end = start
+		start = temp_end
+
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+	start = prev_end+start_pad
+	end = start+end_space+x_extent+end_space
+	final_end = end+end_pad
+	
+	l1        = Line2D([start+end_space,start+end_space+x_extent],[0,0], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l1_top    = Line2D([start+end_space,start+end_space],[0,y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l1_bottom = Line2D([start+end_space+x_extent,start+end_space+x_extent],[0,-y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	ax.add_line(l1)
+	ax.add_line(l1_top)
+	ax.add_line(l1_bottom)
+
+	# White rectangle overlays backbone line
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (end, -y_extent),
+		          (end, y_extent)],
+		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+
+	ax.add_patch(p1)
+
+	if opts != None and 'label' in opts.keys():
+		write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	return final_start, final_end
+
+def sbol_3_sticky_restriction_site  (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL 3' sticky-end restriction site renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	y_extent = 4.0
+	x_extent = 8.0
+	end_space = 1.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'end_space' in opts.keys():
+			end_space = opts['end_space']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	
+	# Direction is meaningless for this part => start is always < end
+	if start > end:
+		temp_end = end
+		end = start
+		start = temp_end
+
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+	start = prev_end+start_pad
+	end = start+end_space+x_extent+end_space
+	final_end = end+end_pad
+	
+	l1        = Line2D([start+end_space,start+end_space+x_extent],[0,0], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l1_top    = Line2D([start+end_space+x_extent,start+end_space+x_extent],[0,y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l1_bottom = Line2D([start+end_space,start+end_space],[0,-y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	ax.add_line(l1)
+	ax.add_line(l1_top)
+	ax.add_line(l1_bottom)
+
+	# White rectangle overlays backbone line
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (end, -y_extent),
+		          (end, y_extent)],
+		          edgecolor=(1,1,1), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+
+	ax.add_patch(p1)
+
+	if opts != None and 'label' in opts.keys():
+		write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	return final_start, final_end
+
+def sbol_user_defined  (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL user-defined element renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 12.0
+	y_extent = 3.0
+	linestyle = '-'
+	fill_color = (1,1,1)
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'fill_color' in opts.keys():
+			fill_color = opts['fill_color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+
+	start = prev_end+start_pad
+	end = start+x_extent
+	final_end = end+end_pad
+	
+	#white rectangle overlays backbone line
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (start+x_extent, -y_extent),
+		          (start+x_extent, y_extent)],
+		          edgecolor=(0.0,0.0,0.0), facecolor=color, linewidth=linewidth, zorder=11, 
+		          #edgecolor=color, facecolor=fill_color, linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+
+	ax.add_patch(p1)
+	
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_signature  (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL signature renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 12.0
+	y_extent = 3.0
+	linestyle = '-'
+	fill_color = (1,1,1)
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'fill_color' in opts.keys():
+			fill_color = opts['fill_color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	
+	direction = 'F'
+	if start > end:
+		direction = 'R'
+		temp_end = end
+		end = start
+		start = temp_end
+
+	final_end = prev_end
+	final_start = prev_end
+
+	if direction == 'F':
+		final_start = prev_end
+		start = prev_end+start_pad
+		end = start+x_extent
+		final_end = end+end_pad
+	else:
+		final_start = prev_end
+		end = prev_end+end_pad
+		start = end+x_extent
+		final_start = start+start_pad
+
+	indent_fac = (y_extent*2.0)*0.3
+	cross_width = (y_extent*2.0)*0.7
+
+	if direction == 'F':
+		p1 = Polygon([(start, y_extent), 
+			          (start, -y_extent),
+			          (start+x_extent, -y_extent),
+			          (start+x_extent, y_extent)],
+			          edgecolor=color, facecolor=fill_color, linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+		ax.add_patch(p1)
+		top1x = start + indent_fac
+		top1y = y_extent - indent_fac
+		top2x = start + cross_width
+		top2y = y_extent - indent_fac
+		bot1x = start + indent_fac
+		bot1y = -y_extent + indent_fac
+		bot2x = start + cross_width
+		bot2y = -y_extent + indent_fac
+		lcross1 = Line2D([top1x,bot2x],[top1y,bot2y], 
+		                  linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+		lcross2 = Line2D([top2x,bot1x],[top2y,bot1y], 
+		                  linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+		ax.add_line(lcross1)
+		ax.add_line(lcross2)
+		lsign = Line2D([bot2x+indent_fac,end-indent_fac],[-y_extent+indent_fac,-y_extent+indent_fac], 
+		               linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+		ax.add_line(lsign)
+	else:
+		p1 = Polygon([(start, y_extent), 
+			          (start, -y_extent),
+			          (start-x_extent, -y_extent),
+			          (start-x_extent, y_extent)],
+			          edgecolor=color, facecolor=fill_color, linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)
+		ax.add_patch(p1)
+		top1x = start - indent_fac
+		top1y = y_extent - indent_fac
+		top2x = start - cross_width
+		top2y = y_extent - indent_fac
+		bot1x = start - indent_fac
+		bot1y = -y_extent + indent_fac
+		bot2x = start - cross_width
+		bot2y = -y_extent + indent_fac
+		lcross1 = Line2D([top1x,bot2x],[top1y,bot2y], 
+		                  linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+		lcross2 = Line2D([top2x,bot1x],[top2y,bot1y], 
+		                  linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+		ax.add_line(lcross1)
+		ax.add_line(lcross2)
+		lsign = Line2D([bot2x-indent_fac,end+indent_fac],[y_extent-indent_fac,y_extent-indent_fac], 
+		               linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+		ax.add_line(lsign)
+
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_restriction_site (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL restriction site renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	y_extent = 4.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+
+	start = prev_end+start_pad
+	end = start + linewidth
+	final_end = end+end_pad
+	
+	l1    = Line2D([start,start],[-y_extent,y_extent], 
+		           linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	ax.add_line(l1)
+
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+
+def sbol_spacer (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL spacer renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 6.0
+	y_extent = 6.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+	
+	start = prev_end+start_pad
+	end = start+x_extent
+	final_end = end+end_pad
+	rbs_center = (start+((end-start)/2.0),0)
+	center_x = start+(end-start)/2.0
+	radius = x_extent/2
+
+	delta = radius - 0.5 * radius * math.sqrt(2)
+
+	l1 = Line2D([start+delta,end-delta],[radius-delta,-1*radius+delta], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	l2 = Line2D([start+delta,end-delta],[-1*radius+delta,radius-delta], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	c1 = Circle(rbs_center, x_extent/2.0, linewidth=linewidth, edgecolor=color, 
+		        facecolor=(1,1,1), zorder=12)
+	
+	ax.add_patch(c1)
+	ax.add_line(l1)
+	ax.add_line(l2)
+
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+
+def sbol_origin (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL origin renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 10.0
+	y_extent = 10.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+	
+	start = prev_end+start_pad
+	end = start+x_extent
+	final_end = end+end_pad
+	ori_center = (start+((end-start)/2.0),0)
+	
+	c1 = Circle(ori_center, x_extent/2.0, linewidth=linewidth, edgecolor=color, 
+		        facecolor=(1,1,1), zorder=12)
+	
+	ax.add_patch(c1)
+	
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_operator (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL operator renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 6.0
+	y_extent = 3.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+
+	start = prev_end+start_pad
+	end = start+x_extent
+	final_end = end+end_pad
+	
+	#white rectangle overlays backbone line
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (start+x_extent, -y_extent),
+		          (start+x_extent, y_extent)],
+		          edgecolor=(0,0,0), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+
+	ax.add_patch(p1)
+	
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+def sbol_insulator (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Built-in SBOL insulator renderer.
+	"""
+	# Default options
+	color = (0,0,0)
+	start_pad = 2.0
+	end_pad = 2.0
+	x_extent = 8.0
+	y_extent = 4.0
+	linestyle = '-'
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	
+	# Check direction add start padding
+	final_end = end
+	final_start = prev_end
+	start = prev_end+start_pad
+	end = start+x_extent
+	final_end = end+end_pad
+	
+	#white rectangle overlays backbone line
+	p1 = Polygon([(start, y_extent), 
+		          (start, -y_extent),
+		          (start+x_extent, -y_extent),
+		          (start+x_extent, y_extent)],
+		          edgecolor=(0,0,0), facecolor=(1,1,1), linewidth=linewidth, zorder=11, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+
+	bits = 5.0
+	gap_size = ((end-start)/bits)
+	x_inset_start = start + gap_size
+	x_inset_end = start + ((bits-1.0)*gap_size)
+
+	# Inside rectangle
+	p2 = Polygon([(x_inset_start,  y_extent-gap_size), 
+		          (x_inset_start, -y_extent+gap_size),
+		          (x_inset_end, -y_extent+gap_size),
+		          (x_inset_end,  y_extent-gap_size)],
+		          edgecolor=(0,0,0), facecolor=(1,1,1), linewidth=linewidth, zorder=12, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)		
+
+	ax.add_patch(p1)
+	ax.add_patch(p2)
+	
+	if opts != None and 'label' in opts.keys():
+		if final_start > final_end:
+			write_label(ax, opts['label'], final_end+((final_start-final_end)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], final_start+((final_end-final_start)/2.0), opts=opts)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+# Not used at present
+def temporary_repressor (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	# Default options
+	color = (0.7,0.7,0.7)
+	start_pad = 2.0
+	end_pad = 2.0
+	y_extent = 10
+	x_extent = 10
+	arrowhead_height = 2
+	arrowhead_length = 4
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'start_pad' in opts.keys():
+			start_pad = opts['start_pad']
+		if 'end_pad' in opts.keys():
+			end_pad = opts['end_pad']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'arrowhead_height' in opts.keys():
+			arrowhead_height = opts['arrowhead_height']
+		if 'arrowhead_length' in opts.keys():
+			arrowhead_length = opts['arrowhead_length']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	final_end = end
+	final_start = prev_end
+	if start > end:
+		dir_fac = -1.0
+		start = prev_end+end_pad+x_extent
+		end = prev_end+end_pad
+		final_end = start+start_pad
+	else:
+		start = prev_end+start_pad
+		end = start+x_extent
+		final_end = end+end_pad
+	
+	e1center = (start+((end-start)/2.0),0)
+	e2center = (start+((end-start)/2.0)+x_extent/3.75,0)
+
+	e1 = Ellipse(e1center, y_extent/2, y_extent, edgecolor=(0,0,0), facecolor=color, 
+				linewidth=linewidth, fill=True, zorder=12)
+	e2 = Ellipse(e2center, y_extent/2, y_extent, edgecolor=(0,0,0), facecolor=color, 
+				linewidth=linewidth, fill=True, zorder=11)
+
+	ax.add_patch(e1)
+	ax.add_patch(e2)
+
+	if final_start > final_end:
+		return prev_end, final_start
+	else:
+		return prev_end, final_end
+
+###############################################################################
+# Regulation renderers
+###############################################################################
+
+def repress (ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts):
+	""" Standard repression regulation renderer.
+	"""
+	regulation(ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts)
+
+def induce (ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts):
+	""" Standard induction regulation renderer.
+	"""
+	regulation(ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts)
+
+def regulation (ax, type, num, from_part, to_part, scale, linewidth, arc_height_index, opts):
+	""" General function for drawing regulation arcs.
+	"""
+
+	color = (0.0,0.0,0.0)
+	arrowhead_length = 4
+	linestyle = '-'
+	
+	#Warning: change these to params instead of hard-coded numbers
+	arcHeight = 15 + arc_height_index*5
+	startHeight = 10
+	
+	# Reset defaults if provided
+	if opts != None:
+		if 'arrowhead_length' in opts.keys():
+			arrowhead_length = opts['arrowhead_length']
+		if 'linestyle' in opts.keys():
+			linestyle = opts['linestyle']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'color' in opts.keys():
+			color = opts['color']
+	
+	start = (from_part['start'] + from_part['end']) / 2
+	end   = (to_part['start']   + to_part['end']) / 2
+
+	top = arcHeight;
+	base = startHeight;
+	indHeight = arrowhead_length
+	
+	if(to_part['fwd'] == False):
+		base = -1*startHeight
+		top  = -1*arcHeight
+		indHeight = -1*arrowhead_length
+
+	line_away   = Line2D([start,start],[base/1.2,top], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	line_across = Line2D([start,end],[top,top], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	line_toward = Line2D([end,end],[top,base*1.5], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle=linestyle)
+	line_rep    = Line2D([end-arrowhead_length,end+arrowhead_length],[base*1.5,base*1.5], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle='-')
+	line_ind1   = Line2D([end-arrowhead_length,end],[base*1.5+indHeight,base*1.5], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle='-')
+	line_ind2    = Line2D([end+arrowhead_length,end],[base*1.5+indHeight,base*1.5], 
+		        linewidth=linewidth, color=color, zorder=12, linestyle='-')
+
+	ax.add_line(line_away)
+	ax.add_line(line_across)
+	ax.add_line(line_toward)
+
+	if(type == 'Repression'):
+		ax.add_line(line_rep)
+
+	if(type == 'Activation'):
+		ax.add_line(line_ind1)
+		ax.add_line(line_ind2)
+
+###############################################################################
+# Trace Icon Renderers (icon width corrisponds to trace data)
+###############################################################################
+
+def trace_promoter (ax, type, num, start_bp, end_bp, prev_end, scale, linewidth, opts):
+	""" Built-in trace-based promoter renderer.
+	"""
+	# Default options
+	color = (0.0,0.0,1.0)
+	y_extent = 6
+	x_extent = 30
+	arrowhead_height = 0.5
+	arrowhead_length = 15
+	highlight_y_extent = 0.8
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'arrowhead_height' in opts.keys():
+			arrowhead_height = opts['arrowhead_height']
+		if 'arrowhead_length' in opts.keys():
+			arrowhead_length = opts['arrowhead_length']
+		if 'highlight_y_extent' in opts.keys():
+			highlight_y_extent = opts['highlight_y_extent']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	if start_bp > end_bp:
+		dir_fac = -1.0
+	# Draw the promoter symbol
+	l1 = Line2D([start_bp,start_bp],[0,dir_fac*y_extent], linewidth=linewidth, 
+		        color=color, zorder=14)
+	l2 = Line2D([start_bp,start_bp+dir_fac*x_extent*scale-dir_fac*arrowhead_length*0.5*scale],
+                [dir_fac*y_extent,dir_fac*y_extent], linewidth=linewidth, 
+                color=color, zorder=14)
+	ax.add_line(l1)
+	ax.add_line(l2)
+	p1 = Polygon([(start_bp+dir_fac*x_extent*scale-dir_fac*arrowhead_length*scale, 
+		           dir_fac*y_extent+(arrowhead_height)), 
+		          (start_bp+dir_fac*(x_extent*scale), dir_fac*y_extent),
+		          (start_bp+dir_fac*x_extent*scale-dir_fac*arrowhead_length*scale, 
+		           dir_fac*y_extent-(arrowhead_height))],
+		          facecolor=color, edgecolor=color, linewidth=linewidth, zorder=14, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)
+	ax.add_patch(p1)
+	# Shade the promoter area (normally smaller than symbol extent)
+ 	p2 = Polygon([(start_bp, -highlight_y_extent), 
+ 		          (start_bp, highlight_y_extent),
+ 		          (end_bp, highlight_y_extent),
+ 		          (end_bp, -highlight_y_extent)], facecolor=color, edgecolor=color, linewidth=linewidth, zorder=14, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)
+	ax.add_patch(p2)
+	if opts != None and 'label' in opts.keys():
+		if start_bp > end_bp:
+			write_label(ax, opts['label'], end_bp+((start_bp-end_bp)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], start_bp+((end_bp-start_bp)/2.0), opts=opts)
+	if start_bp > end_bp:
+		return end_bp, start_bp
+	else:
+		return start_bp, end_bp
+
+def trace_rbs (ax, type, num, start_bp, end_bp, prev_end, scale, linewidth, opts):
+	""" Built-in trace-based ribosome binding site renderer.
+	"""
+	# Default options
+	color = (0.16,0.68,0.15)
+	y_extent = 3.5
+	x_extent = 10
+	highlight_y_extent = 0.8
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'highlight_y_extent' in opts.keys():
+			highlight_y_extent = opts['highlight_y_extent']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	if start_bp > end_bp:
+		dir_fac = -1.0
+	# Draw the RBS symbol
+	l1 = Line2D([start_bp,start_bp],[0,dir_fac*y_extent], linewidth=linewidth, color=color, zorder=14)
+	ax.add_line(l1)
+	c1 = Ellipse((start_bp,dir_fac*y_extent),width=(x_extent*scale),height=y_extent*0.4,color=color, zorder=14)
+	ax.add_artist(c1)
+ 	# Shade the promoter area (normally smaller than symbol extent)
+ 	p2 = Polygon([(start_bp, -highlight_y_extent), 
+ 		          (start_bp, highlight_y_extent),
+ 		          (end_bp, highlight_y_extent),
+ 		          (end_bp, -highlight_y_extent)], facecolor=color, edgecolor=color, linewidth=linewidth, zorder=13, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)
+	ax.add_patch(p2)
+	if opts != None and 'label' in opts.keys():
+		if start_bp > end_bp:
+			write_label(ax, opts['label'], end_bp+((start_bp-end_bp)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], start_bp+((end_bp-start_bp)/2.0), opts=opts)
+	if start_bp > end_bp:
+		return end_bp, start_bp
+	else:
+		return start_bp, end_bp
+
+def trace_cds (ax, type, num, start_bp, end_bp, prev_end, scale, linewidth, opts):
+	""" Built-in trace-based coding sequence renderer.
+	"""
+	# Default options
+	color = (0.7,0.7,0.7)
+	hatch = ''
+	y_extent = 1.5
+	arrowhead_height = 1
+	arrowhead_length = 30
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'hatch' in opts.keys():
+			hatch = opts['hatch']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'arrowhead_height' in opts.keys():
+			arrowhead_height = opts['arrowhead_height']
+		if 'arrowhead_length' in opts.keys():
+			arrowhead_length = opts['arrowhead_length']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	if start_bp > end_bp:
+		dir_fac = -1.0
+	# Draw the CDS symbol
+	p1 = Polygon([(start_bp, y_extent), 
+		          (start_bp, -y_extent),
+		          (end_bp-dir_fac*arrowhead_length*scale, -y_extent),
+		          (end_bp-dir_fac*arrowhead_length*scale, -y_extent-arrowhead_height),
+		          (end_bp, 0),
+		          (end_bp-dir_fac*arrowhead_length*scale, y_extent+arrowhead_height),
+		          (end_bp-dir_fac*arrowhead_length*scale, y_extent)],
+		          edgecolor=(0.0,0.0,0.0), facecolor=color, linewidth=linewidth, 
+		          hatch=hatch, zorder=15, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)
+	ax.add_patch(p1)
+	if opts != None and 'label' in opts.keys():
+		if start_bp > end_bp:
+			write_label(ax, opts['label'], end_bp+((start_bp-end_bp)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], start_bp+((end_bp-start_bp)/2.0), opts=opts)
+	if start_bp > end_bp:
+		return end_bp, start_bp
+	else:
+		return start_bp, end_bp
+
+def trace_terminator (ax, type, num, start_bp, end_bp, prev_end, scale, linewidth, opts):
+	""" Built-in trace-based terminator renderer.
+	"""
+	# Default options
+	color = (1.0,0.0,0.0)
+	y_extent = 3.5
+	x_extent = 10
+	highlight_y_extent = 0.8
+	# Reset defaults if provided
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'y_extent' in opts.keys():
+			y_extent = opts['y_extent']
+		if 'x_extent' in opts.keys():
+			x_extent = opts['x_extent']
+		if 'highlight_y_extent' in opts.keys():
+			highlight_y_extent = opts['highlight_y_extent']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'scale' in opts.keys():
+			scale = opts['scale']
+	# Check direction add start padding
+	dir_fac = 1.0
+	if start_bp > end_bp:
+		dir_fac = -1.0
+	# Draw the terminator symbol
+	l1 = Line2D([start_bp,start_bp],[0,dir_fac*y_extent], linewidth=linewidth, color=color, zorder=8)
+	l2 = Line2D([start_bp-(x_extent*scale),start_bp+(x_extent*scale)],[dir_fac*y_extent,dir_fac*y_extent], linewidth=linewidth, color=color, zorder=14)
+	ax.add_line(l1)
+	ax.add_line(l2)
+	# Shade the terminator area (normally smaller than symbol extent)
+ 	p2 = Polygon([(start_bp, -highlight_y_extent), 
+ 		          (start_bp, highlight_y_extent),
+ 		          (end_bp, highlight_y_extent),
+ 		          (end_bp, -highlight_y_extent)], facecolor=color, edgecolor=color, linewidth=linewidth, zorder=13, 
+		          path_effects=[miter_join()]) # This is a work around for matplotlib < 1.4.0)
+	ax.add_patch(p2)
+	if opts != None and 'label' in opts.keys():
+		if start_bp > end_bp:
+			write_label(ax, opts['label'], end_bp+((start_bp-end_bp)/2.0), opts=opts)
+		else:
+			write_label(ax, opts['label'], start_bp+((end_bp-start_bp)/2.0), opts=opts)
+	if start_bp > end_bp:
+		return end_bp, start_bp
+	else:
+		return start_bp, end_bp
+
+###############################################################################
+# Trace data
+###############################################################################
+
+# Samples reduced at a time when decimating (bounds the memory used to read
+# memory-mapped traces)
+TRACE_CHUNK_SIZE = 1<<22
+
+def load_trace (filename, dtype='float32'):
+	""" Per-bp trace data (e.g., read depth) from a file, memory-mapped rather
+	    than read into memory. NumPy .npy files keep their own dtype and other
+	    files are read as a raw array of dtype.
+	"""
+	import numpy as np
+	if filename.endswith('.npy'):
+		return np.load(filename, mmap_mode='r')
+	return np.memmap(filename, dtype=dtype, mode='r')
+
+def trace_pixels (ax, start_bp, end_bp):
+	""" Number of pixels (at the figure dpi) that a bp range covers on an axis.
+	"""
+	x = ax.transData.transform([[start_bp, 0], [end_bp, 0]])[:,0]
+	return max(int(math.ceil(abs(x[1]-x[0]))), 1)
+
+def bin_edges (start_bp, end_bp, num_bins):
+	""" Indexes splitting [start_bp, end_bp) into num_bins near equal bins.
+	"""
+	import numpy as np
+	return start_bp + (np.arange(num_bins+1, dtype=np.int64)*(end_bp-start_bp))//num_bins
+
+def decimate_minmax (data, start_bp, end_bp, num_bins):
+	""" Minimum and maximum of trace data in each of num_bins bins covering
+	    [start_bp, end_bp). Data that fits is returned as is (with equal minima
+	    and maxima).
+
+	Parameters
+    ----------
+    data : numpy.ndarray
+    	Value at each bp (may be memory-mapped).
+
+    start_bp, end_bp : int
+    	Range of the data to decimate.
+
+    num_bins : int
+    	Number of bins (normally the number of pixels the range is drawn to).
+
+    Returns
+    -------
+    x : numpy.ndarray
+    	Centre (bp) of each bin.
+
+    y_min, y_max : numpy.ndarray
+    	Minimum and maximum of each bin.
+	"""
+	import numpy as np
+	if num_bins >= end_bp-start_bp:
+		y = np.asarray(data[start_bp:end_bp])
+		return np.arange(start_bp, end_bp)+0.5, y, y
+	edges = bin_edges(start_bp, end_bp, num_bins)
+	y_min = np.empty(num_bins, dtype=data.dtype)
+	y_max = np.empty(num_bins, dtype=data.dtype)
+	# Reduce whole bins a chunk at a time
+	first = 0
+	while first < num_bins:
+		last = first+1
+		while last < num_bins and edges[last+1]-edges[first] <= TRACE_CHUNK_SIZE:
+			last += 1
+		chunk = data[edges[first]:edges[last]]
+		idx = edges[first:last]-edges[first]
+		y_min[first:last] = np.minimum.reduceat(chunk, idx)
+		y_max[first:last] = np.maximum.reduceat(chunk, idx)
+		first = last
+	return (edges[:-1]+edges[1:])/2.0, y_min, y_max
+
+def decimate_lttb (data, start_bp, end_bp, num_points):
+	""" Downsample trace data over [start_bp, end_bp) to num_points points
+	    using Largest-Triangle-Three-Buckets, which keeps the points that most
+	    affect the shape of the trace. Data that fits is returned as is. At
+	    least 3 points are kept (the first, the last and the point furthest
+	    from the line between them), however few are asked for.
+
+	Returns
+    -------
+    x : numpy.ndarray
+    	Position (bp) of each point.
+
+    y : numpy.ndarray
+    	Value of each point.
+	"""
+	import numpy as np
+	n = end_bp-start_bp
+	num_points = max(num_points, 3)
+	if num_points >= n:
+		return np.arange(start_bp, end_bp)+0.5, np.asarray(data[start_bp:end_bp])
+	# The first and last points are kept and the rest split into buckets
+	edges = bin_edges(start_bp+1, end_bp-1, num_points-2)
+	sums = np.empty(num_points-2, dtype=np.float64)
+	first = 0
+	while first < num_points-2:
+		last = first+1
+		while last < num_points-2 and edges[last+1]-edges[first] <= TRACE_CHUNK_SIZE:
+			last += 1
+		chunk = np.asarray(data[edges[first]:edges[last]], dtype=np.float64)
+		sums[first:last] = np.add.reduceat(chunk, edges[first:last]-edges[first])
+		first = last
+	counts = edges[1:]-edges[:-1]
+	mean_x = (edges[:-1]+edges[1:]-1)/2.0
+	mean_y = sums/counts
+	x = np.empty(num_points)
+	y = np.empty(num_points)
+	x[0] = start_bp
+	y[0] = data[start_bp]
+	x[-1] = end_bp-1
+	y[-1] = data[end_bp-1]
+	for i in range(num_points-2):
+		# Triangle with the last point kept and the mean of the next bucket
+		if i < num_points-3:
+			next_x = mean_x[i+1]
+			next_y = mean_y[i+1]
+		else:
+			next_x = x[-1]
+			next_y = y[-1]
+		bucket_x = np.arange(edges[i], edges[i+1])
+		bucket_y = np.asarray(data[edges[i]:edges[i+1]], dtype=np.float64)
+		area = np.abs((x[i]-next_x)*(bucket_y-y[i]) - (x[i]-bucket_x)*(next_y-y[i]))
+		best = np.argmax(area)
+		x[i+1] = bucket_x[best]
+		y[i+1] = bucket_y[best]
+	return x+0.5, y
+
+def draw_trace (ax, data, start_bp=0, end_bp=None, y_offset=0.0, y_scale=1.0,
+	            method='minmax', num_pixels=None, opts=None):
+	""" Draw per-bp trace data (e.g., RNA-seq read depth) decimated to the
+	    pixels it covers, so the time taken and size of vector output do not
+	    depend on the length of the sequence. The x-axis is in bp (as used by
+	    the trace part renderers).
+
+	Parameters
+    ----------
+    ax : matplotlib.axes
+        Axes to draw the trace to (its limits and size should be set first).
+
+    data : numpy.ndarray
+    	Value at each bp, e.g., from load_trace().
+
+    start_bp, end_bp : int (default=0, None)
+    	Range of the data to draw (to the end of the data if end_bp is None).
+
+    y_offset, y_scale : float (default=0.0, 1.0)
+    	Values are drawn at y_offset+(y_scale*value).
+
+    method : string (default='minmax')
+    	'minmax' draws the range of the values covered by each pixel as a filled
+    	envelope and 'lttb' draws a line through the Largest-Triangle-Three-
+    	Buckets points.
+
+    num_pixels : int (default=None)
+    	Resolution to decimate to (the pixels covered at the figure dpi if None,
+    	so pass it when saving at a higher dpi).
+
+    opts : dict (default=None)
+    	Options: color, linewidth, alpha and zorder.
+
+    Returns
+    -------
+    artist : matplotlib.artist
+    	The Polygon or Line2D added to the axis.
+	"""
+	import numpy as np
+	color = (0.5,0.5,0.5)
+	linewidth = 1.0
+	alpha = 1.0
+	zorder = 5
+	if opts != None:
+		if 'color' in opts.keys():
+			color = opts['color']
+		if 'linewidth' in opts.keys():
+			linewidth = opts['linewidth']
+		if 'alpha' in opts.keys():
+			alpha = opts['alpha']
+		if 'zorder' in opts.keys():
+			zorder = opts['zorder']
+	if end_bp == None:
+		end_bp = len(data)
+	if num_pixels == None:
+		num_pixels = trace_pixels(ax, start_bp, end_bp)
+	if method == 'lttb':
+		x, y = decimate_lttb(data, start_bp, end_bp, num_pixels)
+		line = Line2D(x, y_offset+y_scale*y, linewidth=linewidth, color=color,
+			          alpha=alpha, zorder=zorder)
+		ax.add_line(line)
+		return line
+	elif method == 'minmax':
+		x, y_min, y_max = decimate_minmax(data, start_bp, end_bp, num_pixels)
+		# Envelope along the maxima and back along the minima
+		verts = np.empty((2*len(x), 2))
+		verts[:len(x),0] = x
+		verts[:len(x),1] = y_offset+y_scale*y_max.astype(np.float64)
+		verts[len(x):,0] = x[::-1]
+		verts[len(x):,1] = y_offset+y_scale*y_min[::-1].astype(np.float64)
+		envelope = Polygon(verts, closed=True, facecolor=color, edgecolor=color,
+			               linewidth=linewidth, alpha=alpha, zorder=zorder)
+		ax.add_patch(envelope)
+		return envelope
+	raise ValueError('unknown trace decimation method: %s' % method)
+
+###############################################################################
+# Line styling
+###############################################################################
+
+# Style of all lines drawn by dnaplotlib (mitered joins and projecting caps)
+LINE_STYLE = {'dash_joinstyle'  : 'miter',
+              'dash_capstyle'   : 'butt',
+              'solid_joinstyle' : 'miter',
+              'solid_capstyle'  : 'projecting'}
+
+def style_line (line):
+	""" Apply the dnaplotlib line style to a Line2D.
+	"""
+	line.set_dash_joinstyle(LINE_STYLE['dash_joinstyle'])
+	line.set_dash_capstyle(LINE_STYLE['dash_capstyle'])
+	line.set_solid_joinstyle(LINE_STYLE['solid_joinstyle'])
+	line.set_solid_capstyle(LINE_STYLE['solid_capstyle'])
+	return line
+
+def batchable_line (line):
+	""" True if a Line2D draws the same as part of a LineCollection (it is
+	    solid and has no markers, path effects, alpha or step drawing).
+	"""
+	return (not line.is_dashed() and line.get_marker() in [None, 'None', '', ' '] and
+	        line.get_path_effects() == [] and line.get_alpha() == None and
+	        line.get_drawstyle() == 'default')
+
+def batchable_patch (patch):
+	""" True if a patch draws the same as part of a PatchCollection (it has
+	    no path effects other than the mitred joins of miter_join()).
+	"""
+	for effect in patch.get_path_effects():
+		if getattr(effect, 'miter_join', False) != True or patch.get_joinstyle() != 'miter':
+			return False
+	return True
+
+class StyledAxis:
+	""" Stands in for an axis in renderer calls and applies the dnaplotlib line
+	    style to every line added. Everything else is passed through to the axis.
+	"""
+
+	def __init__(self, ax):
+		self.ax = ax
+
+	def __getattr__(self, name):
+		return getattr(self.ax, name)
+
+	def add_line(self, line):
+		return self.ax.add_line(style_line(line))
+
+###############################################################################
+# Batched drawing
+###############################################################################
+
+class ArtistBatch:
+	""" Accumulates the lines and patches created by the part and regulation
+	    renderers and adds them to the axis as a few collections when flushed.
+
+	    An ArtistBatch stands in for the axis in renderer calls. Calls to 
+	    add_line, add_patch and add_artist (for patches) are captured, while
+	    everything else (e.g., text for labels) is passed through to the axis.
+	    Captured artists are grouped by zorder and style, so a design with
+	    hundreds of primitives is drawn using only a handful of collections.
+	    Artists that a collection would draw differently (e.g., dashed lines or
+	    patches with path effects) are added to the axis as they are.
+	"""
+
+	def __init__(self, ax):
+		""" Constructor to generate an empty ArtistBatch.
+
+		Parameters
+	    ----------
+	    ax : matplotlib.axes
+	        Axes the collections will be added to when flushed.
+		"""
+		self.ax = ax
+		self.lines = {}
+		self.patches = {}
+
+	def __getattr__(self, name):
+		return getattr(self.ax, name)
+
+	def add_line(self, line):
+		""" Capture a Line2D (in the dnaplotlib line style), grouped by zorder and 
+		    line cap/join style.
+		"""
+		style_line(line)
+		if not batchable_line(line):
+			return self.ax.add_line(line)
+		if line.is_dashed():
+			style = (line.get_dash_capstyle(), line.get_dash_joinstyle())
+		else:
+			style = (line.get_solid_capstyle(), line.get_solid_joinstyle())
+		self.add_line_data(list(zip(line.get_xdata(), line.get_ydata())), line.get_color(),
+			               line.get_linewidth(), line.get_linestyle(), line.get_zorder(),
+			               style)
+		return line
+
+	def add_line_data(self, segment, color, linewidth, linestyle, zorder, style):
+		""" Capture a line given by its points (without creating a Line2D).
+		"""
+		key = (zorder, style)
+		if key not in self.lines.keys():
+			self.lines[key] = []
+		self.lines[key].append((segment, color, linewidth, linestyle))
+
+	def add_patch(self, patch):
+		""" Capture a patch, grouped by zorder and hatch style.
+		"""
+		if not batchable_patch(patch):
+			return self.ax.add_patch(patch)
+		hatch = patch.get_hatch()
+		if hatch == '':
+			hatch = None
+		key = (patch.get_zorder(), hatch, patch.get_joinstyle())
+		if key not in self.patches.keys():
+			self.patches[key] = []
+		self.patches[key].append(patch)
+		return patch
+
+	def add_artist(self, artist):
+		""" Capture patches added as generic artists, pass anything else through.
+		"""
+		if isinstance(artist, Patch) and batchable_patch(artist):
+			return self.add_patch(artist)
+		return self.ax.add_artist(artist)
+
+	def flush(self):
+		""" Add all captured geometry to the axis and empty the batch.
+
+	    Returns
+	    -------
+	    collections : list(matplotlib.collections.Collection)
+	    	The collections added to the axis.
+		"""
+		# Within a zorder patches are drawn before lines (as for individual artists)
+		collections = []
+		for key in sorted(self.patches.keys()):
+			zorder, hatch, joinstyle = key
+			pc = PatchCollection(self.patches[key], match_original=True, 
+				                 zorder=zorder, hatch=hatch, joinstyle=joinstyle)
+			collections.append(pc)
+		for key in sorted(self.lines.keys()):
+			zorder, style = key
+			lines = self.lines[key]
+			lc = LineCollection([l[0] for l in lines], 
+				                colors=[l[1] for l in lines],
+				                linewidths=[l[2] for l in lines],
+				                linestyles=[l[3] for l in lines],
+				                zorder=zorder, capstyle=style[0], joinstyle=style[1])
+			collections.append(lc)
+		for c in collections:
+			self.ax.add_collection(c)
+		self.lines = {}
+		self.patches = {}
+		return collections
+
+###############################################################################
+# Glyph geometry cache
+###############################################################################
+
+class GlyphRecorder:
+	""" Stands in for an axis to record the artists created by a part renderer.
+	"""
+
+	def __init__(self):
+		self.lines = []
+		self.patches = []
+		self.texts = []
+
+	def add_line(self, line):
+		self.lines.append(style_line(line))
+		return line
+
+	def add_patch(self, patch):
+		self.patches.append(patch)
+		return patch
+
+	def add_artist(self, artist):
+		if isinstance(artist, Patch):
+			return self.add_patch(artist)
+		raise TypeError('only lines, patches and text can be recorded')
+
+	def text(self, x, y, s, **kwargs):
+		self.texts.append((x, y, kwargs))
+
+class Glyph:
+	""" Geometry of a part glyph relative to the end of the previous part.
+	"""
+
+	def __init__(self, recorder):
+		""" Constructor to generate a Glyph from the artists drawn to a 
+		    GlyphRecorder (by a renderer called with prev_end=0).
+		"""
+		import numpy as np
+		self.lines = []
+		for line in recorder.lines:
+			props = {'color':line.get_color(), 'linewidth':line.get_linewidth(),
+			         'linestyle':line.get_linestyle(), 'zorder':line.get_zorder(),
+			         'dash_capstyle':line.get_dash_capstyle(),
+			         'dash_joinstyle':line.get_dash_joinstyle(),
+			         'solid_capstyle':line.get_solid_capstyle(),
+			         'solid_joinstyle':line.get_solid_joinstyle(),
+			         'path_effects':line.get_path_effects(), 'alpha':line.get_alpha()}
+			# Style of the lines that can be batched (None for any others)
+			batch_style = None
+			if batchable_line(line):
+				batch_style = (line.get_solid_capstyle(), line.get_solid_joinstyle())
+			self.lines.append((np.asarray(line.get_xdata(), dtype=float),
+			                   np.asarray(line.get_ydata(), dtype=float), props, batch_style))
+		self.patches = []
+		for patch in recorder.patches:
+			path = patch.get_patch_transform().transform_path(patch.get_path())
+			props = {'facecolor':patch.get_facecolor(), 'edgecolor':patch.get_edgecolor(),
+			         'linewidth':patch.get_linewidth(), 'linestyle':patch.get_linestyle(),
+			         'zorder':patch.get_zorder(), 'hatch':patch.get_hatch(),
+			         'fill':patch.get_fill(), 'joinstyle':patch.get_joinstyle(),
+			         'capstyle':patch.get_capstyle(),
+			         'path_effects':patch.get_path_effects(), 'alpha':patch.get_alpha()}
+			self.patches.append((np.array(path.vertices, dtype=float), path.codes, props))
+		self.texts = recorder.texts
+
+	def draw(self, ax, x, label=None):
+		""" Draw the glyph to an axis shifted by x (with label as the text of any
+		    labels).
+		"""
+		import numpy as np
+		for xdata, ydata, props, batch_style in self.lines:
+			if isinstance(ax, ArtistBatch) and batch_style != None:
+				# Batched lines only need their points and style
+				ax.add_line_data(np.column_stack((xdata+x, ydata)), props['color'], 
+					             props['linewidth'], props['linestyle'], props['zorder'],
+					             batch_style)
+			else:
+				ax.add_line(Line2D(xdata+x, ydata, **props))
+		for vertices, codes, props in self.patches:
+			ax.add_patch(PathPatch(Path(vertices+[x, 0.0], codes), **props))
+		for text_x, text_y, kwargs in self.texts:
+			ax.text(text_x+x, text_y, label, **kwargs)
+
+def freeze_opts (opts):
+	""" Hashable form of part options (raises TypeError if not possible).
+	"""
+	if isinstance(opts, dict):
+		return tuple(sorted([(k, freeze_opts(v)) for k, v in opts.items()]))
+	if isinstance(opts, (list, tuple)):
+		return tuple([freeze_opts(v) for v in opts])
+	hash(opts)
+	return opts
+
+class GlyphCache:
+	""" Cache of the geometry drawn by the built-in SBOL part renderers, keyed by
+	    the renderer, part type, direction and resolved style. Drawing a part 
+	    whose glyph has been seen before is a translation of the cached geometry
+	    rather than a call to its renderer. Label text does not form part of the
+	    key, so parts differing only in their labels share a glyph. 
+
+	    A GlyphCache can be shared by any number of DNARenderers and designs.
+	"""
+
+	def __init__(self):
+		""" Constructor to generate an empty GlyphCache.
+		"""
+		self.glyphs = {}
+		self.hits = 0
+		self.misses = 0
+
+	def cacheable(self, renderer):
+		""" True if the geometry of a renderer can be cached (it depends only on
+		    the part direction, options, linewidth and scale).
+		"""
+		return (renderer in PART_LAYOUT_RULES.keys() and 
+		        PART_LAYOUT_RULES[renderer]['width'] != 'trace')
+
+	def clear(self):
+		""" Remove all cached glyphs.
+		"""
+		self.glyphs = {}
+
+	def draw(self, ax, renderer, type, start, end, prev_end, scale, linewidth, opts):
+		""" Draw a part using its cached glyph (see the part renderers for the 
+		    parameters). The glyph is recorded from the renderer on first use.
+		"""
+		fwd = not (start > end)
+		label = None
+		key_opts = opts
+		if opts != None and 'label' in opts.keys():
+			label = opts['label']
+			key_opts = dict(opts)
+			key_opts['label'] = ''
+		try:
+			key = (renderer, type, fwd, scale, linewidth, freeze_opts(key_opts))
+			glyph = self.glyphs.get(key)
+		except TypeError:
+			# Options that cannot be hashed are drawn directly
+			return renderer(ax, type, 0, start, end, prev_end, scale, linewidth, opts=opts)
+		if glyph == None:
+			self.misses += 1
+			recorder = GlyphRecorder()
+			if fwd == True:
+				renderer(recorder, type, 0, 0, 1, 0, scale, linewidth, opts=key_opts)
+			else:
+				renderer(recorder, type, 0, 1, 0, 0, scale, linewidth, opts=key_opts)
+			# Dashes and markers of lines are not recorded, so parts using them
+			# are always drawn by their renderer
+			glyph = False
+			if all([batchable_line(line) for line in recorder.lines]):
+				glyph = Glyph(recorder)
+			self.glyphs[key] = glyph
+		elif glyph != False:
+			self.hits += 1
+		else:
+			self.misses += 1
+		if glyph == False:
+			return renderer(ax, type, 0, start, end, prev_end, scale, linewidth, opts=opts)
+		glyph.draw(ax, prev_end, label)
+
+###############################################################################
+# Level of detail
+###############################################################################
+
+class LevelOfDetail:
+	""" Policy for drawing parts that are too small to see at the scale drawn.
+	    Parts narrower than min_part_pixels are collapsed into plain blocks (runs
+	    of them forming a single block) and labels of parts narrower than 
+	    min_label_pixels are omitted.
+	"""
+
+	def __init__(self, min_part_pixels=2.0, min_label_pixels=20.0, 
+		         block_color=(0.6,0.6,0.6), pixels_per_unit=None):
+		""" Constructor to generate a LevelOfDetail policy.
+
+		Parameters
+	    ----------
+	    min_part_pixels : float (default=2.0)
+	        Width (pixels, including padding) below which parts become blocks.
+
+	    min_label_pixels : float (default=20.0)
+	    	Width (pixels, including padding) below which part labels are omitted.
+
+	    block_color : tuple (default=(0.6,0.6,0.6))
+	    	Colour of the blocks drawn for collapsed parts.
+
+	    pixels_per_unit : float (default=None)
+	    	Scale of the output. If None, it is found from the width of the axis
+	    	in pixels and the viewport (or the current x-limits of the axis).
+		"""
+		self.min_part_pixels = min_part_pixels
+		self.min_label_pixels = min_label_pixels
+		self.block_color = block_color
+		self.pixels_per_unit = pixels_per_unit
+
+	def pixel_scale (self, ax, viewport=None):
+		""" Pixels per unit of the x-axis when drawn.
+		"""
+		if self.pixels_per_unit != None:
+			return self.pixels_per_unit
+		if viewport != None:
+			x_min, x_max = viewport
+		else:
+			x_min, x_max = ax.get_xlim()
+		return ax.bbox.width/max(math.fabs(x_max-x_min), 1e-9)
+
+	def draw_block (self, ax, block):
+		""" Draw a block covering the collapsed parts (x_min, x_max, y_min, y_max).
+		"""
+		x_min, x_max, y_min, y_max = block
+		if y_max <= y_min:
+			return
+		p1 = Polygon([(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)],
+			         edgecolor=self.block_color, facecolor=self.block_color, 
+			         linewidth=0.0, zorder=11)
+		ax.add_patch(p1)
+
+###############################################################################
+# Profiling
+###############################################################################
+
+class ProfileStage:
+	""" Times the code within a with statement as a stage of a Profiler.
+	"""
+
+	def __init__(self, profiler, name, category):
+		self.profiler = profiler
+		self.name = name
+		self.category = category
+
+	def __enter__(self):
+		self.start = time.time()
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.profiler.add(self.name, self.start, self.category)
+		return False
+
+class NullStage:
+	""" Stand-in for a ProfileStage when not profiling (does nothing).
+	"""
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		return False
+
+NULL_STAGE = NullStage()
+
+def profile_stage (profiler, name, category='stage'):
+	""" Context timing a stage with a profiler (doing nothing if it is None).
+	"""
+	if profiler == None:
+		return NULL_STAGE
+	return ProfileStage(profiler, name, category)
+
+class Profiler:
+	""" Wall time and call counts of the stages of drawing a figure (e.g.,
+	    parsing, renderDNA, savefig) and of each part renderer, and the number 
+	    of artists drawn for each design. Results are reported as a summary or
+	    as a Chrome trace (viewed in chrome://tracing or Perfetto).
+
+	    >  profiler = dpl.Profiler()
+	    >  dr = dpl.DNARenderer(profiler=profiler)
+	    >  with profiler.stage('savefig'):
+	    >      fig.savefig('out.pdf')
+	    >  profiler.save('profile.json')
+
+	    Nothing is timed when no profiler is given, so drawing is unchanged.
+	"""
+
+	def __init__(self):
+		self.origin = time.time()
+		# [calls, total time] of each (category, name)
+		self.totals = {}
+		# (name, category, start, end) of every call, in the order they end
+		self.events = []
+		# Number of each kind of artist drawn for each design
+		self.artists = {}
+
+	def stage(self, name, category='stage'):
+		""" ProfileStage timing the code within a with statement.
+		"""
+		return ProfileStage(self, name, category)
+
+	def add(self, name, start, category='stage', end=None):
+		""" Record a call to a stage that began at start (and ended at end, or
+		    now if None).
+		"""
+		if end == None:
+			end = time.time()
+		key = (category, name)
+		if key not in self.totals:
+			self.totals[key] = [0, 0.0]
+		self.totals[key][0] += 1
+		self.totals[key][1] += end-start
+		self.events.append((name, category, start, end))
+
+	def count_artists(self, design_name, ax):
+		""" Record the artists drawn to the axes of a design.
+		"""
+		counts = {'lines': len(ax.lines), 'patches': len(ax.patches),
+		          'texts': len(ax.texts), 'collections': len(ax.collections)}
+		counts['total'] = sum(counts.values())
+		self.artists[design_name] = counts
+
+	def summary(self):
+		""" Calls and time (seconds) of each stage and part renderer and the
+		    artists drawn for each design.
+		"""
+		summary = {'artists': self.artists}
+		for (category, name), (calls, total) in self.totals.items():
+			if category not in summary:
+				summary[category] = {}
+			summary[category][name] = {'calls': calls, 'time': total}
+		return summary
+
+	def trace(self):
+		""" Chrome trace (Trace Event Format) of every call recorded.
+		"""
+		pid = os.getpid()
+		events = []
+		for name, category, start, end in self.events:
+			events.append({'name': name, 'cat': category, 'ph': 'X', 'pid': pid,
+			               'tid': 0, 'ts': (start-self.origin)*1e6, 
+			               'dur': (end-start)*1e6})
+		return {'traceEvents': events, 'displayTimeUnit': 'ms',
+		        'otherData': {'artists': self.artists}}
+
+	def save(self, filename, trace=False):
+		""" Write the summary (or Chrome trace if trace is True) as JSON.
+		"""
+		if trace == True:
+			data = self.trace()
+		else:
+			data = self.summary()
+		f = open(filename, 'w')
+		json.dump(data, f, indent=1, sort_keys=True)
+		f.close()
+
+###############################################################################
+# The DNA renderer
+###############################################################################
+
+# Layout rules (see dnalayout) matching the built-in part renderers
+PART_LAYOUT_RULES = {
+	sbol_promoter                  : dnalayout.SBOL_LAYOUT_RULES['Promoter'],
+	sbol_cds                       : dnalayout.SBOL_LAYOUT_RULES['CDS'],
+	sbol_terminator                : dnalayout.SBOL_LAYOUT_RULES['Terminator'],
+	sbol_rbs                       : dnalayout.SBOL_LAYOUT_RULES['RBS'],
+	sbol_scar                      : dnalayout.SBOL_LAYOUT_RULES['Scar'],
+	sbol_spacer                    : dnalayout.SBOL_LAYOUT_RULES['Spacer'],
+	sbol_empty_space               : dnalayout.SBOL_LAYOUT_RULES['EmptySpace'],
+	sbol_ribozyme                  : dnalayout.SBOL_LAYOUT_RULES['Ribozyme'],
+	sbol_ribonuclease              : dnalayout.SBOL_LAYOUT_RULES['Ribonuclease'],
+	sbol_protein_stability         : dnalayout.SBOL_LAYOUT_RULES['ProteinStability'],
+	sbol_protease                  : dnalayout.SBOL_LAYOUT_RULES['Protease'],
+	stick_figure                   : dnalayout.SBOL_LAYOUT_RULES['Ribozyme'],
+	sbol_operator                  : dnalayout.SBOL_LAYOUT_RULES['Operator'],
+	sbol_origin                    : dnalayout.SBOL_LAYOUT_RULES['Origin'],
+	sbol_insulator                 : dnalayout.SBOL_LAYOUT_RULES['Insulator'],
+	sbol_5_overhang                : dnalayout.SBOL_LAYOUT_RULES['5Overhang'],
+	sbol_3_overhang                : dnalayout.SBOL_LAYOUT_RULES['3Overhang'],
+	sbol_restriction_site          : dnalayout.SBOL_LAYOUT_RULES['RestrictionSite'],
+	sbol_blunt_restriction_site    : dnalayout.SBOL_LAYOUT_RULES['BluntRestrictionSite'],
+	sbol_primer_binding_site       : dnalayout.SBOL_LAYOUT_RULES['PrimerBindingSite'],
+	sbol_5_sticky_restriction_site : dnalayout.SBOL_LAYOUT_RULES['5StickyRestrictionSite'],
+	sbol_3_sticky_restriction_site : dnalayout.SBOL_LAYOUT_RULES['3StickyRestrictionSite'],
+	sbol_user_defined              : dnalayout.SBOL_LAYOUT_RULES['UserDefined'],
+	sbol_signature                 : dnalayout.SBOL_LAYOUT_RULES['Signature'],
+	trace_promoter                 : dnalayout.TRACE_LAYOUT_RULES['Promoter'],
+	trace_cds                      : dnalayout.TRACE_LAYOUT_RULES['CDS'],
+	trace_terminator               : dnalayout.TRACE_LAYOUT_RULES['Terminator'],
+	trace_rbs                      : dnalayout.TRACE_LAYOUT_RULES['RBS']}
+
+class DNARenderer:
+	""" Class defining the DNA rendering funtionality.
+	"""
+
+	# Standard part types
+	STD_PART_TYPES = ['Promoter',
+	                  'CDS',
+                      'Terminator',
+                      'RBS',
+                      'Scar',
+                      'Spacer',
+                      'Ribozyme',
+                      'Ribonuclease',
+                      'ProteinStability',
+                      'Protease',
+                      'Operator',
+                      'Origin',
+                      'Insulator']
+
+	# Standard regulatory types
+	STD_REG_TYPES = ['Repression',
+	                 'Activation']
+
+	def __init__(self, scale=1.0, linewidth=1.0, 
+		         backbone_pad_left=0.0, backbone_pad_right=0.0,
+		         batch_artists=False, glyph_cache=None, profiler=None):
+		""" Constructor to generate an empty DNARenderer.
+
+		Parameters
+	    ----------
+	    scale : float (default=1.0)
+	        A scaling factor for the plot. Only used if rendering traces.
+
+	    linewidth : float (default=1.0)
+	    	The default linewidth for all part drawing.
+
+	    backbone_pad_left : float (default=0.0)
+	    	Padding to add to the left side of the backbone.
+
+	    backbone_pad_right : float (default=0.0)
+	    	Padding to add to the left side of the backbone.
+
+	    batch_artists : bool (default=False)
+	    	Collect the output of all renderers in an ArtistBatch and add it to 
+	    	the axis as a few collections rather than as individual artists.
+
+	    glyph_cache : GlyphCache (default=None)
+	    	Cache used to draw parts with the built-in SBOL renderers (not used if
+	    	None). Share one between renderers to reuse glyphs across designs.
+
+	    profiler : Profiler (default=None)
+	    	Profiler recording the time taken by renderDNA, each part renderer 
+	    	and the regulation arcs (nothing is timed if None).
+		"""
+		self.scale = scale
+		self.linewidth = linewidth
+		self.backbone_pad_left = backbone_pad_left
+		self.backbone_pad_right = backbone_pad_right
+		self.batch_artists = batch_artists
+		self.glyph_cache = glyph_cache
+		self.profiler = profiler
+		self.reg_height = 15
+
+	def SBOL_part_renderers (self):
+		""" Return dictionary of all standard built-in SBOL part renderers.
+		"""
+		return {
+			'Promoter'         :sbol_promoter, 
+			'CDS'              :sbol_cds, 
+			'Terminator'       :sbol_terminator,
+			'RBS'              :sbol_rbs,
+			'Scar'             :sbol_scar,
+			'Spacer'	       :sbol_spacer,
+			'EmptySpace'	   :sbol_empty_space,
+			'Ribozyme'         :sbol_ribozyme,
+			'Ribonuclease'     :sbol_ribonuclease,
+			'ProteinStability' :sbol_protein_stability,
+			'Protease'         :sbol_protease,
+			'Operator'         :sbol_operator,
+			'Origin'           :sbol_origin,
+			'Insulator'        :sbol_insulator,
+			'5Overhang'        :sbol_5_overhang,
+			'3Overhang'        :sbol_3_overhang,
+			'RestrictionSite'  :sbol_restriction_site,
+			'BluntRestrictionSite'   :sbol_blunt_restriction_site,
+			'PrimerBindingSite'      :sbol_primer_binding_site,
+			'5StickyRestrictionSite' :sbol_5_sticky_restriction_site,
+			'3StickyRestrictionSite' :sbol_3_sticky_restriction_site,
+			'UserDefined'      :sbol_user_defined,
+			'Signature'        :sbol_signature}
+
+	def trace_part_renderers (self):
+		""" Return dictionary of all standard built-in trace part renderers.
+		"""
+		return {
+			'Promoter'         :trace_promoter, 
+			'CDS'              :trace_cds, 
+			'Terminator'       :trace_terminator,
+			'RBS'              :trace_rbs} 
+
+	def std_reg_renderers (self):
+		""" Return dictionary of all standard built-in regulation renderers.
+		"""
+		return {
+			'Repression' :repress, 
+			'Activation' :induce}
+
+	def layout (self, parts, part_renderers, regs=None, reg_renderers=None):
+		""" Compute the layout of a design without drawing it. Parts drawn by 
+		    custom renderers (without a layout rule) are not placed.
+
+	    Returns
+	    -------
+	    layout : dnalayout.DesignLayout
+	    	Positions of the parts and routing of the regulation arcs.
+		"""
+		rules = {}
+		for part_type in part_renderers.keys():
+			if part_renderers[part_type] in PART_LAYOUT_RULES.keys():
+				rules[part_type] = PART_LAYOUT_RULES[part_renderers[part_type]]
+		reg_types = None
+		if reg_renderers != None:
+			reg_types = reg_renderers.keys()
+		return dnalayout.layout_design(parts, regs, self.linewidth, 
+			                           self.backbone_pad_left, self.backbone_pad_right,
+			                           rules, reg_types)
+
+	def renderDNA(self, ax, parts, part_renderers, regs=None, reg_renderers=None,
+		          viewport=None, lod=None):
+		""" Render the parts on the DNA and regulation. The parts, regulation and
+		    matplotlib defaults are left unchanged, so designs can be shared and
+		    rendered to separate figures concurrently.
+
+		    When only a window of a long design is shown, parts and regulation 
+		    outside the viewport are skipped (they are still placed, so the rest
+		    of the design is drawn where it would be without a viewport). Parts 
+		    without a layout rule are always drawn, as their extent is only known
+		    once drawn.
+
+		Parameters
+	    ----------
+	    ax : matplotlib.axes
+	        Axes to draw the design to.
+
+	    parts : list(dict) or CompactDesign
+	    	The design to draw. This is a list of dicts, where each dict relates to
+	    	a part and must contain the following keys:
+	    	- name (string)
+	    	- type (string)  
+	    	- fwd (bool)
+	    	These will then be drawn in accordance with the renders selected
+
+	    part_renderers : dict(functions)
+	    	Dict of functions where the key in the part type and the dictionary returns
+	    	the function to be used to draw that part type.
+
+	    regs : list(dict) (default=None)
+	    	Regulation present in the design. This is a list of dicts, where each dict
+	    	relates to a single regulation arc and must contain the following keys:
+	    	- type (string)
+	    	- from_part (dict, or int index of the part in the design)  
+	    	- to_part (dict, or int index of the part in the design)
+	    	These will then be drawn in accordance with the renders selected.
+
+	    reg_renderers : dict(functions) (default=None)
+	    	Dict of functions where the key in the regulation type and the dictionary 
+	    	returns the function to be used to draw that regulation type.
+
+	    viewport : tuple(float) (default=None)
+	    	x-range (x_min, x_max) that will be shown. Everything is drawn if None.
+
+	    lod : LevelOfDetail (default=None)
+	    	Policy for collapsing parts and omitting labels too small to see at 
+	    	the scale drawn. Everything is drawn in full if None.
+
+	    Returns
+	    -------
+	    start : float
+	    	The x-point in the axis space that drawing begins.
+
+	    end : float
+	    	The x-point in the axis space that drawing ends.
+		"""
+		profiler = self.profiler
+		if profiler != None:
+			render_start = time.time()
+		pixel_scale = None
+		if lod != None:
+			pixel_scale = lod.pixel_scale(ax, viewport)
+		# Lines are styled as they are added (rather than by changing the 
+		# matplotlib defaults) and renderers draw to a batch when requested
+		batch = None
+		if self.batch_artists and not isinstance(ax, ArtistBatch):
+			batch = ArtistBatch(ax)
+			ax = batch
+		elif not isinstance(ax, ArtistBatch):
+			ax = StyledAxis(ax)
+		# Plot the parts to the axis at the positions given by their layout (parts
+		# with custom renderers are placed using the extents returned when drawn).
+		# Parts are read as records (so no part dicts are built for a CompactDesign)
+		# and only regulated parts are copied, so the regulation renderers are 
+		# given their drawn start and end and the design itself is left unchanged.
+		layout = dnalayout.DesignLayout(self.linewidth, self.backbone_pad_left, 
+			                            self.backbone_pad_right)
+		reg_keys = set()
+		if regs != None:
+			for reg in regs:
+				for ref in [reg.get('from_part'), reg.get('to_part')]:
+					if ref != None:
+						reg_keys.add(dnadesign.part_key(parts, ref))
+		drawn_parts = {}
+		# Extent of the run of collapsed parts being built up
+		block = None
+		part_num = 0
+		for record in dnadesign.part_records(parts):
+			key, part_type, name, fwd, start, end, part_opts, extra = record
+			# Check the part has minimal details required
+			if part_type != None:
+				start, end = layout.record_direction(part_num, record)
+				drawn_part = None
+				if key in reg_keys:
+					drawn_part = dict(parts[part_num])
+					if fwd == None:
+						drawn_part['fwd'] = 'True'
+					drawn_part['start'] = start
+					drawn_part['end'] = end
+				renderer = self.record_renderer(record, part_renderers)
+				if renderer != None:
+					prev_end = layout.end
+					if renderer in PART_LAYOUT_RULES:
+						placed = layout.place_record(part_num, record, PART_LAYOUT_RULES[renderer])
+						width = placed.extent_end-placed.extent_start
+						if viewport != None and (placed.extent_end < viewport[0] or 
+							                     placed.extent_start > viewport[1]):
+							# Outside the viewport
+							if block != None:
+								lod.draw_block(ax, block)
+								block = None
+						elif pixel_scale != None and width*pixel_scale < lod.min_part_pixels:
+							# Too small to see, so added to the current block
+							if block == None:
+								block = [placed.extent_start, placed.extent_end, 
+								         placed.y_min, placed.y_max]
+							else:
+								block[1] = max(block[1], placed.extent_end)
+								block[2] = min(block[2], placed.y_min)
+								block[3] = max(block[3], placed.y_max)
+						else:
+							if block != None:
+								lod.draw_block(ax, block)
+								block = None
+							if (pixel_scale != None and part_opts != None and 'label' in part_opts
+								and width*pixel_scale < lod.min_label_pixels):
+								part_opts = dict(part_opts)
+								del part_opts['label']
+							if profiler != None:
+								part_start = time.time()
+							self.render_part(ax, renderer, part_type, part_num, start, end,
+								             prev_end, part_opts)
+							if profiler != None:
+								profiler.add(getattr(renderer, '__name__', part_type),
+									         part_start, 'renderer')
+					else:
+						if block != None:
+							lod.draw_block(ax, block)
+							block = None
+						if profiler != None:
+							part_start = time.time()
+						prev_start, prev_end = renderer(ax, part_type, part_num, 
+							             start, end, prev_end, self.scale, 
+							             self.linewidth, opts=part_opts)
+						if profiler != None:
+							profiler.add(getattr(renderer, '__name__', part_type),
+								         part_start, 'renderer')
+						placed = layout.add_record(part_num, record, prev_start, prev_end)
+
+					#update start,end for regulation
+					if drawn_part != None:
+						drawn_part['start'] = placed.extent_start
+						drawn_part['end'] = placed.extent_end
+				if drawn_part != None:
+					drawn_parts[key] = drawn_part
+			part_num += 1
+		if block != None:
+			lod.draw_block(ax, block)
+		
+		# Plot the regulation arcs (shortest first and stacked so they do not clash)
+		if regs != None:
+			if profiler != None:
+				arcs_start = time.time()
+			for arc in layout.place_arcs(regs, reg_renderers.keys(), drawn_parts, parts):
+				if viewport != None and (max(arc.start, arc.end) < viewport[0] or 
+					                     min(arc.start, arc.end) > viewport[1]):
+					continue
+				reg = arc.reg
+				# Extract custom regulation options (if available)
+				reg_opts = None
+				if 'opts' in reg.keys():
+					reg_opts = reg['opts']
+				from_part = drawn_parts[dnadesign.part_key(parts, reg['from_part'])]
+				to_part = drawn_parts[dnadesign.part_key(parts, reg['to_part'])]
+				reg_renderers[reg['type']](ax, reg['type'], arc.index, from_part,
+					                       to_part, self.scale, self.linewidth, 
+					                       arc.height_index, opts=reg_opts)
+			if profiler != None:
+				profiler.add('arcs', arcs_start)
+		# Plot the backbone (z=1)
+		backbone_start, backbone_end = layout.backbone()
+		l1 = Line2D([backbone_start,backbone_end],[0,0], 
+			        linewidth=self.linewidth, color=(0,0,0), zorder=10)
+		ax.add_line(l1)
+		if batch != None:
+			batch.flush()
+		if profiler != None:
+			profiler.add('renderDNA', render_start)
+		return layout.start, layout.end
+
+	def part_renderer(self, part, part_renderers):
+		""" Renderer of a part (custom, or standard if one exists, else None).
+		"""
+		if 'renderer' in part.keys():
+			return part['renderer']
+		return part_renderers.get(part['type'])
+
+	def record_renderer(self, record, part_renderers):
+		""" Renderer of a part given as a record (see dnadesign.part_records).
+		"""
+		extra = record[7]
+		if extra != None and 'renderer' in extra:
+			return extra['renderer']
+		return part_renderers.get(record[1])
+
+	def render_editable(self, ax, parts, part_renderers, regs=None, reg_renderers=None):
+		""" Render a design and return a DesignHandle, which keeps the artists of
+		    each part and regulation arc so the design can then be edited in place.
+		    Artists are added to the axis individually (i.e., not batched).
+		"""
+		return DesignHandle(self, ax, parts, part_renderers, regs, reg_renderers)
+
+	def render_part(self, ax, renderer, part_type, part_num, start, end, prev_end, opts):
+		""" Draw a part with a built-in renderer (using the glyph cache if set).
+		"""
+		if self.glyph_cache != None and self.glyph_cache.cacheable(renderer):
+			self.glyph_cache.draw(ax, renderer, part_type, start, end, prev_end, 
+				                  self.scale, self.linewidth, opts)
+		else:
+			renderer(ax, part_type, part_num, start, end, prev_end, self.scale, 
+				     self.linewidth, opts=opts)
+
+###############################################################################
+# Editable designs
+###############################################################################
+
+class ArtistRecorder:
+	""" Stands in for an axis in renderer calls. Artists are added to the axis 
+	    (in the dnaplotlib line style) with an offset transform in front of the
+	    data transform, and recorded so they can later be moved or removed.
+	"""
+
+	def __init__(self, ax):
+		self.ax = ax
+		self.artists = []
+		self.offset = None
+
+	def __getattr__(self, name):
+		return getattr(self.ax, name)
+
+	def start(self, offset=None):
+		""" Begin recording a new set of artists (drawn through offset, an 
+		    Affine2D, if given).
+		"""
+		self.artists = []
+		self.offset = offset
+
+	def record(self, artist):
+		if self.offset != None:
+			artist.set_transform(self.offset + self.ax.transData)
+		self.artists.append(artist)
+		return artist
+
+	def add_line(self, line):
+		style_line(line)
+		self.record(line)
+		return self.ax.add_line(line)
+
+	def add_patch(self, patch):
+		self.record(patch)
+		return self.ax.add_patch(patch)
+
+	def add_artist(self, artist):
+		self.record(artist)
+		return self.ax.add_artist(artist)
+
+	def text(self, x, y, s, **kwargs):
+		return self.record(self.ax.text(x, y, s, **kwargs))
+
+class DrawnPart:
+	""" Artists drawn for a part (or regulation arc) of a DesignHandle and where
+	    they were drawn.
+
+	    - artists: artists added to the axis for the part.
+	    - offset: Affine2D the artists are drawn through (moves them along x).
+	    - drawn_start: extent start of the part when its artists were created.
+	    - rel_start, rel_end: extent of a part drawn by a custom renderer, 
+	      relative to the end of the previous part.
+	"""
+
+	def __init__(self, artists, offset, drawn_start, rel_start=None, rel_end=None):
+		self.artists = artists
+		self.offset = offset
+		self.drawn_start = drawn_start
+		self.rel_start = rel_start
+		self.rel_end = rel_end
+
+class DesignHandle:
+	""" Design drawn to an axis that can be edited in place. Parts can be 
+	    updated, inserted and removed, after which only the artists of the 
+	    edited parts are redrawn. Parts downstream of an edit are moved by 
+	    shifting their offset transforms, and only regulation arcs whose
+	    routing has changed are redrawn. Regulation linked to a replaced part
+	    follows it, and regulation linked to a removed part is removed.
+
+	    Parts drawn by custom renderers (without a layout rule) are assumed to
+	    be drawn relative to the end of the previous part.
+
+	    >  handle = dr.render_editable(ax, design, part_renderers, regs, reg_renderers)
+	    >  handle.update(2, {'type':'CDS', 'fwd':True, 'opts':{'color':(1,0,0)}})
+	    >  handle.insert(0, {'type':'Promoter', 'fwd':True})
+	    >  handle.remove(5)
+	    >  ax.set_xlim([handle.start, handle.end])
+	    >  fig.canvas.draw_idle()
+	"""
+
+	def __init__(self, dr, ax, parts, part_renderers, regs=None, reg_renderers=None):
+		""" Constructor to draw a design (see DNARenderer.renderDNA() for the 
+		    parameters). The design and regulation are left unchanged.
+		"""
+		parts, regs = dnadesign.resolve_design(parts, regs)
+		self.dr = dr
+		self.ax = ax
+		self.recorder = ArtistRecorder(ax)
+		self.part_renderers = part_renderers
+		self.reg_renderers = reg_renderers
+		self.parts = list(parts)
+		self.regs = []
+		if regs != None:
+			self.regs = list(regs)
+		self.drawn = [None for part in self.parts]
+		self.arcs = {}
+		self.backbone_line = None
+		self.layout = None
+		self.refresh()
+
+	@property
+	def start(self):
+		""" The x-point in the axis space that drawing begins.
+		"""
+		return self.layout.start
+
+	@property
+	def end(self):
+		""" The x-point in the axis space that drawing ends.
+		"""
+		return self.layout.end
+
+	def remove_artists(self, artists):
+		for artist in artists:
+			artist.remove()
+
+	def move(self, offset, shift):
+		""" Set the x-shift of an offset transform (if it has changed).
+		"""
+		import numpy as np
+		if shift != offset.get_matrix()[0,2]:
+			offset.set_matrix(np.array([[1.0, 0.0, shift], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]))
+
+	def update(self, index, part):
+		""" Replace the part at index (regulation of the old part moves to it).
+		"""
+		old_part = self.parts[index]
+		self.parts[index] = part
+		for i in range(len(self.regs)):
+			orig = self.regs[i]
+			reg = orig
+			for k in ['from_part', 'to_part']:
+				if k in reg.keys() and reg[k] is old_part:
+					# Copied once, so the caller's regulation is left unchanged
+					if reg is orig:
+						reg = dict(orig)
+						self.regs[i] = reg
+					reg[k] = part
+		if self.drawn[index] != None:
+			self.remove_artists(self.drawn[index].artists)
+			self.drawn[index] = None
+		self.refresh()
+
+	def insert(self, index, part):
+		""" Insert a part before index (at the end if index is len(parts)).
+		"""
+		self.parts.insert(index, part)
+		self.drawn.insert(index, None)
+		self.refresh()
+
+	def remove(self, index):
+		""" Remove the part at index and any regulation linked to it.
+		"""
+		part = self.parts.pop(index)
+		drawn = self.drawn.pop(index)
+		if drawn != None:
+			self.remove_artists(drawn.artists)
+		regs = []
+		for reg in self.regs:
+			if ('from_part' in reg.keys() and reg['from_part'] is part) or \
+			   ('to_part' in reg.keys() and reg['to_part'] is part):
+				continue
+			regs.append(reg)
+		self.regs = regs
+		self.refresh()
+
+	def set_regulation(self, regs):
+		""" Replace the regulation (arcs that are unchanged are not redrawn).
+		"""
+		self.regs = []
+		if regs != None:
+			self.regs = list(regs)
+		self.refresh()
+
+	def refresh(self):
+		""" Lay out the design, drawing parts without artists and moving the 
+		    rest to their new positions, then update the regulation and backbone.
+		"""
+		dr = self.dr
+		layout = dnalayout.DesignLayout(dr.linewidth, dr.backbone_pad_left, 
+			                            dr.backbone_pad_right)
+		drawn_parts = {}
+		for part_num in range(len(self.parts)):
+			part = self.parts[part_num]
+			keys = part.keys()
+			if 'type' not in keys:
+				continue
+			drawn_part = dict(part)
+			if 'fwd' not in keys:
+				drawn_part['fwd'] = 'True'
+			start, end = layout.part_direction(part_num, part)
+			drawn_part['start'] = start
+			drawn_part['end'] = end
+			part_opts = None
+			if 'opts' in keys:
+				part_opts = part['opts']
+			renderer = dr.part_renderer(part, self.part_renderers)
+			if renderer != None:
+				prev_end = layout.end
+				drawn = self.drawn[part_num]
+				if drawn == None:
+					self.recorder.start(Affine2D())
+				if renderer in PART_LAYOUT_RULES.keys():
+					placed = layout.place_part(part_num, part, PART_LAYOUT_RULES[renderer])
+					if drawn == None:
+						dr.render_part(self.recorder, renderer, part['type'], part_num, 
+							           start, end, prev_end, part_opts)
+						drawn = DrawnPart(self.recorder.artists, self.recorder.offset,
+							              placed.extent_start)
+				else:
+					if drawn == None:
+						prev_start, part_end = renderer(self.recorder, part['type'], 
+							                   part_num, start, end, prev_end, dr.scale, 
+							                   dr.linewidth, opts=part_opts)
+						drawn = DrawnPart(self.recorder.artists, self.recorder.offset,
+							              prev_start, prev_start-prev_end, part_end-prev_end)
+					placed = layout.add_part(part_num, part, prev_end+drawn.rel_start, 
+						                     prev_end+drawn.rel_end)
+				if self.drawn[part_num] == None:
+					self.drawn[part_num] = drawn
+				else:
+					# Move the existing artists to the new position of the part
+					self.move(drawn.offset, placed.extent_start-drawn.drawn_start)
+				drawn_part['start'] = placed.extent_start
+				drawn_part['end'] = placed.extent_end
+			drawn_parts[id(part)] = drawn_part
+		self.layout = layout
+		self.refresh_arcs(drawn_parts)
+		backbone_start, backbone_end = layout.backbone()
+		if self.backbone_line == None:
+			self.backbone_line = Line2D([backbone_start,backbone_end],[0,0], 
+			                            linewidth=dr.linewidth, color=(0,0,0), zorder=10)
+			self.ax.add_line(style_line(self.backbone_line))
+		else:
+			self.backbone_line.set_xdata([backbone_start,backbone_end])
+
+	def refresh_arcs(self, drawn_parts):
+		""" Redraw the regulation arcs whose routing has changed and move those
+		    that have only been shifted along with their parts.
+		"""
+		arcs = {}
+		if self.reg_renderers != None:
+			for arc in self.layout.place_arcs(self.regs, self.reg_renderers.keys(),
+			                                  drawn_parts):
+				reg = arc.reg
+				from_part = drawn_parts.get(id(reg['from_part']), reg['from_part'])
+				to_part = drawn_parts.get(id(reg['to_part']), reg['to_part'])
+				# Shape of the arc relative to the start of the part it leaves
+				x = from_part['start']
+				key = (from_part['end']-x, to_part['start']-x, to_part['end']-x, 
+					   to_part.get('fwd'), arc.height_index)
+				if id(reg) in self.arcs and self.arcs[id(reg)][0] == key:
+					drawn = self.arcs.pop(id(reg))
+					self.move(drawn[1].offset, x-drawn[1].drawn_start)
+					arcs[id(reg)] = drawn
+					continue
+				reg_opts = None
+				if 'opts' in reg.keys():
+					reg_opts = reg['opts']
+				self.recorder.start(Affine2D())
+				self.reg_renderers[reg['type']](self.recorder, reg['type'], arc.index, 
+					                            from_part, to_part, self.dr.scale, 
+					                            self.dr.linewidth, arc.height_index, 
+					                            opts=reg_opts)
+				# Regulation is held so its id is not reused while drawn
+				arcs[id(reg)] = (key, DrawnPart(self.recorder.artists, self.recorder.offset,
+					                            x), reg)
+		for key, drawn, reg in self.arcs.values():
+			self.remove_artists(drawn.artists)
+		self.arcs = arcs
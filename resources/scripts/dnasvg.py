@@ -0,0 +1,532 @@
+#!/usr/bin/env python
+"""
+dnasvg
+======
+    This module renders DNA designs directly to SVG without matplotlib. Part
+    positions come from dnalayout and each distinct glyph (part type,
+    orientation and style) is defined once as a <symbol> and placed with <use>,
+    so documents holding many designs stay small and are quick to generate.
+
+    Designs, regulation and part options use the same format as dnaplotlib and
+    the part types are those of DNARenderer.SBOL_part_renderers():
+
+    >  import dnasvg
+    >  sr = dnasvg.SVGRenderer(linewidth=1.0)
+    >  doc = dnasvg.SVGDocument()
+    >  start, end = sr.renderDNA(doc, design, regs)
+    >  doc.save('out.svg')
+
+    Each call to renderDNA() adds the design as a new row below the previous
+    ones. Hatching is not supported.
+"""
+#    dnasvg
+#    Copyright (C) 2014 by
+#    Thomas E. Gorochowski <tom@chofski.co.uk>
+#    Emerson Glassey <eglassey@mit.edu>
+#    Bryan Der <bder@mit.edu>
+#    All rights reserved.
+#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
+
+import dnadesign
+import dnalayout
+import math
+
+__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
+               Emerson Glassey <eglassey@mit.edu>, Voigt Lab, MIT\n\
+               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
+__license__ = 'OSI Non-Profit OSL 3.0'
+__version__ = '1.0'
+
+# Drawing units per point for line widths and font sizes (plot_SBOL_designs
+# sizes figures at 70 drawing units per inch)
+UNITS_PER_POINT = 70.0/72.0
+
+# Line dash patterns (in multiples of the line width, as used by matplotlib)
+DASH_PATTERNS = {'--' : (3.7, 1.6),
+                 ':'  : (1.0, 1.65),
+                 '-.' : (6.4, 1.6, 1.0, 1.6)}
+
+###############################################################################
+# SVG primitives
+###############################################################################
+
+def svg_num (x):
+	""" Compact string for a coordinate.
+	"""
+	s = '%.3f' % x
+	s = s.rstrip('0').rstrip('.')
+	if s == '-0':
+		return '0'
+	return s
+
+def svg_color (color):
+	""" SVG colour for a matplotlib style colour (RGB tuple or name).
+	"""
+	if isinstance(color, str):
+		return color
+	return '#%02x%02x%02x' % tuple([int(round(255*min(max(c, 0.0), 1.0))) for c in color[0:3]])
+
+def svg_stroke (color, linewidth, linestyle='-', capstyle='square'):
+	""" Stroke attributes for a line.
+	"""
+	lw = linewidth*UNITS_PER_POINT
+	attribs = ' stroke="%s" stroke-width="%s" stroke-linejoin="miter"' % (svg_color(color), svg_num(lw))
+	if linestyle in DASH_PATTERNS.keys():
+		dashes = ','.join([svg_num(d*lw) for d in DASH_PATTERNS[linestyle]])
+		attribs += ' stroke-dasharray="%s" stroke-linecap="butt"' % dashes
+	else:
+		attribs += ' stroke-linecap="%s"' % capstyle
+	return attribs
+
+def svg_line (x1, y1, x2, y2, color, linewidth, linestyle='-'):
+	return '<line x1="%s" y1="%s" x2="%s" y2="%s"%s/>' % (svg_num(x1), svg_num(y1),
+		   svg_num(x2), svg_num(y2), svg_stroke(color, linewidth, linestyle))
+
+def svg_polyline (points, color, linewidth, linestyle='-'):
+	pts = ' '.join(['%s,%s' % (svg_num(x), svg_num(y)) for x, y in points])
+	return '<polyline points="%s" fill="none"%s/>' % (pts, svg_stroke(color, linewidth, linestyle))
+
+def svg_polygon (points, facecolor, edgecolor, linewidth, closed=True):
+	pts = ' '.join(['%s,%s' % (svg_num(x), svg_num(y)) for x, y in points])
+	element = 'polygon'
+	if closed == False:
+		element = 'polyline'
+	return '<%s points="%s" fill="%s"%s/>' % (element, pts, svg_color(facecolor),
+		   svg_stroke(edgecolor, linewidth, capstyle='butt'))
+
+def svg_circle (cx, cy, r, facecolor, edgecolor, linewidth):
+	return '<circle cx="%s" cy="%s" r="%s" fill="%s"%s/>' % (svg_num(cx), svg_num(cy),
+		   svg_num(r), svg_color(facecolor), svg_stroke(edgecolor, linewidth, capstyle='butt'))
+
+def svg_half_disc (cx, cy, r, facecolor):
+	""" Upper half of a disc without an edge (as drawn for an RBS).
+	"""
+	return '<path d="M%s,%s A%s,%s 0 0 0 %s,%s Z" fill="%s"/>' % (svg_num(cx-r),
+		   svg_num(cy), svg_num(r), svg_num(r), svg_num(cx+r), svg_num(cy),
+		   svg_color(facecolor))
+
+###############################################################################
+# SBOL glyphs
+###############################################################################
+
+# Style defaults of each part type (as used by the dnaplotlib SBOL renderers)
+GLYPH_DEFAULTS = {
+	'Promoter'         : {'color':(0.0,0.0,0.0), 'x_extent':10.0, 'y_extent':10.0,
+	                      'arrowhead_height':2.0, 'arrowhead_length':4.0},
+	'CDS'              : {'color':(0.7,0.7,0.7), 'x_extent':30.0, 'y_extent':5.0,
+	                      'arrowhead_height':4.0, 'arrowhead_length':8.0},
+	'Terminator'       : {'color':(0.0,0.0,0.0), 'x_extent':8.0, 'y_extent':10.0},
+	'RBS'              : {'color':(0.7,0.7,0.7), 'x_extent':10.0},
+	'Scar'             : {'color':(0.0,0.0,0.0), 'x_extent':6.0, 'y_extent':1.0, 'linestyle':'-'},
+	'Spacer'           : {'color':(0.0,0.0,0.0), 'x_extent':6.0, 'linestyle':'-'},
+	'EmptySpace'       : {'x_extent':12.0},
+	'Ribozyme'         : {'color':(0.0,0.0,0.0), 'x_extent':5.0, 'y_extent':10.0, 'linestyle':'-'},
+	'Ribonuclease'     : {'color':(0.0,0.0,0.0), 'x_extent':5.0, 'y_extent':10.0, 'linestyle':'-'},
+	'ProteinStability' : {'color':(0.0,0.0,0.0), 'x_extent':5.0, 'y_extent':10.0, 'linestyle':'-'},
+	'Protease'         : {'color':(0.0,0.0,0.0), 'x_extent':5.0, 'y_extent':10.0, 'linestyle':'-'},
+	'Operator'         : {'x_extent':6.0, 'y_extent':3.0},
+	'Origin'           : {'color':(0.0,0.0,0.0), 'x_extent':10.0},
+	'Insulator'        : {'x_extent':8.0, 'y_extent':4.0},
+	'5Overhang'        : {'color':(0.0,0.0,0.0), 'x_extent':6.0, 'y_extent':1.0, 'linestyle':'-'},
+	'3Overhang'        : {'color':(0.0,0.0,0.0), 'x_extent':6.0, 'y_extent':1.0, 'linestyle':'-'},
+	'RestrictionSite'  : {'color':(0.0,0.0,0.0), 'y_extent':4.0, 'linestyle':'-'},
+	'BluntRestrictionSite'   : {'color':(0.0,0.0,0.0), 'x_extent':1.5, 'site_space':1.5,
+	                            'y_extent':4.0, 'linestyle':'-'},
+	'PrimerBindingSite'      : {'color':(0.0,0.0,0.0), 'x_extent':8.0, 'y_extent':2.0,
+	                            'y_offset':1.5, 'arrowhead_length':2.0},
+	'5StickyRestrictionSite' : {'color':(0.0,0.0,0.0), 'x_extent':8.0, 'end_space':1.0,
+	                            'y_extent':4.0, 'linestyle':'-'},
+	'3StickyRestrictionSite' : {'color':(0.0,0.0,0.0), 'x_extent':8.0, 'end_space':1.0,
+	                            'y_extent':4.0, 'linestyle':'-'},
+	'UserDefined'      : {'color':(0.0,0.0,0.0), 'x_extent':12.0, 'y_extent':3.0},
+	'Signature'        : {'color':(0.0,0.0,0.0), 'fill_color':(1.0,1.0,1.0), 'x_extent':12.0,
+	                      'y_extent':3.0, 'linestyle':'-'}}
+
+# Layer each glyph is drawn in relative to the backbone (matching the zorder
+# of the matplotlib renderers): 'under' is drawn before the backbone
+UNDER_BACKBONE = ['Promoter', 'Terminator', 'RBS', 'Ribozyme', 'Ribonuclease',
+                  'ProteinStability', 'Protease']
+
+WHITE = (1.0,1.0,1.0)
+BLACK = (0.0,0.0,0.0)
+
+def glyph_style (part_type, opts, linewidth):
+	""" Resolve the style of a glyph from its defaults and the part options.
+	"""
+	style = dict(GLYPH_DEFAULTS[part_type])
+	style['linewidth'] = linewidth
+	if opts != None:
+		for k in style.keys():
+			if k in opts.keys():
+				style[k] = opts[k]
+	return style
+
+def glyph_elements (part_type, s):
+	""" SVG elements of a glyph in the forward orientation, with the glyph start
+	    at the origin and y pointing up.
+	"""
+	lw = s['linewidth']
+	els = []
+	if part_type == 'Promoter':
+		x, y = s['x_extent'], s['y_extent']
+		ahl, ahh = s['arrowhead_length'], s['arrowhead_height']
+		els.append(svg_line(0, 0, 0, y, s['color'], lw))
+		els.append(svg_line(0, y, x-(ahl*0.5), x, s['color'], lw))
+		els.append(svg_polygon([(x-ahl, y+ahh), (x, y), (x-ahl, y-ahh)], s['color'], s['color'], lw))
+	elif part_type == 'CDS':
+		x, y = s['x_extent'], s['y_extent']
+		ahl, ahh = s['arrowhead_length'], s['arrowhead_height']
+		els.append(svg_polygon([(0, y), (0, -y), (x-ahl, -y), (x-ahl, -y-ahh), (x, 0),
+			                    (x-ahl, y+ahh), (x-ahl, y)], s['color'], BLACK, lw))
+	elif part_type == 'Terminator':
+		x, y = s['x_extent'], s['y_extent']
+		els.append(svg_line(x/2.0, 0, x/2.0, y, s['color'], lw))
+		els.append(svg_line(0, y, x, y, s['color'], lw))
+	elif part_type == 'RBS':
+		x = s['x_extent']
+		els.append(svg_half_disc(x/2.0, 0, x/2.0, s['color']))
+	elif part_type in ['Ribozyme', 'Ribonuclease', 'ProteinStability', 'Protease']:
+		x, y, c, ls = s['x_extent'], s['y_extent'], s['color'], s['linestyle']
+		cx = x/2.0
+		if part_type in ['Ribozyme', 'Protease']:
+			els.append(svg_line(cx, 0, cx, y/4, c, lw, ls))
+			els.append(svg_line(cx, y/2, cx, y-(x/2.0), c, lw, ls))
+		elif part_type == 'ProteinStability':
+			els.append(svg_line(cx, 0, cx, y-(x/2.0), c, lw, ls))
+		else:
+			els.append(svg_line(cx, 0, cx, y, c, lw, ls))
+		if part_type in ['Ribozyme', 'ProteinStability']:
+			els.append(svg_circle(cx, y, x/2.0, WHITE, c, lw))
+		else:
+			els.append(svg_line(0, y*1.25, x, y/1.5, c, lw))
+			els.append(svg_line(0, y/1.5, x, y*1.25, c, lw))
+	elif part_type in ['Scar', '5Overhang', '3Overhang']:
+		x, y, c, ls = s['x_extent'], s['y_extent'], s['color'], s['linestyle']
+		els.append(svg_polygon([(0, y), (0, -y), (x, -y), (x, y)], WHITE, WHITE, lw))
+		els.append(svg_line(0, y, x, y, c, lw, ls))
+		if part_type == 'Scar':
+			els.append(svg_line(0, -y, x, -y, c, lw, ls))
+		elif part_type == '5Overhang':
+			els.append(svg_line(x/2.0, -y, x, -y, c, lw, ls))
+		else:
+			els.append(svg_line(0, -y, x/2.0, -y, c, lw, ls))
+	elif part_type == 'Spacer':
+		x, c, ls = s['x_extent'], s['color'], s['linestyle']
+		r = x/2.0
+		delta = r - 0.5 * r * math.sqrt(2)
+		els.append(svg_circle(r, 0, r, WHITE, c, lw))
+		els.append(svg_line(delta, r-delta, x-delta, -r+delta, c, lw, ls))
+		els.append(svg_line(delta, -r+delta, x-delta, r-delta, c, lw, ls))
+	elif part_type == 'Origin':
+		x = s['x_extent']
+		els.append(svg_circle(x/2.0, 0, x/2.0, WHITE, s['color'], lw))
+	elif part_type in ['Operator', 'UserDefined']:
+		x, y = s['x_extent'], s['y_extent']
+		fill = WHITE
+		if part_type == 'UserDefined':
+			fill = s['color']
+		els.append(svg_polygon([(0, y), (0, -y), (x, -y), (x, y)], fill, BLACK, lw))
+	elif part_type == 'Insulator':
+		x, y = s['x_extent'], s['y_extent']
+		gap = x/5.0
+		els.append(svg_polygon([(0, y), (0, -y), (x, -y), (x, y)], WHITE, BLACK, lw))
+		els.append(svg_polygon([(gap, y-gap), (gap, -y+gap), (4.0*gap, -y+gap),
+			                    (4.0*gap, y-gap)], WHITE, BLACK, lw))
+	elif part_type == 'RestrictionSite':
+		y = s['y_extent']
+		els.append(svg_line(0, -y, 0, y, s['color'], lw, s['linestyle']))
+	elif part_type == 'BluntRestrictionSite':
+		x, y, c, ls = s['x_extent'], s['y_extent'], s['color'], s['linestyle']
+		w = x+s['site_space']+x
+		for x0, x1 in [(0, x), (w, w-x)]:
+			els.append(svg_line(x1, -y, x1, y, c, lw, ls))
+			els.append(svg_line(x0, y, x1, y, c, lw, ls))
+			els.append(svg_line(x0, -y, x1, -y, c, lw, ls))
+	elif part_type in ['5StickyRestrictionSite', '3StickyRestrictionSite']:
+		x, y, c, ls = s['x_extent'], s['y_extent'], s['color'], s['linestyle']
+		e = s['end_space']
+		w = e+x+e
+		els.append(svg_polygon([(0, y), (0, -y), (w, -y), (w, y)], WHITE, WHITE, lw))
+		els.append(svg_line(e, 0, e+x, 0, c, lw, ls))
+		if part_type == '5StickyRestrictionSite':
+			els.append(svg_line(e, 0, e, y, c, lw, ls))
+			els.append(svg_line(e+x, 0, e+x, -y, c, lw, ls))
+		else:
+			els.append(svg_line(e+x, 0, e+x, y, c, lw, ls))
+			els.append(svg_line(e, 0, e, -y, c, lw, ls))
+	elif part_type == 'PrimerBindingSite':
+		x, y, yo = s['x_extent'], s['y_extent'], s['y_offset']
+		els.append(svg_polygon([(0, yo), (x, yo), (x-s['arrowhead_length'], yo+y)],
+			                   WHITE, s['color'], lw, closed=False))
+	elif part_type == 'Signature':
+		x, y, c, ls = s['x_extent'], s['y_extent'], s['color'], s['linestyle']
+		indent = (y*2.0)*0.3
+		cross = (y*2.0)*0.7
+		els.append(svg_polygon([(0, y), (0, -y), (x, -y), (x, y)], s['fill_color'], c, lw))
+		els.append(svg_line(indent, y-indent, cross, -y+indent, c, lw, ls))
+		els.append(svg_line(cross, y-indent, indent, -y+indent, c, lw, ls))
+		els.append(svg_line(cross+indent, -y+indent, x-indent, -y+indent, c, lw, ls))
+	return els
+
+###############################################################################
+# SVG documents
+###############################################################################
+
+class SVGDocument:
+	""" An SVG document holding any number of designs, one per row. Glyphs are
+	    defined once in <defs> and reused by every design in the document.
+	"""
+
+	def __init__(self, row_gap=0.0):
+		""" Constructor to generate an empty SVGDocument.
+
+		Parameters
+	    ----------
+	    row_gap : float (default=0.0)
+	    	Vertical space between rows (in drawing units).
+		"""
+		self.row_gap = row_gap
+		self.symbols = {}
+		self.defs = []
+		self.rows = []
+
+	def symbol (self, key, elements):
+		""" Return the id of the symbol for a glyph, defining it on first use.
+		"""
+		if key not in self.symbols.keys():
+			symbol_id = 'g%d' % len(self.symbols)
+			self.symbols[key] = symbol_id
+			self.defs.append('<symbol id="%s" overflow="visible">%s</symbol>' % (symbol_id,
+				             ''.join(elements)))
+		return self.symbols[key]
+
+	def add_row (self, elements, labels, x_min, y_min, x_max, y_max):
+		""" Add a design drawn in drawing coordinates (y up) with its bounds.
+		"""
+		self.rows.append((elements, labels, x_min, y_min, x_max, y_max))
+
+	def size (self):
+		""" Width and height of the document (in drawing units).
+		"""
+		width = 0.0
+		height = 0.0
+		for row in self.rows:
+			width = max(width, row[4]-row[2])
+			height += row[5]-row[3]
+		height += self.row_gap*max(len(self.rows)-1, 0)
+		return width, height
+
+	def to_string (self):
+		""" The SVG document as a string.
+		"""
+		width, height = self.size()
+		out = ['<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" ' +
+		       'version="1.1" width="%spt" height="%spt" viewBox="0 0 %s %s">' % (svg_num(width/UNITS_PER_POINT),
+		       svg_num(height/UNITS_PER_POINT), svg_num(width), svg_num(height))]
+		if len(self.defs) > 0:
+			out.append('<defs>%s</defs>' % ''.join(self.defs))
+		y = 0.0
+		for elements, labels, x_min, y_min, x_max, y_max in self.rows:
+			# Flip the y-axis so that designs are drawn with y pointing up
+			out.append('<g transform="translate(%s,%s) scale(1,-1)">%s</g>' % (svg_num(-x_min),
+				       svg_num(y+y_max), ''.join(elements)))
+			if len(labels) > 0:
+				out.append('<g transform="translate(%s,%s)">%s</g>' % (svg_num(-x_min),
+					       svg_num(y+y_max), ''.join(labels)))
+			y += (y_max-y_min)+self.row_gap
+		out.append('</svg>')
+		return '\n'.join(out)
+
+	def save (self, filename):
+		""" Write the SVG document to a file.
+		"""
+		f = open(filename, 'w')
+		f.write(self.to_string())
+		f.close()
+
+###############################################################################
+# The SVG renderer
+###############################################################################
+
+class SVGRenderer:
+	""" Renders designs to an SVGDocument using the SBOL glyphs of dnaplotlib.
+	"""
+
+	def __init__(self, scale=1.0, linewidth=1.0,
+		         backbone_pad_left=0.0, backbone_pad_right=0.0):
+		""" Constructor to generate an empty SVGRenderer.
+
+		Parameters
+	    ----------
+	    scale : float (default=1.0)
+	        A scaling factor for the plot (unused, for DNARenderer compatibility).
+
+	    linewidth : float (default=1.0)
+	    	The default linewidth for all part drawing.
+
+	    backbone_pad_left : float (default=0.0)
+	    	Padding to add to the left side of the backbone.
+
+	    backbone_pad_right : float (default=0.0)
+	    	Padding to add to the right side of the backbone.
+		"""
+		self.scale = scale
+		self.linewidth = linewidth
+		self.backbone_pad_left = backbone_pad_left
+		self.backbone_pad_right = backbone_pad_right
+
+	def part_types (self):
+		""" Part types that can be drawn (as DNARenderer.SBOL_part_renderers()).
+		"""
+		return GLYPH_DEFAULTS.keys()
+
+	def reg_types (self):
+		""" Regulation types that can be drawn (as DNARenderer.std_reg_renderers()).
+		"""
+		return ['Repression', 'Activation']
+
+	def part_glyph (self, doc, part, placed):
+		""" <use> elements placing the glyph of a part (under and over the backbone).
+		"""
+		opts = None
+		if 'opts' in part.keys():
+			opts = part['opts']
+		style = glyph_style(part['type'], opts, self.linewidth)
+		elements = glyph_elements(part['type'], style)
+		if len(elements) == 0:
+			return [], []
+		key = (part['type'], tuple(sorted([(k, svg_color(v)) if k in ['color', 'fill_color']
+		       else (k, v) for k, v in style.items()])))
+		symbol_id = doc.symbol(key, elements)
+		transform = 'translate(%s,0)' % svg_num(placed.glyph_start)
+		if dnalayout.SBOL_LAYOUT_RULES[part['type']]['directional'] == True and placed.fwd == False:
+			transform += ' rotate(180)'
+		use = '<use xlink:href="#%s" transform="%s"/>' % (symbol_id, transform)
+		if part['type'] in UNDER_BACKBONE:
+			return [use], []
+		return [], [use]
+
+	def part_label (self, part, placed):
+		""" <text> element for a part label (None if the part has no label).
+		"""
+		opts = None
+		if 'opts' in part.keys():
+			opts = part['opts']
+		if opts == None or 'label' not in opts.keys():
+			return None
+		label_style = 'normal'
+		label_size = 7
+		label_y_offset = 0
+		label_x_offset = 0
+		if 'label_style' in opts.keys():
+			label_style = opts['label_style']
+		if 'label_size' in opts.keys():
+			label_size = opts['label_size']
+		if 'label_y_offset' in opts.keys():
+			label_y_offset = opts['label_y_offset']
+		if 'label_x_offset' in opts.keys():
+			label_x_offset = opts['label_x_offset']
+		label_text = str(opts['label']).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+		x = placed.label_x
+		if part['type'] == 'PrimerBindingSite':
+			x = placed.glyph_start+((placed.glyph_end-placed.glyph_start)/2.0)
+		return ('<text x="%s" y="%s" font-size="%s" font-style="%s" text-anchor="middle" ' +
+		        'dominant-baseline="central" font-family="sans-serif">%s</text>') % (svg_num(x+label_x_offset),
+		        svg_num(-label_y_offset), svg_num(label_size*UNITS_PER_POINT), label_style, label_text)
+
+	def regulation (self, arc, reg):
+		""" Elements for a regulation arc (as dnaplotlib.regulation).
+		"""
+		color = (0.0,0.0,0.0)
+		arrowhead_length = 4
+		linestyle = '-'
+		linewidth = self.linewidth
+		opts = None
+		if 'opts' in reg.keys():
+			opts = reg['opts']
+		if opts != None:
+			if 'arrowhead_length' in opts.keys():
+				arrowhead_length = opts['arrowhead_length']
+			if 'linestyle' in opts.keys():
+				linestyle = opts['linestyle']
+			if 'linewidth' in opts.keys():
+				linewidth = opts['linewidth']
+			if 'color' in opts.keys():
+				color = opts['color']
+		start = arc.start
+		end = arc.end
+		top = arc.top
+		base = dnalayout.ARC_START_HEIGHT
+		ind_height = arrowhead_length
+		if arc.above == False:
+			base = -base
+			ind_height = -ind_height
+		els = [svg_polyline([(start, base/1.2), (start, top), (end, top), (end, base*1.5)],
+			                color, linewidth, linestyle)]
+		if reg['type'] == 'Repression':
+			els.append(svg_line(end-arrowhead_length, base*1.5, end+arrowhead_length, base*1.5,
+				                color, linewidth))
+		elif reg['type'] == 'Activation':
+			els.append(svg_polyline([(end-arrowhead_length, base*1.5+ind_height), (end, base*1.5),
+				                      (end+arrowhead_length, base*1.5+ind_height)], color, linewidth))
+		return els
+
+	def renderDNA (self, doc, parts, regs=None, x_lim=None, y_lim=None):
+		""" Render a design (and its regulation) as a new row of an SVGDocument.
+
+		Parameters
+	    ----------
+	    doc : SVGDocument
+	        Document to add the design to.
+
+	    parts : list(dict) or CompactDesign
+	    	The design to draw (see DNARenderer.renderDNA()).
+
+	    regs : list(dict) (default=None)
+	    	Regulation present in the design (see DNARenderer.renderDNA()).
+
+	    x_lim : [float, float] (default=None)
+	    	x-range of the row (fitted to the design if None).
+
+	    y_lim : [float, float] (default=None)
+	    	y-range of the row (fitted to the design if None).
+
+	    Returns
+	    -------
+	    start : float
+	    	The x-point that drawing begins.
+
+	    end : float
+	    	The x-point that drawing ends.
+		"""
+		parts, regs = dnadesign.resolve_design(parts, regs)
+		rules = {}
+		for part_type in self.part_types():
+			rules[part_type] = dnalayout.SBOL_LAYOUT_RULES[part_type]
+		layout = dnalayout.layout_design(parts, regs, self.linewidth, self.backbone_pad_left,
+			                             self.backbone_pad_right, rules, self.reg_types())
+		under = []
+		over = []
+		labels = []
+		for placed in layout.parts:
+			part = parts[placed.index]
+			part_under, part_over = self.part_glyph(doc, part, placed)
+			under += part_under
+			over += part_over
+			label = self.part_label(part, placed)
+			if label != None:
+				labels.append(label)
+		arcs = []
+		for arc in layout.arcs:
+			arcs += self.regulation(arc, arc.reg)
+		backbone_start, backbone_end = layout.backbone()
+		backbone = svg_line(backbone_start, 0, backbone_end, 0, BLACK, self.linewidth)
+		x_min, y_min, x_max, y_max = layout.bounds()
+		pad = 2.0*self.linewidth
+		x_min, y_min, x_max, y_max = x_min-pad, y_min-pad, x_max+pad, y_max+pad
+		if x_lim != None:
+			x_min, x_max = x_lim
+		if y_lim != None:
+			y_min, y_max = y_lim
+		doc.add_row(under+[backbone]+over+arcs, labels, x_min, y_min, x_max, y_max)
+		return layout.start, layout.end
@@ -0,0 +1,419 @@
+#!/usr/bin/env python
+"""
+dnathumb
+========
+    This module draws PNG thumbnails of designs without a matplotlib figure.
+    The glyph of each part type, direction and style is drawn once by the
+    dnaplotlib renderers into an in-memory atlas of sprites. A thumbnail is
+    then composited by placing the sprites (at the positions given by
+    dnalayout) and drawing the backbone and regulation arcs into a NumPy
+    image buffer.
+
+    >  import dnathumb
+    >  tr = dnathumb.ThumbnailRenderer(dpi=75)
+    >  image = tr.render([design], [regs])
+    >  dnathumb.write_png('thumb.png', image)
+
+    Designs are drawn at dpi/70 pixels per unit (the nominal scale of a
+    plot_dna figure saved at the same dpi, before its margins). Part labels
+    are not drawn, regulation arcs are drawn as solid lines and parts
+    without a layout rule (e.g., trace parts) are left out. matplotlib is
+    only imported when the first sprite is drawn.
+"""
+#    dnathumb
+#    Copyright (C) 2014 by
+#    Thomas E. Gorochowski <tom@chofski.co.uk>
+#    Bryan Der <bder@mit.edu>
+#    All rights reserved.
+#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
+
+import dnadesign
+import dnalayout
+import math
+import numpy as np
+import struct
+import zlib
+
+__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
+               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
+__license__ = 'OSI Non-Profit OSL 3.0'
+__version__ = '1.0'
+
+# Default resolution of thumbnails (dpi of the matching plot_dna figure)
+DEFAULT_DPI = 75
+
+# Units of a design per inch of figure (as plot_dna sizes its figures)
+UNITS_PER_INCH = 70.0
+
+# Part options that only affect labels
+LABEL_OPTS = ['label', 'label_size', 'label_style', 'label_color',
+              'label_x_offset', 'label_y_offset']
+
+# Space around glyphs when drawing sprites (in design units)
+SPRITE_MARGIN = 10.0
+
+###############################################################################
+# PNG output
+###############################################################################
+
+def png_chunk (chunk_type, data):
+	return (struct.pack('>I', len(data)) + chunk_type + data +
+		    struct.pack('>I', zlib.crc32(chunk_type + data) & 0xffffffff))
+
+def write_png (filename, image, dpi=None):
+	""" Write an RGBA image (height x width x 4 array of uint8) to a PNG file
+	    (with its resolution if a dpi is given).
+	"""
+	height, width = image.shape[0], image.shape[1]
+	# Every row is stored unfiltered (filter type 0)
+	rows = np.zeros((height, width*4+1), dtype=np.uint8)
+	rows[:,1:] = image.reshape(height, width*4)
+	f = open(filename, 'wb')
+	try:
+		f.write('\x89PNG\r\n\x1a\n')
+		f.write(png_chunk('IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+		if dpi != None:
+			# Pixels per metre
+			ppm = int(round(dpi/0.0254))
+			f.write(png_chunk('pHYs', struct.pack('>IIB', ppm, ppm, 1)))
+		f.write(png_chunk('IDAT', zlib.compress(rows.tostring(), 6)))
+		f.write(png_chunk('IEND', ''))
+	finally:
+		f.close()
+
+###############################################################################
+# Compositing
+###############################################################################
+
+def blit (buf, sprite, row, col):
+	""" Composite a premultiplied RGBA sprite over the buffer with its top left
+	    corner at (row, col), clipped to the buffer.
+	"""
+	h, w = sprite.shape[0], sprite.shape[1]
+	r0 = max(row, 0)
+	c0 = max(col, 0)
+	r1 = min(row+h, buf.shape[0])
+	c1 = min(col+w, buf.shape[1])
+	if r0 >= r1 or c0 >= c1:
+		return
+	src = sprite[r0-row:r1-row, c0-col:c1-col]
+	dst = buf[r0:r1, c0:c1]
+	dst *= 1.0 - src[:,:,3:4]
+	dst += src
+
+def draw_segment (buf, x0, y0, x1, y1, width, color):
+	""" Composite an antialiased line (with projecting caps) between two points
+	    given in pixels over the buffer.
+	"""
+	half = max(width, 1.0)/2.0
+	dx = x1-x0
+	dy = y1-y0
+	length = math.sqrt(dx*dx + dy*dy)
+	if length > 0:
+		# Projecting caps extend the line by half its width
+		ux = dx/length
+		uy = dy/length
+		x0 -= ux*half
+		y0 -= uy*half
+		x1 += ux*half
+		y1 += uy*half
+		dx = x1-x0
+		dy = y1-y0
+	c0 = max(int(math.floor(min(x0, x1)-half-1)), 0)
+	c1 = min(int(math.ceil(max(x0, x1)+half+1)), buf.shape[1])
+	r0 = max(int(math.floor(min(y0, y1)-half-1)), 0)
+	r1 = min(int(math.ceil(max(y0, y1)+half+1)), buf.shape[0])
+	if r0 >= r1 or c0 >= c1:
+		return
+	ys, xs = np.mgrid[r0:r1, c0:c1]
+	px = xs + 0.5 - x0
+	py = ys + 0.5 - y0
+	seg_len2 = dx*dx + dy*dy
+	if seg_len2 > 0:
+		t = np.clip((px*dx + py*dy)/seg_len2, 0.0, 1.0)
+	else:
+		t = 0.0
+	dist = np.sqrt((px-t*dx)**2 + (py-t*dy)**2)
+	coverage = np.clip(half+0.5-dist, 0.0, 1.0)[:,:,np.newaxis]
+	src = coverage*np.array([color[0], color[1], color[2], 1.0], dtype=np.float32)
+	dst = buf[r0:r1, c0:c1]
+	dst *= 1.0 - src[:,:,3:4]
+	dst += src
+
+###############################################################################
+# Glyph atlas
+###############################################################################
+
+class Sprite:
+	""" Glyph of a part drawn to a premultiplied RGBA array. x0 and y0 give the
+	    position (in design units) of its top left corner relative to the start
+	    of the part and the backbone.
+	"""
+
+	def __init__(self, pixels, x0, y0):
+		self.pixels = pixels
+		self.x0 = x0
+		self.y0 = y0
+
+class GlyphAtlas:
+	""" Sprites of part glyphs, each drawn once (by the dnaplotlib renderer of
+	    its part type) for a direction and style.
+	"""
+
+	def __init__(self, dpi=DEFAULT_DPI, scale=1.0, linewidth=1.0):
+		""" Constructor to generate an empty GlyphAtlas.
+
+		Parameters
+	    ----------
+	    dpi : float (default=DEFAULT_DPI)
+	    	Resolution glyphs are drawn at.
+
+	    scale : float (default=1.0)
+	    	Scale of the glyphs (as for DNARenderer).
+
+	    linewidth : float (default=1.0)
+	    	The default linewidth for all part drawing.
+		"""
+		self.dpi = dpi
+		self.scale = scale
+		self.linewidth = linewidth
+		self.px_per_unit = dpi/UNITS_PER_INCH
+		self.sprites = {}
+		self.renderers = None
+
+	def part_renderer (self, part_type):
+		""" Renderer (and layout rule) of a part type, or None if the part type
+		    has no renderer with a fixed size glyph.
+		"""
+		import dnaplotlib
+		if self.renderers == None:
+			dr = dnaplotlib.DNARenderer(scale=self.scale, linewidth=self.linewidth)
+			self.renderers = dr.SBOL_part_renderers()
+		if part_type not in self.renderers.keys():
+			return None
+		renderer = self.renderers[part_type]
+		if renderer not in dnaplotlib.PART_LAYOUT_RULES.keys():
+			return None
+		rule = dnaplotlib.PART_LAYOUT_RULES[renderer]
+		if rule['width'] == 'trace':
+			return None
+		return renderer, rule
+
+	def sprite (self, part_type, fwd, opts):
+		""" Sprite of a part (None if it has no fixed size glyph). Labels are
+		    not drawn, so parts differing only in their labels share a sprite.
+		"""
+		key_opts = opts
+		if opts != None:
+			key_opts = {}
+			for k in opts.keys():
+				if k not in LABEL_OPTS:
+					key_opts[k] = opts[k]
+		style = dnadesign.style_key(key_opts)
+		if style == None:
+			return self.draw_sprite(part_type, fwd, key_opts)
+		key = (part_type, fwd, style)
+		if key not in self.sprites.keys():
+			self.sprites[key] = self.draw_sprite(part_type, fwd, key_opts)
+		return self.sprites[key]
+
+	def draw_sprite (self, part_type, fwd, opts):
+		""" Draw the glyph of a part to a new Sprite.
+		"""
+		renderer_rule = self.part_renderer(part_type)
+		if renderer_rule == None:
+			return None
+		renderer, rule = renderer_rule
+		import dnaplotlib
+		dnaplotlib.load_matplotlib()
+		from matplotlib.figure import Figure
+		from matplotlib.backends.backend_agg import FigureCanvasAgg
+		# Size the canvas from the layout of the part (drawn starting at 0)
+		part = {'type': part_type, 'fwd': fwd, 'opts': opts}
+		layout = dnalayout.DesignLayout(self.linewidth)
+		placed = layout.place_part(0, part, rule)
+		ppu = self.px_per_unit
+		x_min = -SPRITE_MARGIN
+		y_max = max(placed.y_max, 0.0) + SPRITE_MARGIN
+		width = int(math.ceil((placed.extent_end-x_min+SPRITE_MARGIN)*ppu))
+		height = int(math.ceil((y_max-min(placed.y_min, 0.0)+SPRITE_MARGIN)*ppu))
+		fig = Figure(figsize=(width/float(self.dpi), height/float(self.dpi)), dpi=self.dpi)
+		canvas = FigureCanvasAgg(fig)
+		fig.patch.set_alpha(0.0)
+		ax = fig.add_axes([0, 0, 1, 1])
+		ax.set_axis_off()
+		ax.set_xlim([x_min, x_min+width/ppu])
+		ax.set_ylim([y_max-height/ppu, y_max])
+		if fwd == True:
+			start, end = 0, 1
+		else:
+			start, end = 1, 0
+		renderer(dnaplotlib.StyledAxis(ax), part_type, 0, start, end, 0.0, self.scale,
+			     self.linewidth, opts=opts)
+		canvas.draw()
+		buf_width, buf_height = canvas.get_width_height()
+		rgba = np.frombuffer(canvas.buffer_rgba(), dtype=np.uint8)
+		rgba = rgba.reshape((buf_height, buf_width, 4))[:height, :width].astype(np.float32)/255.0
+		# Crop to the pixels drawn
+		drawn = np.nonzero(rgba[:,:,3] > 0)
+		if len(drawn[0]) == 0:
+			return None
+		r0, r1 = drawn[0].min(), drawn[0].max()+1
+		c0, c1 = drawn[1].min(), drawn[1].max()+1
+		pixels = rgba[r0:r1, c0:c1].copy()
+		pixels[:,:,:3] *= pixels[:,:,3:4]
+		return Sprite(pixels, x_min+c0/ppu, y_max-r0/ppu)
+
+###############################################################################
+# Thumbnail renderer
+###############################################################################
+
+class ThumbnailRenderer:
+	""" Composites thumbnails of designs from the sprites of a GlyphAtlas.
+	"""
+
+	def __init__(self, dpi=DEFAULT_DPI, scale=1.0, linewidth=1.0,
+		         backbone_pad_left=0.0, backbone_pad_right=0.0, atlas=None):
+		""" Constructor to generate a ThumbnailRenderer.
+
+		Parameters
+	    ----------
+	    dpi : float (default=DEFAULT_DPI)
+	    	Resolution of the thumbnails.
+
+	    scale : float (default=1.0)
+	    	Scale of the glyphs (as for DNARenderer).
+
+	    linewidth : float (default=1.0)
+	    	The default linewidth for all part drawing.
+
+	    backbone_pad_left : float (default=0.0)
+	    	Padding to add to the left side of the backbone.
+
+	    backbone_pad_right : float (default=0.0)
+	    	Padding to add to the right side of the backbone.
+
+	    atlas : GlyphAtlas (default=None)
+	    	Atlas of sprites to use (a new atlas if None). An atlas can be shared
+	    	by renderers with the same dpi, scale and linewidth.
+		"""
+		if atlas == None:
+			atlas = GlyphAtlas(dpi, scale, linewidth)
+		self.atlas = atlas
+		self.linewidth = linewidth
+		self.backbone_pad_left = backbone_pad_left
+		self.backbone_pad_right = backbone_pad_right
+
+	def layout (self, parts, regs=None):
+		""" Layout of a design as drawn in a thumbnail.
+		"""
+		return dnalayout.layout_design(parts, regs, self.linewidth, self.backbone_pad_left,
+			                           self.backbone_pad_right, None,
+			                           ['Repression', 'Activation'])
+
+	def render (self, designs, regs_list=None, x_lim=None, axis_y=35):
+		""" Thumbnail of designs drawn one above the other.
+
+		Parameters
+	    ----------
+	    designs : list(list(dict) or CompactDesign)
+	    	Designs to draw (see DNARenderer.renderDNA()).
+
+	    regs_list : list(list(dict)) (default=None)
+	    	Regulation of each design (None if there is none).
+
+	    x_lim : [float, float] (default=None)
+	    	x-range shared by the designs (fitted to the longest if None).
+
+	    axis_y : float (default=35)
+	    	Half the height of each design.
+
+	    Returns
+	    -------
+	    image : numpy.ndarray
+	    	RGBA image (height x width x 4 array of uint8).
+		"""
+		ppu = self.atlas.px_per_unit
+		layouts = []
+		for i in range(len(designs)):
+			regs = None
+			if regs_list != None:
+				regs = regs_list[i]
+			parts, regs = dnadesign.resolve_design(designs[i], regs)
+			layouts.append((parts, self.layout(parts, regs)))
+		if x_lim == None:
+			max_dna_len = 0.0
+			for parts, layout in layouts:
+				max_dna_len = max(max_dna_len, layout.end-layout.start)
+			x_lim = [(-0.01*max_dna_len)-self.backbone_pad_left,
+			         max_dna_len+(0.01*max_dna_len)+self.backbone_pad_right]
+		width = max(int(math.ceil((x_lim[1]-x_lim[0])*ppu)), 1)
+		row_height = max(int(math.ceil(2*axis_y*ppu)), 1)
+		buf = np.zeros((row_height*len(designs), width, 4), dtype=np.float32)
+		for i in range(len(layouts)):
+			parts, layout = layouts[i]
+			self.render_row(buf, parts, layout, x_lim[0], i*row_height+axis_y*ppu)
+		return to_rgba8(buf)
+
+	def render_row (self, buf, parts, layout, x_min, y_backbone):
+		""" Composite a design with its backbone at pixel row y_backbone.
+		"""
+		ppu = self.atlas.px_per_unit
+		pt_px = self.atlas.dpi/72.0
+		# Backbone (below the parts, as drawn by dnaplotlib)
+		backbone_start, backbone_end = layout.backbone()
+		draw_segment(buf, (backbone_start-x_min)*ppu, y_backbone, (backbone_end-x_min)*ppu,
+			         y_backbone, self.linewidth*pt_px, (0.0, 0.0, 0.0))
+		for placed in layout.parts:
+			part = parts[placed.index]
+			opts = None
+			if 'opts' in part.keys():
+				opts = part['opts']
+			sprite = self.atlas.sprite(part['type'], placed.fwd, opts)
+			if sprite != None:
+				col = int(round((placed.extent_start+sprite.x0-x_min)*ppu))
+				row = int(round(y_backbone-sprite.y0*ppu))
+				blit(buf, sprite.pixels, row, col)
+		for arc in layout.arcs:
+			self.render_arc(buf, arc, x_min, y_backbone)
+
+	def render_arc (self, buf, arc, x_min, y_backbone):
+		""" Draw a regulation arc (with the geometry used by dnaplotlib).
+		"""
+		ppu = self.atlas.px_per_unit
+		opts = arc.reg.get('opts')
+		if opts == None:
+			opts = {}
+		color = opts.get('color', (0.0, 0.0, 0.0))
+		linewidth = opts.get('linewidth', self.linewidth)*self.atlas.dpi/72.0
+		arrowhead_length = opts.get('arrowhead_length', 4)
+		top = dnalayout.ARC_BASE_HEIGHT + arc.height_index*dnalayout.ARC_HEIGHT_STEP
+		base = dnalayout.ARC_START_HEIGHT
+		ind_height = arrowhead_length
+		# Arcs to reverse parts are drawn below the backbone
+		to_part = arc.reg['to_part']
+		if 'fwd' in to_part.keys() and to_part['fwd'] == False:
+			top = -top
+			base = -base
+			ind_height = -ind_height
+		lines = [(arc.start, base/1.2, arc.start, top),
+		         (arc.start, top, arc.end, top),
+		         (arc.end, top, arc.end, base*1.5)]
+		if arc.type == 'Repression':
+			lines.append((arc.end-arrowhead_length, base*1.5, arc.end+arrowhead_length, base*1.5))
+		elif arc.type == 'Activation':
+			lines.append((arc.end-arrowhead_length, base*1.5+ind_height, arc.end, base*1.5))
+			lines.append((arc.end+arrowhead_length, base*1.5+ind_height, arc.end, base*1.5))
+		for x0, y0, x1, y1 in lines:
+			draw_segment(buf, (x0-x_min)*ppu, y_backbone-y0*ppu, (x1-x_min)*ppu,
+				         y_backbone-y1*ppu, linewidth, color)
+
+def to_rgba8 (buf):
+	""" Straight alpha RGBA uint8 image of a premultiplied float buffer.
+	"""
+	alpha = buf[:,:,3:4]
+	rgb = np.where(alpha > 0, buf[:,:,:3]/np.maximum(alpha, 1e-6), 0.0)
+	image = np.empty(buf.shape, dtype=np.uint8)
+	image[:,:,:3] = np.clip(rgb*255.0+0.5, 0, 255).astype(np.uint8)
+	image[:,:,3] = np.clip(alpha[:,:,0]*255.0+0.5, 0, 255).astype(np.uint8)
+	return image
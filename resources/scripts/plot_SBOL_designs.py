@@ -1,320 +1,1532 @@
-#!/usr/bin/env python
-"""
-    plot_SBOL_designs.py
-
-    Plot the design of DNA constructs using SBOL notation.
-
-    Usage:
-    ------
-    python plot_SBOL_designs.py  -params     PARAM_FILENAME 
-                                 -parts      PART_FILENAME 
-                                 -designs    DESIGN_FILENAME 
-                                [-regulation REG_FILENAME]
-                                 -output     OUT_FILENAME
-"""
-#    Plot SBOL Designs
-#    Copyright (C) 2014 by
-#    Thomas E. Gorochowski <tom@chofski.co.uk>
-#    Bryan Der <bder@mit.edu>
-#    All rights reserved.
-#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
-
-# Set the backend to use (important for headless servers)
-import matplotlib
-matplotlib.use('Agg')
-
-import csv
-import dnaplotlib as dpl
-import matplotlib.pyplot as plt
-from argparse import ArgumentParser
-import os.path
-
-__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
-               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
-__license__ = 'OSI Non-Profit OSL 3.0'
-__version__ = '1.0'
-
-def make_float_if_needed (s):
-	try:
-		float(s)
-		return float(s)
-	except ValueError:
-		return s
-
-
-def load_plot_parameters (filename):
-	plot_params = {}
-	param_reader = csv.reader(open(filename, 'rU'), delimiter=',')
-	# Ignore header
-	header = next(param_reader)
-	# Process all parameters
-	for row in param_reader:
-		if len(row) >= 2:
-			if row[1] != '':
-				plot_params[row[0]] = make_float_if_needed(row[1])
-	return plot_params
-
-
-def load_part_information (filename):
-	part_info = {}
-	parts_reader = csv.reader(open(filename, 'rU'), delimiter=',')
-	header = next(parts_reader)
-	header_map = {}
-	for i in range(len(header)):
-		header_map[header[i]] = i
-	attrib_keys = [k for k in header_map.keys() if k not in ['part_name', 'type']]
-	for row in parts_reader:
-		# Make the attributes map
-		part_attribs_map = {}
-		for k in attrib_keys:
-			if row[header_map[k]] != '':
-				if k == 'color' or k == 'label_color':
-					part_attribs_map[k] = [float(x) for x in row[header_map[k]].split(';')]
-				else:
-					part_attribs_map[k] = make_float_if_needed(row[header_map[k]])
-		part_name = row[header_map['part_name']]
-		part_type = row[header_map['type']]
-		part_info[part_name] = [part_name, part_type, part_attribs_map]
-	return part_info
-
-
-def load_dna_designs (filename, part_info):
-	dna_designs = {}
-	design_reader = csv.reader(open(filename, 'rU'), delimiter=',')
-	# Ignore header
-	header = next(design_reader)
-	# Process all parameters
-	for row in design_reader:
-		if len(row[0]) != '':
-			part_list = []
-			for i in range(1,len(row)):
-				# Handle reverse parts
-				fwd = True
-				part_name = row[i]
-				if len(part_name) != 0:
-					if part_name[0] == '-':
-						part_name = part_name[1:]
-						fwd = False
-					# Store the design
-					part_design = {}
-					cur_part_info = part_info[part_name]
-					part_design['type'] = cur_part_info[1]
-					part_design['name'] = part_name #needed to add part name for regulation
-					part_design['fwd']  = fwd       #needed to add fwd for regulation
-					if fwd == True:
-						part_design['start'] = i
-						part_design['end'] = i+1
-					else:
-						part_design['end'] = i
-						part_design['start'] = i+1
-					part_design['opts'] = cur_part_info[2]
-					part_list.append(part_design)
-			dna_designs[row[0]] = part_list
-	return dna_designs
-
-
-def load_regulatory_information (filename, part_info, dna_designs):
-	regs_info = {}
-	
-	reg_reader = csv.reader(open(filename, 'rU'), delimiter=',')
-	# Ignore header
-	header = next(reg_reader)
-	header_map = {}
-	for i in range(len(header)):
-		header_map[header[i]] = i
-	attrib_keys = [k for k in header_map.keys() if k not in ['from_partname', 'type', 'to_partname']]
-	
-	#reg_reader can only be read once?
-	rows = []
-	for row in reg_reader:
-		rows.append(row)
-
-	design_list = sorted(dna_designs.keys())
-	num_of_designs = len(design_list)
-
-	#outer loop: for each design
-	for i in range(num_of_designs):
-		regs_info[i]=[]
-		design =  dna_designs[design_list[i]]
-
-		#middle loop: for each regulation
-		for row in rows:
-			
-			#opts
-			reg_attribs_map = {}
-			for k in attrib_keys:
-				if row[header_map[k]] != '':
-					if k == 'color':
-						reg_attribs_map[k] = [float(x) for x in row[header_map[k]].split(';')]
-					else:
-						reg_attribs_map[k] = make_float_if_needed(row[header_map[k]])
-
-			#from, type, to
-			type = row[header_map['type']]
-			from_partname = row[header_map['from_partname']]
-			to_partname   = row[header_map['to_partname']]
-			from_part = None;
-			to_part = None;
-			
-			#inner loop: loop through parts to find 'from' and 'to' parts
-			for part1 in design: #loop through once to find the cds
-				if(part1['name'] == from_partname):
-					start_part = part1
-					for part2 in design: #loop through again to find the promoter
-						if(part2['name'] == to_partname):
-							end_part = part2
-							#found from-to, save regulation arc
-							reg_info = {}
-							reg_info['from_part'] = start_part
-							reg_info['type'] = row[header_map['type']]
-							reg_info['to_part'] = end_part
-							reg_info['opts'] = reg_attribs_map
-							regs_info[i].append(reg_info)
-	return regs_info
-
-
-def plot_dna (dna_designs, out_filename, plot_params, regs_info):
-	# Create the renderer
-	if 'axis_y' not in plot_params.keys():
-		plot_params['axis_y'] = 35
-	left_pad = 0.0
-	right_pad = 0.0
-	scale = 1.0
-	linewidth = 1.0
-	fig_y = 5.0
-	fig_x = 5.0
-	if 'backbone_pad_left' in plot_params.keys():
-		left_pad = plot_params['backbone_pad_left']
-	if 'backbone_pad_right' in plot_params.keys():
-		right_pad = plot_params['backbone_pad_right']
-	if 'scale' in plot_params.keys():
-		scale = plot_params['scale']
-	if 'linewidth' in plot_params.keys():
-		linewidth = plot_params['linewidth']
-	if 'fig_y' in plot_params.keys():
-		fig_y = plot_params['fig_y']
-	if 'fig_x' in plot_params.keys():
-		fig_x = plot_params['fig_x']
-	dr = dpl.DNARenderer(scale=scale, linewidth=linewidth,
-		                 backbone_pad_left=left_pad, 
-		                 backbone_pad_right=right_pad)
-
-	# We default to the standard regulation renderers
-	reg_renderers = dr.std_reg_renderers()
-	# We default to the SBOL part renderers
-	part_renderers = dr.SBOL_part_renderers()
-
-    # Create the figure
-	fig = plt.figure(figsize=(fig_x,fig_y))
-	#plt.subplots_adjust(hspace=0.01, wspace=0.01, left=0.05, right=0.95, top=0.99, bottom=0.01)
-
-
-	# Cycle through the designs an plot on individual axes
-	design_list = sorted(dna_designs.keys())
-	if(regs_info != None):
-		regs_list   = sorted(regs_info.keys())
-	
-	num_of_designs = len(design_list)
-	ax_list = []
-	max_dna_len = 0.0
-	for i in range(num_of_designs):
-		# Create axis for the design and plot
-		regs = None
-		if(regs_info != None):
-			regs   =  regs_info[i]
-		design =  dna_designs[design_list[i]]
-
-		ax = fig.add_subplot(num_of_designs,1,i+1)
-		if 'show_title' in plot_params.keys() and plot_params['show_title'] == 'Y':
-			ax.set_title(design_list[i], fontsize=8)
-		start, end = dr.renderDNA(ax, design, part_renderers, regs, reg_renderers)
-
-		dna_len = end-start
-		if max_dna_len < dna_len:
-			max_dna_len = dna_len
-		ax_list.append(ax)
-	for ax in ax_list:
-		ax.set_xticks([])
-		ax.set_yticks([])
-		# Set bounds
-		ax.set_xlim([(-0.01*max_dna_len)-left_pad,
-			        max_dna_len+(0.01*max_dna_len)+right_pad])
-		ax.set_ylim([-plot_params['axis_y'],plot_params['axis_y']])
-		ax.set_aspect('equal')
-		ax.set_axis_off()
-
-	# Update the size of the figure to fit the constructs drawn
-	fig_x_dim = max_dna_len/70.0
-	if fig_x_dim < 1.0:
-		fig_x_dim = 1.0
-	fig_y_dim = 1.2*len(ax_list)
-
-
-	plt.gcf().set_size_inches( (fig_x_dim, fig_y_dim) )
-
-	# Save the figure
-	plt.tight_layout()
-    #plt.subplots_adjust(hspace=0.001)
-
-
-	fig.savefig(out_filename, transparent=True, dpi=300)
-
-	if(True):
-		pngfile = out_filename.replace('.pdf', '.png')
-		fig.savefig(pngfile, transparent=True, dpi=300, format='png') 
-
-	# Clear the plotting cache
-	plt.close('all')
-
-
-def is_valid_file(parser, arg):
-    if not os.path.exists(arg):
-        parser.error("The file %s does not exist!" % arg)
-    else:
-        return open(arg, 'r')  # return an open file handle
-
-
-def main():	
-	# Parse the arguments
-	parser = ArgumentParser(description="file paths as arguments")
-	parser.add_argument("-params", dest="params", required=True,
-					help="plot_params.csv", metavar="FILE",
-                    type=lambda x: is_valid_file(parser, x))
-	parser.add_argument("-parts", dest="parts", required=True,
-					help="parts_information.csv", metavar="FILE",
-                    type=lambda x: is_valid_file(parser, x))
-	parser.add_argument("-regulation", dest="regulation", required=False,
-					help="reg_information.csv", metavar="FILE",
-                    type=lambda x: is_valid_file(parser, x))
-	parser.add_argument("-designs", dest="designs", required=True,
-					help="dna_designs.csv", metavar="FILE",
-                    type=lambda x: is_valid_file(parser, x))
-	parser.add_argument("-output", dest="output_pdf", required=True,
-					help="output pdf filename")
-	args = parser.parse_args()
-
-	# Process arguments
-	plot_params = load_plot_parameters(args.params.name)
-	part_info = load_part_information(args.parts.name)
-	dna_designs = load_dna_designs (args.designs.name, part_info)
-
-#	for param in plot_params.items():
-#		print param
-#	for part in part_info.items():
-#		print part
-#	for dna in dna_designs.items():
-#		print dna[0]
-#		for construct in dna[1]:
-#			print construct
-	
-	regs_info = None
-	if(args.regulation):
-		regs_info = load_regulatory_information(args.regulation.name, part_info, dna_designs)
-		
-#		for reg in regs_info.items():
-#			print reg
-
-	plot_dna(dna_designs, args.output_pdf, plot_params, regs_info)
-
-if __name__ == "__main__":
- 	main()
+#!/usr/bin/env python
+"""
+    plot_SBOL_designs.py
+
+    Plot the design of DNA constructs using SBOL notation.
+
+    Usage:
+    ------
+    python plot_SBOL_designs.py  -params     PARAM_FILENAME 
+                                 -parts      PART_FILENAME 
+                                 -designs    DESIGN_FILENAME 
+                                [-regulation REG_FILENAME]
+                                 -output     OUT_FILENAME
+                                [-stream]
+                                [-profile    PROFILE_FILENAME]
+                                [-trace      TRACE_FILENAME]
+
+    python plot_SBOL_designs.py  -worker [-port PORT]
+                                [-params     PARAM_FILENAME]
+                                [-parts      PART_FILENAME]
+
+    python plot_SBOL_designs.py  -batch      DIR_OR_LIST [DIR_OR_LIST ...]
+                                [-params     PARAM_FILENAME]
+                                [-parts      PART_FILENAME]
+                                [-workers    NUM_WORKERS]
+
+    python plot_SBOL_designs.py  -bundle     BUNDLE_FILENAME
+                                [-output     OUT_FILENAME]
+                                [-workers    NUM_WORKERS]
+
+    python plot_SBOL_designs.py  -cache CACHE_DIR (-cache_stats | -cache_purge)
+
+    With -stream, designs are drawn in pages (designs_per_page, default 20, to
+    a multi-page PDF or a numbered file per page) as they are read and in the
+    order of the file, so very large design files are drawn in fixed memory.
+    Streamed figures are not cached.
+
+    With -profile, the time taken and number of calls of each stage of drawing
+    (parsing each input, resolving regulation, renderDNA, each part renderer,
+    the regulation arcs, tight_layout, drawing each raster resolution and
+    saving each format) and the artists drawn for each design are written as
+    a JSON summary. -trace writes every call as a Chrome trace (for
+    chrome://tracing or Perfetto).
+
+    Worker mode:
+    ------------
+    Render jobs are read one per line as JSON objects from stdin (or from
+    connections to PORT on localhost). Each job gives the files to use:
+
+    {"id": "A000", "params": PARAM_FILENAME, "parts": PART_FILENAME,
+     "designs": DESIGN_FILENAME, "regulation": REG_FILENAME,
+     "output": OUT_FILENAME}
+
+    The contents of an input can be given inline in place of a file (e.g.,
+    "designs_data": "design_name,parts\n..."). A JSON line is written back
+    for each job once it completes:
+
+    {"id": "A000", "status": "ok", "output": OUT_FILENAME, "time": 0.21}
+
+    or with "status": "error" and an "error" message if it failed. A
+    {"command": "shutdown"} job stops the worker. Jobs can also give a render
+    "cache" directory (and its "cache_size" in MB).
+
+    Batch mode:
+    -----------
+    Renders many sets of CSV files across a pool of worker processes. Each
+    DIR_OR_LIST is either a job output directory, where every set of files
+    PREFIXplot_parameters.csv, PREFIXpart_information.csv,
+    PREFIXdna_designs.csv and (optional) PREFIXreg_information.csv is drawn
+    to PREFIXout.pdf, or a file listing one set per line as:
+
+    PARAM_FILENAME,PART_FILENAME,DESIGN_FILENAME,REG_FILENAME[,OUT_FILENAME]
+
+    A summary of the time taken and any errors is printed for each set.
+
+    Job-level parts:
+    ----------------
+    The -params and -parts given with -worker or -batch are used by every
+    assignment that does not give its own, so each assignment need only give
+    its designs and regulation (in a job list the PARAM_FILENAME and
+    PART_FILENAME columns can be left empty). Plot parameters and parts are
+    compiled once per process (with the renderer of each part type) and shared
+    by all the assignments using the same files, which are only parsed again
+    if they are modified.
+
+    JSON bundles:
+    -------------
+    All the inputs of an assignment can be given as a single JSON document
+    (read from stdin if BUNDLE_FILENAME is -) with typed values:
+
+    {"id": "A000", "output": OUT_FILENAME,
+     "params": {"show_title": "N", "axis_y": 35, ...},
+     "parts": [{"name": "pTac", "type": "Promoter", "color": [0.0, 0.5, 1.0]},
+               ...],
+     "designs": {"design_name": ["pTac", "-YFP", ...], ...},
+     "regulation": [{"from_partname": "YFP", "type": "Repression",
+                     "to_partname": "pTac", "color": [1.0, 0.0, 0.0]}, ...]}
+
+    A bundle can instead hold many assignments in a list of "assignments",
+    each taking any keys it does not give (e.g., "params" and "parts") from
+    the bundle. Bundle assignments are also accepted as worker jobs, and a
+    summary is printed for them as in batch mode.
+
+    Contact sheets:
+    ---------------
+    With the contact_sheet plot parameter set to Y, the designs are packed
+    into a grid (sheet_cols by sheet_rows, default 4 by 10) on fixed size
+    sheets (sheet_x by sheet_y inches, default 8.5 by 11), each captioned with
+    its design name. PDF output is a single multi-page file and other formats
+    a numbered file per sheet.
+
+    Render cache:
+    -------------
+    With -cache CACHE_DIR (in any mode) figures are served from an on-disk
+    cache when the same designs, part options, regulation and plot parameters
+    have been drawn before. The cache is kept within -cache_size MB by
+    evicting the least recently used figures. -cache_stats prints the hits,
+    misses and size of the cache and -cache_purge empties it.
+"""
+#    Plot SBOL Designs
+#    Copyright (C) 2014 by
+#    Thomas E. Gorochowski <tom@chofski.co.uk>
+#    Bryan Der <bder@mit.edu>
+#    All rights reserved.
+#    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
+
+# matplotlib (with the Agg backend set by dnaplotlib) is only imported when a
+# figure is drawn, and numpy (through dnathumb), multiprocessing and
+# SocketServer only by the modes that use them, so runs that only parse inputs
+# or write SVG start quickly
+import csv
+import dnacache
+import dnaplotlib as dpl
+import dnalayout
+import dnasvg
+from argparse import ArgumentParser
+from StringIO import StringIO
+import json
+import os.path
+import shutil
+import sys
+import tempfile
+import time
+
+__author__  = 'Thomas E. Gorochowski <tom@chofski.co.uk>, Voigt Lab, MIT\n\
+               Bryan Der <bder@mit.edu>, Voigt Lab, MIT'
+__license__ = 'OSI Non-Profit OSL 3.0'
+__version__ = '1.0'
+
+def make_float_if_needed (s):
+	try:
+		float(s)
+		return float(s)
+	except ValueError:
+		return s
+
+
+def open_csv (source):
+	""" Open a CSV file (or use a file-like object holding the CSV data).
+	"""
+	if hasattr(source, 'read'):
+		return source
+	return open(source, 'rU')
+
+
+def load_plot_parameters (filename):
+	plot_params = {}
+	param_reader = csv.reader(open_csv(filename), delimiter=',')
+	# Ignore header
+	header = next(param_reader)
+	# Process all parameters
+	for row in param_reader:
+		if len(row) >= 2:
+			if row[1] != '':
+				plot_params[row[0]] = make_float_if_needed(row[1])
+	return plot_params
+
+
+def load_part_information (filename):
+	part_info = {}
+	parts_reader = csv.reader(open_csv(filename), delimiter=',')
+	header = next(parts_reader)
+	header_map = {}
+	for i in range(len(header)):
+		header_map[header[i]] = i
+	attrib_keys = [k for k in header_map.keys() if k not in ['part_name', 'type']]
+	for row in parts_reader:
+		# Make the attributes map
+		part_attribs_map = {}
+		for k in attrib_keys:
+			if row[header_map[k]] != '':
+				if k == 'color' or k == 'label_color':
+					part_attribs_map[k] = [float(x) for x in row[header_map[k]].split(';')]
+				else:
+					part_attribs_map[k] = make_float_if_needed(row[header_map[k]])
+		part_name = row[header_map['part_name']]
+		part_type = row[header_map['type']]
+		part_info[part_name] = [part_name, part_type, part_attribs_map]
+	return part_info
+
+
+def design_part (part_info, part_name, i):
+	""" Part of a design at position i (reversed if its name starts with '-').
+	"""
+	# Handle reverse parts
+	fwd = True
+	if part_name[0] == '-':
+		part_name = part_name[1:]
+		fwd = False
+	# Store the design
+	part_design = {}
+	cur_part_info = part_info[part_name]
+	part_design['type'] = cur_part_info[1]
+	part_design['name'] = part_name #needed to add part name for regulation
+	part_design['fwd']  = fwd       #needed to add fwd for regulation
+	if fwd == True:
+		part_design['start'] = i
+		part_design['end'] = i+1
+	else:
+		part_design['end'] = i
+		part_design['start'] = i+1
+	part_design['opts'] = cur_part_info[2]
+	return part_design
+
+
+def load_dna_designs (filename, part_info):
+	dna_designs = {}
+	for design_name, part_list in iter_dna_designs(filename, part_info):
+		dna_designs[design_name] = part_list
+	return dna_designs
+
+
+def iter_dna_designs (filename, part_info):
+	""" Generator of the (design_name, parts) in a designs file, in file order.
+	    Rows are only read (and the parts they use looked up) as designs are
+	    taken, so a file of any size is held one design at a time.
+	"""
+	design_reader = csv.reader(open_csv(filename), delimiter=',')
+	# Ignore header
+	header = next(design_reader)
+	# Process all parameters
+	for row in design_reader:
+		if len(row[0]) != '':
+			part_list = []
+			for i in range(1,len(row)):
+				if len(row[i]) != 0:
+					part_list.append(design_part(part_info, row[i], i))
+			yield row[0], part_list
+
+
+def load_regulatory_information (filename, part_info, dna_designs):
+	return resolve_regulation(load_regulations(filename), dna_designs)
+
+
+def load_regulations (filename):
+	""" (from_partname, type, to_partname, opts) of each regulation in a file.
+	"""
+	reg_reader = csv.reader(open_csv(filename), delimiter=',')
+	# Ignore header
+	header = next(reg_reader)
+	header_map = {}
+	for i in range(len(header)):
+		header_map[header[i]] = i
+	attrib_keys = [k for k in header_map.keys() if k not in ['from_partname', 'type', 'to_partname']]
+	
+	# Parse the attributes of each regulation once (shared by all designs)
+	regulations = []
+	for row in reg_reader:
+		#opts
+		reg_attribs_map = {}
+		for k in attrib_keys:
+			if row[header_map[k]] != '':
+				if k == 'color':
+					reg_attribs_map[k] = [float(x) for x in row[header_map[k]].split(';')]
+				else:
+					reg_attribs_map[k] = make_float_if_needed(row[header_map[k]])
+		#from, type, to
+		regulations.append((row[header_map['from_partname']], row[header_map['type']],
+			                row[header_map['to_partname']], reg_attribs_map))
+	return regulations
+
+
+def resolve_regulation (regulations, dna_designs):
+	""" Regulation arcs of each design (by position in the sorted design names)
+	    for (from_partname, type, to_partname, opts) regulations.
+	"""
+	regs_info = {}
+	design_list = sorted(dna_designs.keys())
+	num_of_designs = len(design_list)
+
+	for i in range(num_of_designs):
+		regs_info[i] = design_regulation(regulations, dna_designs[design_list[i]])
+	return regs_info
+
+
+def design_regulation (regulations, design):
+	""" Regulation arcs of a single design.
+	"""
+	regs = []
+	# Parts of the design with each name (in design order)
+	parts_by_name = {}
+	for part in design:
+		parts_by_name.setdefault(part['name'], []).append(part)
+
+	# An arc is saved for every from-to pair of parts with the names given
+	for from_partname, type, to_partname, reg_attribs_map in regulations:
+		if from_partname in parts_by_name and to_partname in parts_by_name:
+			for start_part in parts_by_name[from_partname]:
+				for end_part in parts_by_name[to_partname]:
+					reg_info = {}
+					reg_info['from_part'] = start_part
+					reg_info['type'] = type
+					reg_info['to_part'] = end_part
+					reg_info['opts'] = reg_attribs_map
+					regs.append(reg_info)
+	return regs
+
+
+###############################################################################
+# JSON bundles
+###############################################################################
+
+def typed_input (job, key):
+	""" True if a job input is given as a typed JSON value (rather than as a
+	    file or inline CSV data).
+	"""
+	return (key in job.keys() and key+'_data' not in job.keys() and 
+		    not isinstance(job[key], basestring))
+
+
+def bundle_plot_parameters (params):
+	""" Plot parameters from a JSON object (values are used as given).
+	"""
+	plot_params = {}
+	for k in params.keys():
+		if params[k] != None and params[k] != '':
+			plot_params[k] = params[k]
+	return plot_params
+
+
+def bundle_part_information (parts):
+	""" Part information from a JSON list of parts, each an object with a name,
+	    type and any options (e.g., "color": [0.0, 0.5, 1.0]).
+	"""
+	part_info = {}
+	for part in parts:
+		part_attribs_map = {}
+		for k in part.keys():
+			if k not in ['name', 'type'] and part[k] != None and part[k] != '':
+				part_attribs_map[k] = part[k]
+		part_info[part['name']] = [part['name'], part['type'], part_attribs_map]
+	return part_info
+
+
+def bundle_dna_designs (designs, part_info):
+	""" Designs from a JSON object mapping each design name to a list of part
+	    names (reversed parts start with '-').
+	"""
+	dna_designs = {}
+	for design_name in designs.keys():
+		part_list = []
+		for i in range(len(designs[design_name])):
+			part_list.append(design_part(part_info, designs[design_name][i], i+1))
+		dna_designs[design_name] = part_list
+	return dna_designs
+
+
+def bundle_regulatory_information (regs, part_info, dna_designs):
+	""" Regulation from a JSON list of objects with a from_partname, type,
+	    to_partname and any options.
+	"""
+	regulations = []
+	for reg in regs:
+		reg_attribs_map = {}
+		for k in reg.keys():
+			if k not in ['from_partname', 'type', 'to_partname'] and reg[k] != None and reg[k] != '':
+				reg_attribs_map[k] = reg[k]
+		regulations.append((reg['from_partname'], reg['type'], reg['to_partname'],
+			                reg_attribs_map))
+	return resolve_regulation(regulations, dna_designs)
+
+
+def load_bundle (source):
+	""" Jobs for the assignments of a JSON bundle (a filename, '-' for stdin or
+	    a file-like object). A bundle is either a single assignment or holds a
+	    list of "assignments", which take any keys they do not give (e.g., shared
+	    "params" and "parts") from the bundle.
+	"""
+	if hasattr(source, 'read'):
+		bundle = json.load(source)
+	elif source == '-':
+		bundle = json.load(sys.stdin)
+	else:
+		f = open(source, 'r')
+		try:
+			bundle = json.load(f)
+		finally:
+			f.close()
+	if not isinstance(bundle, dict):
+		raise ValueError('bundle must be a JSON object')
+	if 'assignments' not in bundle.keys():
+		assignments = [bundle]
+	else:
+		assignments = []
+		for assignment in bundle['assignments']:
+			job = {}
+			for k in bundle.keys():
+				if k != 'assignments':
+					job[k] = bundle[k]
+			job.update(assignment)
+			assignments.append(job)
+	jobs = []
+	for i in range(len(assignments)):
+		job = dict(assignments[i])
+		if 'id' not in job.keys():
+			job['id'] = 'A%03d' % i
+		jobs.append(job)
+	return jobs
+
+
+# Glyphs drawn by this process (reused across designs, pages and jobs)
+glyph_cache = dpl.GlyphCache()
+
+# Designs drawn per page when streaming (if designs_per_page is not given)
+STREAM_DESIGNS_PER_PAGE = 20
+
+# Formats written from the Agg buffer (others are saved with savefig, which
+# draws the figure again for every file)
+RASTER_FORMATS = ['png', 'raw', 'rgba']
+
+# Profiler timing the stages of drawing (set by -profile and -trace, nothing 
+# is timed if None)
+profiler = None
+
+def stage (name):
+	""" Context timing a stage of drawing with the profiler (if any).
+	"""
+	return dpl.profile_stage(profiler, name)
+
+def design_renderer (plot_params):
+	""" DNARenderer for the plot parameters (axis_y is set if not given).
+	"""
+	if 'axis_y' not in plot_params.keys():
+		plot_params['axis_y'] = 35
+	left_pad = 0.0
+	right_pad = 0.0
+	scale = 1.0
+	linewidth = 1.0
+	if 'backbone_pad_left' in plot_params.keys():
+		left_pad = plot_params['backbone_pad_left']
+	if 'backbone_pad_right' in plot_params.keys():
+		right_pad = plot_params['backbone_pad_right']
+	if 'scale' in plot_params.keys():
+		scale = plot_params['scale']
+	if 'linewidth' in plot_params.keys():
+		linewidth = plot_params['linewidth']
+	batch_artists = False
+	if 'batch_artists' in plot_params.keys() and plot_params['batch_artists'] == 'Y':
+		batch_artists = True
+	part_glyph_cache = None
+	if 'glyph_cache' in plot_params.keys() and plot_params['glyph_cache'] == 'Y':
+		part_glyph_cache = glyph_cache
+	return dpl.DNARenderer(scale=scale, linewidth=linewidth,
+		                   backbone_pad_left=left_pad, 
+		                   backbone_pad_right=right_pad,
+		                   batch_artists=batch_artists,
+		                   glyph_cache=part_glyph_cache,
+		                   profiler=profiler)
+
+
+def plot_dna (dna_designs, out_filename, plot_params, regs_info, part_renderers=None):
+	# Create the renderer
+	dr = design_renderer(plot_params)
+	fig_y = 5.0
+	fig_x = 5.0
+	if 'fig_y' in plot_params.keys():
+		fig_y = plot_params['fig_y']
+	if 'fig_x' in plot_params.keys():
+		fig_x = plot_params['fig_x']
+
+	# Cycle through the designs and plot them on pages of designs_per_page
+	design_list = sorted(dna_designs.keys())
+	designs_per_page = len(design_list)
+	if 'designs_per_page' in plot_params.keys() and plot_params['designs_per_page'] > 0:
+		designs_per_page = int(plot_params['designs_per_page'])
+	formats = output_formats(out_filename, plot_params)
+	# Thumbnails are composited without a figure
+	export_thumbnails(dr, dna_designs, design_list, regs_info, out_filename,
+		              plot_params, formats)
+	formats = [f for f in formats if f[0] != 'thumb']
+	if len(formats) == 0:
+		return
+	if 'contact_sheet' in plot_params.keys() and plot_params['contact_sheet'] == 'Y':
+		regs_list = None
+		if regs_info != None:
+			regs_list = [regs_info[i] for i in range(len(design_list))]
+		plot_contact_sheets(dr, [(n, dna_designs[n]) for n in design_list], out_filename,
+			                plot_params, formats, regs_list, part_renderers)
+	elif designs_per_page >= len(design_list):
+		dpl.load_matplotlib()
+		import matplotlib.pyplot as plt
+		# Create the figure
+		fig = plt.figure(figsize=(fig_x,fig_y))
+		draw_designs(fig, dr, dna_designs, design_list, regs_info, 0,
+			         len(design_list), plot_params, None, part_renderers)
+
+		# Save the figure
+		export_figure(fig, out_filename, formats)
+
+		# Clear the plotting cache
+		plt.close('all')
+	else:
+		plot_dna_pages(dr, dna_designs, design_list, regs_info, designs_per_page,
+			           out_filename, plot_params, formats, part_renderers)
+
+
+def draw_designs (fig, dr, dna_designs, design_list, regs_info, first, num_rows,
+	              plot_params, max_dna_len=None, part_renderers=None):
+	""" Draw num_rows designs (from the first in design_list) on a figure and
+	    size it to fit. All designs are scaled to max_dna_len if given and
+	    drawn with the SBOL part renderers if part_renderers is None.
+	"""
+	left_pad = dr.backbone_pad_left
+	right_pad = dr.backbone_pad_right
+
+	# We default to the standard regulation renderers
+	reg_renderers = dr.std_reg_renderers()
+	# We default to the SBOL part renderers
+	if part_renderers == None:
+		part_renderers = dr.SBOL_part_renderers()
+
+	ax_list = []
+	drawn_dna_len = 0.0
+	for i in range(first, min(first+num_rows, len(design_list))):
+		# Create axis for the design and plot
+		regs = None
+		if(regs_info != None):
+			regs   =  regs_info[i]
+		design =  dna_designs[design_list[i]]
+
+		ax = fig.add_subplot(num_rows,1,i-first+1)
+		if 'show_title' in plot_params.keys() and plot_params['show_title'] == 'Y':
+			ax.set_title(design_list[i], fontsize=8)
+		start, end = dr.renderDNA(ax, design, part_renderers, regs, reg_renderers)
+		if profiler != None:
+			profiler.count_artists(design_list[i], ax)
+
+		dna_len = end-start
+		if drawn_dna_len < dna_len:
+			drawn_dna_len = dna_len
+		ax_list.append(ax)
+	if max_dna_len == None:
+		max_dna_len = drawn_dna_len
+	for ax in ax_list:
+		ax.set_xticks([])
+		ax.set_yticks([])
+		# Set bounds
+		ax.set_xlim([(-0.01*max_dna_len)-left_pad,
+			        max_dna_len+(0.01*max_dna_len)+right_pad])
+		ax.set_ylim([-plot_params['axis_y'],plot_params['axis_y']])
+		ax.set_aspect('equal')
+		ax.set_axis_off()
+
+	# Update the size of the figure to fit the constructs drawn
+	fig_x_dim = max_dna_len/70.0
+	if fig_x_dim < 1.0:
+		fig_x_dim = 1.0
+	fig_y_dim = 1.2*num_rows
+
+	fig.set_size_inches( (fig_x_dim, fig_y_dim) )
+	with stage('tight_layout'):
+		fig.tight_layout()
+
+
+def output_formats (out_filename, plot_params):
+	""" Formats and resolutions to save given by the output_formats plot parameter
+	    (e.g., 'pdf;png:150', where the dpi parameter or 300 is used if no
+	    resolution is given). Defaults to the format of the output file and, for
+	    PDF output, a PNG of it. The 'thumb' format is a PNG thumbnail drawn
+	    without matplotlib (at dnathumb.DEFAULT_DPI if no resolution is given).
+	"""
+	dpi = 300
+	if 'dpi' in plot_params.keys():
+		dpi = int(plot_params['dpi'])
+	out_format = output_format(out_filename)
+	if 'output_formats' in plot_params.keys():
+		specs = str(plot_params['output_formats']).split(';')
+	else:
+		specs = [out_format]
+		if out_format == 'pdf':
+			specs.append('png')
+	formats = []
+	for spec in specs:
+		spec = spec.strip().lower()
+		if spec != '':
+			fmt_dpi = spec.split(':')
+			fmt = fmt_dpi[0]
+			fmt_res = dpi
+			if fmt == 'thumb':
+				import dnathumb
+				fmt_res = dnathumb.DEFAULT_DPI
+			if len(fmt_dpi) > 1:
+				fmt_res = int(float(fmt_dpi[1]))
+			if (fmt, fmt_res) not in formats:
+				formats.append((fmt, fmt_res))
+	return formats
+
+
+def output_format (out_filename):
+	""" Format of an output file (from its extension, PNG if it has none).
+	"""
+	ext = os.path.splitext(out_filename)[1][1:].lower()
+	if ext == '':
+		return 'png'
+	return ext
+
+
+def export_filename (out_filename, fmt, dpi, formats):
+	""" Filename a format is saved to. The output file is used for its own
+	    format and other formats replace the extension (with the resolution
+	    added if a format is saved more than once).
+	"""
+	root = os.path.splitext(out_filename)[0]
+	fmt_dpis = [f[1] for f in formats if f[0] == fmt]
+	if fmt == 'thumb':
+		if len(fmt_dpis) > 1:
+			return '%s_thumb_%ddpi.png' % (root, dpi)
+		return root + '_thumb.png'
+	if len(fmt_dpis) > 1:
+		return '%s_%ddpi.%s' % (root, dpi, fmt)
+	if fmt == output_format(out_filename):
+		return out_filename
+	return root + '.' + fmt
+
+
+def draw_raster (fig, dpi):
+	""" Draw a figure with its Agg canvas at a resolution and a transparent
+	    background (as savefig with transparent=True) and return its pixels as
+	    an RGBA image (height x width x 4 array of uint8).
+	"""
+	import numpy as np
+	patches = [fig.patch] + [ax.patch for ax in fig.axes]
+	colors = [(p.get_facecolor(), p.get_edgecolor()) for p in patches]
+	fig_dpi = fig.dpi
+	try:
+		fig.dpi = dpi
+		for patch in patches:
+			patch.set_facecolor('none')
+			patch.set_edgecolor('none')
+		fig.canvas.draw()
+		width, height = fig.canvas.get_width_height()
+		image = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
+		return image.reshape((height, width, 4)).copy()
+	finally:
+		fig.dpi = fig_dpi
+		for patch, (facecolor, edgecolor) in zip(patches, colors):
+			patch.set_facecolor(facecolor)
+			patch.set_edgecolor(edgecolor)
+
+
+def write_raster (filename, fmt, image, dpi):
+	""" Write an RGBA image drawn by draw_raster in a raster format.
+	"""
+	if fmt == 'png':
+		import dnathumb
+		dnathumb.write_png(filename, image, dpi)
+	else:
+		f = open(filename, 'wb')
+		try:
+			f.write(image.tostring())
+		finally:
+			f.close()
+
+
+def export_figure (fig, out_filename, formats, page_num=None, pdf_pages=None):
+	""" Save a laid out figure in each of the formats. The figure is drawn once
+	    for each resolution of the raster formats and written from the Agg
+	    buffer, and saved with savefig for the other (vector) formats. Files
+	    are numbered if a page_num is given and PDF output is added to the
+	    PdfPages of its resolution if pdf_pages are given.
+	"""
+	raster_dpis = sorted(set([dpi for fmt, dpi in formats if fmt in RASTER_FORMATS]))
+	for raster_dpi in raster_dpis:
+		with stage('draw_raster'):
+			image = draw_raster(fig, raster_dpi)
+		for fmt, dpi in formats:
+			if fmt in RASTER_FORMATS and dpi == raster_dpi:
+				with stage('savefig_' + fmt):
+					write_raster(export_page_filename(out_filename, fmt, dpi, formats,
+						                              page_num), fmt, image, dpi)
+		del image
+	for fmt, dpi in formats:
+		if fmt not in RASTER_FORMATS:
+			with stage('savefig_' + fmt):
+				if fmt == 'pdf' and pdf_pages != None:
+					pdf_pages[dpi].savefig(fig, transparent=True, dpi=dpi)
+				else:
+					fig.savefig(export_page_filename(out_filename, fmt, dpi, formats,
+						                             page_num),
+						        transparent=True, dpi=dpi, format=fmt)
+
+
+# Glyph atlases used by this process (by dpi, scale and linewidth)
+glyph_atlases = {}
+
+def export_thumbnails (dr, dna_designs, design_list, regs_info, out_filename,
+	                   plot_params, formats):
+	""" Save a thumbnail of all the designs for each 'thumb' format.
+	"""
+	for fmt, dpi in formats:
+		if fmt == 'thumb':
+			import dnathumb
+			key = (dpi, dr.scale, dr.linewidth)
+			if key not in glyph_atlases.keys():
+				glyph_atlases[key] = dnathumb.GlyphAtlas(dpi, dr.scale, dr.linewidth)
+			tr = dnathumb.ThumbnailRenderer(dpi, dr.scale, dr.linewidth,
+				                            dr.backbone_pad_left, dr.backbone_pad_right,
+				                            glyph_atlases[key])
+			regs_list = None
+			if regs_info != None:
+				regs_list = [regs_info[i] for i in range(len(design_list))]
+			with stage('thumbnail'):
+				image = tr.render([dna_designs[n] for n in design_list], regs_list,
+					              axis_y=plot_params['axis_y'])
+				dnathumb.write_png(export_filename(out_filename, fmt, dpi, formats), image)
+
+
+def page_filename (out_filename, page_num):
+	""" Numbered filename for a page (e.g., out_p001.png).
+	"""
+	root, ext = os.path.splitext(out_filename)
+	return '%s_p%03d%s' % (root, page_num, ext)
+
+
+def export_page_filename (out_filename, fmt, dpi, formats, page_num=None):
+	""" Filename a format is saved to (see export_filename), numbered for the
+	    page if a page_num is given.
+	"""
+	filename = export_filename(out_filename, fmt, dpi, formats)
+	if page_num != None:
+		filename = page_filename(filename, page_num)
+	return filename
+
+
+def max_design_length (dr, designs):
+	""" Length of the longest of the designs (as laid out by the renderer).
+	"""
+	max_dna_len = 0.0
+	for design in designs:
+		layout = dnalayout.layout_design(design, None, dr.linewidth,
+			                             dr.backbone_pad_left, dr.backbone_pad_right)
+		if max_dna_len < layout.end-layout.start:
+			max_dna_len = layout.end-layout.start
+	return max_dna_len
+
+
+def plot_dna_pages (dr, dna_designs, design_list, regs_info, designs_per_page,
+	                out_filename, plot_params, formats, part_renderers=None):
+	""" Plot the designs designs_per_page at a time. PDF output is written as a
+	    single multi-page file and other formats as a numbered file per page.
+	    Each page is closed once saved so that only one is held in memory.
+	"""
+	# Size all pages for the longest design so they share the same scale
+	max_dna_len = max_design_length(dr, [dna_designs[n] for n in design_list])
+	pages = []
+	for first in range(0, len(design_list), designs_per_page):
+		page_list = design_list[first:first+designs_per_page]
+		page_regs = None
+		if regs_info != None:
+			page_regs = {}
+			for i in range(len(page_list)):
+				page_regs[i] = regs_info[first+i]
+		pages.append((dna_designs, page_list, page_regs))
+	save_pages(dr, pages, designs_per_page, out_filename, plot_params, formats,
+		       max_dna_len, part_renderers)
+
+
+def save_pages (dr, pages, designs_per_page, out_filename, plot_params, formats,
+	            max_dna_len, part_renderers=None):
+	""" Draw and save pages given as (dna_designs, design_list, regs_info) for
+	    the designs on each (pages can be any iterable, e.g., a generator).
+	"""
+	dpl.load_matplotlib()
+	import matplotlib.pyplot as plt
+	from matplotlib.backends.backend_pdf import PdfPages
+	pdf_pages = {}
+	for fmt, dpi in formats:
+		if fmt == 'pdf':
+			pdf_pages[dpi] = PdfPages(export_filename(out_filename, fmt, dpi, formats))
+	try:
+		page_num = 1
+		for dna_designs, design_list, regs_info in pages:
+			fig = plt.figure()
+			draw_designs(fig, dr, dna_designs, design_list, regs_info, 0,
+				         designs_per_page, plot_params, max_dna_len, part_renderers)
+			export_figure(fig, out_filename, formats, page_num, pdf_pages)
+			plt.close(fig)
+			page_num += 1
+	finally:
+		for pdf in pdf_pages.values():
+			pdf.close()
+
+
+def plot_dna_stream (designs_filename, part_info, out_filename, plot_params,
+	                 regulations=None):
+	""" Plot the designs of a file in pages (see plot_dna_pages) as they are read,
+	    in file order. The file is read twice, once to size the pages for the
+	    longest design and once to draw them, and only the designs of the page
+	    being drawn are held in memory.
+
+	Parameters
+    ----------
+    designs_filename : string
+    	Designs file (see load_dna_designs).
+
+    part_info : dict
+    	Part information the designs refer to.
+
+    out_filename : string
+    	Output file (PDF pages are written to a single file and other formats
+    	to a numbered file per page).
+
+    plot_params : dict
+    	Plot parameters (designs_per_page defaults to STREAM_DESIGNS_PER_PAGE).
+
+    regulations : list (default=None)
+    	Regulation from load_regulations(), resolved for each design as drawn.
+	"""
+	dr = design_renderer(plot_params)
+	designs_per_page = STREAM_DESIGNS_PER_PAGE
+	if 'designs_per_page' in plot_params.keys() and plot_params['designs_per_page'] > 0:
+		designs_per_page = int(plot_params['designs_per_page'])
+	# Thumbnails need every design, so are not drawn when streaming
+	formats = [f for f in output_formats(out_filename, plot_params) if f[0] != 'thumb']
+	max_dna_len = max_design_length(dr, (d[1] for d in iter_dna_designs(designs_filename,
+		                                                                 part_info)))
+	pages = stream_pages(iter_dna_designs(designs_filename, part_info), designs_per_page,
+		                 regulations)
+	save_pages(dr, pages, designs_per_page, out_filename, plot_params, formats,
+		       max_dna_len)
+
+
+def stream_pages (designs, designs_per_page, regulations=None):
+	""" Generator of the pages (see save_pages) of designs_per_page designs taken
+	    from an iterable of (design_name, parts).
+	"""
+	page = []
+	for design in designs:
+		page.append(design)
+		if len(page) == designs_per_page:
+			yield stream_page(page, regulations)
+			page = []
+	if len(page) > 0:
+		yield stream_page(page, regulations)
+
+
+def stream_page (page, regulations):
+	""" (dna_designs, design_list, regs_info) of a page of (design_name, parts).
+	"""
+	dna_designs = {}
+	design_list = []
+	regs_info = None
+	if regulations != None:
+		regs_info = {}
+	for design_name, design in page:
+		if regulations != None:
+			regs_info[len(design_list)] = design_regulation(regulations, design)
+		dna_designs[design_name] = design
+		design_list.append(design_name)
+	return dna_designs, design_list, regs_info
+
+
+###############################################################################
+# Contact sheets
+###############################################################################
+
+# Default grid and size (inches) of contact sheets
+SHEET_COLS = 4
+SHEET_ROWS = 10
+SHEET_SIZE = (8.5, 11.0)
+
+# Fraction of each cell of a sheet left below the design for its caption and
+# either side of it to separate it from its neighbours
+SHEET_CAPTION_HEIGHT = 0.2
+SHEET_MARGIN = 0.03
+
+def sheet_axes (fig, cols, rows):
+	""" Axes of a cols x rows grid covering a figure (filled row by row), each
+	    leaving space below for a caption.
+	"""
+	ax_list = []
+	cell_x = 1.0/cols
+	cell_y = 1.0/rows
+	for row in range(rows):
+		for col in range(cols):
+			ax = fig.add_axes([(col+SHEET_MARGIN)*cell_x, 
+				               1.0-(row+1-SHEET_CAPTION_HEIGHT)*cell_y,
+				               (1.0-2*SHEET_MARGIN)*cell_x, 
+				               (1.0-SHEET_CAPTION_HEIGHT)*cell_y])
+			ax_list.append(ax)
+	return ax_list
+
+
+def plot_contact_sheets (dr, designs, out_filename, plot_params, formats,
+	                     regs_list=None, part_renderers=None):
+	""" Draw designs given as (design_name, parts) packed into a grid on fixed
+	    size sheets, each captioned with its name. All the designs share the
+	    same scale. A single figure and set of axes is laid out once and reused
+	    for every sheet. PDF output is written as a single multi-page file and
+	    other formats as a numbered file per sheet (if there is more than one).
+
+	    The grid and size of the sheets are given by the sheet_cols, sheet_rows,
+	    sheet_x and sheet_y (inches) plot parameters.
+	"""
+	dpl.load_matplotlib()
+	import matplotlib.pyplot as plt
+	from matplotlib.backends.backend_pdf import PdfPages
+	cols = SHEET_COLS
+	rows = SHEET_ROWS
+	sheet_x, sheet_y = SHEET_SIZE
+	if 'sheet_cols' in plot_params.keys():
+		cols = int(plot_params['sheet_cols'])
+	if 'sheet_rows' in plot_params.keys():
+		rows = int(plot_params['sheet_rows'])
+	if 'sheet_x' in plot_params.keys():
+		sheet_x = plot_params['sheet_x']
+	if 'sheet_y' in plot_params.keys():
+		sheet_y = plot_params['sheet_y']
+	reg_renderers = dr.std_reg_renderers()
+	if part_renderers == None:
+		part_renderers = dr.SBOL_part_renderers()
+	max_dna_len = max_design_length(dr, [d[1] for d in designs])
+	num_sheets = max(1, (len(designs)+(cols*rows)-1)//(cols*rows))
+
+	# Lay out the sheet once
+	fig = plt.figure(figsize=(sheet_x, sheet_y))
+	ax_list = sheet_axes(fig, cols, rows)
+	for ax in ax_list:
+		ax.set_xlim([(-0.01*max_dna_len)-dr.backbone_pad_left,
+			        max_dna_len+(0.01*max_dna_len)+dr.backbone_pad_right])
+		ax.set_ylim([-plot_params['axis_y'],plot_params['axis_y']])
+		ax.set_aspect('equal')
+		ax.set_axis_off()
+
+	pdf_pages = {}
+	for fmt, dpi in formats:
+		if fmt == 'pdf':
+			pdf_pages[dpi] = PdfPages(export_filename(out_filename, fmt, dpi, formats))
+	try:
+		for sheet_num in range(num_sheets):
+			first = sheet_num*cols*rows
+			for i in range(first, min(first+(cols*rows), len(designs))):
+				ax = ax_list[i-first]
+				regs = None
+				if regs_list != None:
+					regs = regs_list[i]
+				dr.renderDNA(ax, designs[i][1], part_renderers, regs, reg_renderers)
+				if profiler != None:
+					profiler.count_artists(designs[i][0], ax)
+				ax.text(0.5, 0.0, designs[i][0], transform=ax.transAxes,
+					    horizontalalignment='center', verticalalignment='top',
+					    fontsize=6)
+			page_num = None
+			if num_sheets > 1:
+				page_num = sheet_num+1
+			export_figure(fig, out_filename, formats, page_num, pdf_pages)
+			# Clear the designs from the axes ready for the next sheet
+			for ax in ax_list:
+				for artist in ax.lines + ax.patches + ax.texts + ax.collections:
+					artist.remove()
+	finally:
+		for pdf in pdf_pages.values():
+			pdf.close()
+		plt.close(fig)
+
+
+def plot_dna_svg (dna_designs, out_filename, plot_params, regs_info):
+	""" Plot the designs directly to an SVG file (without matplotlib).
+	"""
+	# Same parameters as the DNARenderer plot_dna would use
+	dr = design_renderer(plot_params)
+	sr = dnasvg.SVGRenderer(scale=dr.scale, linewidth=dr.linewidth,
+		                    backbone_pad_left=dr.backbone_pad_left,
+		                    backbone_pad_right=dr.backbone_pad_right)
+
+	# All designs share the same x-range (as the axes of plot_dna)
+	design_list = sorted(dna_designs.keys())
+	max_dna_len = max_design_length(dr, [dna_designs[d] for d in design_list])
+	x_lim = [(-0.01*max_dna_len)-dr.backbone_pad_left, 
+	         max_dna_len+(0.01*max_dna_len)+dr.backbone_pad_right]
+	y_lim = [-plot_params['axis_y'], plot_params['axis_y']]
+
+	doc = dnasvg.SVGDocument()
+	for i in range(len(design_list)):
+		regs = None
+		if(regs_info != None):
+			regs = regs_info[i]
+		with stage('svg_renderDNA'):
+			sr.renderDNA(doc, dna_designs[design_list[i]], regs, x_lim, y_lim)
+	with stage('svg_save'):
+		doc.save(out_filename)
+
+def plot_designs (dna_designs, out_filename, plot_params, regs_info, part_renderers=None):
+	""" Plot the designs to a file (SVG files are drawn without matplotlib, 
+	    other than contact sheets). Parts are drawn with the part_renderers
+	    given (e.g., those of a PartCatalogue) or the SBOL part renderers.
+	"""
+	contact_sheet = 'contact_sheet' in plot_params.keys() and plot_params['contact_sheet'] == 'Y'
+	if out_filename.lower().endswith('.svg') and not contact_sheet:
+		plot_dna_svg(dna_designs, out_filename, plot_params, regs_info)
+	else:
+		plot_dna(dna_designs, out_filename, plot_params, regs_info, part_renderers)
+
+
+###############################################################################
+# Render cache
+###############################################################################
+
+# Caches opened by this process (by directory)
+render_caches = {}
+
+def render_cache (cache_dir, cache_size=None):
+	""" RenderCache for a directory (cache_size in MB).
+	"""
+	max_bytes = dnacache.DEFAULT_MAX_BYTES
+	if cache_size != None:
+		max_bytes = int(float(cache_size)*1024*1024)
+	if cache_dir not in render_caches.keys():
+		render_caches[cache_dir] = dnacache.RenderCache(cache_dir, max_bytes)
+	render_caches[cache_dir].max_bytes = max_bytes
+	return render_caches[cache_dir]
+
+
+def plot_designs_cached (cache, dna_designs, out_filename, plot_params, regs_info,
+	                     part_renderers=None):
+	""" Plot the designs to a file (see plot_designs) through a render cache.
+	    Returns True if the figure was taken from the cache.
+	"""
+	key = cache.key(dna_designs, regs_info, plot_params, output_format(out_filename))
+	if cache.fetch(key, out_filename):
+		return True
+	# Render to a fixed name so that the files can be reused for any output
+	render_dir = tempfile.mkdtemp()
+	try:
+		plot_designs(dna_designs, os.path.join(render_dir, dnacache.ENTRY_ROOT +
+			         os.path.splitext(out_filename)[1]), plot_params, regs_info,
+			         part_renderers)
+		cache.store(key, render_dir)
+		root = os.path.splitext(out_filename)[0]
+		for name in os.listdir(render_dir):
+			shutil.copyfile(os.path.join(render_dir, name),
+				            root+name[len(dnacache.ENTRY_ROOT):])
+	finally:
+		shutil.rmtree(render_dir, True)
+	return False
+
+
+###############################################################################
+# Part catalogues
+###############################################################################
+
+# Most part catalogues kept by a process
+MAX_PART_CATALOGUES = 16
+
+class PartCatalogue:
+	""" Plot parameters and part information compiled once and shared by all the
+	    assignments of a job. Part colors are converted to tuples, the options
+	    of each part are shared by every design it is used in and the renderer
+	    of each part type is looked up once (part_renderers, given to renderDNA
+	    in place of DNARenderer.SBOL_part_renderers()).
+	"""
+
+	def __init__(self, plot_params, part_info):
+		self.plot_params = plot_params
+		self.part_info = {}
+		self.part_renderers = {}
+		sbol_renderers = dpl.DNARenderer().SBOL_part_renderers()
+		for part_name in part_info.keys():
+			name, part_type, part_attribs_map = part_info[part_name]
+			opts = dict(part_attribs_map)
+			for k in ['color', 'label_color']:
+				if k in opts.keys() and isinstance(opts[k], list):
+					opts[k] = tuple(opts[k])
+			self.part_info[part_name] = [name, part_type, opts]
+			if part_type in sbol_renderers.keys():
+				self.part_renderers[part_type] = sbol_renderers[part_type]
+
+
+# Catalogues compiled by this process (by the inputs they were loaded from)
+part_catalogues = {}
+
+def catalogue_key (job, key):
+	""" Key identifying the version of a job input a catalogue was loaded from
+	    (files by their path, modification time and size).
+	"""
+	if typed_input(job, key):
+		return json.dumps(job[key], sort_keys=True)
+	if key+'_data' in job.keys():
+		return job[key+'_data']
+	stat = os.stat(job[key])
+	return (os.path.abspath(job[key]), stat.st_mtime, stat.st_size)
+
+
+def part_catalogue (job):
+	""" PartCatalogue for the plot parameters and parts of a job. Files are only
+	    compiled again if they are modified, so assignments sharing the job's 
+	    parameters and parts (e.g., the -params and -parts defaults) are not
+	    parsed again.
+	"""
+	key = (catalogue_key(job, 'params'), catalogue_key(job, 'parts'))
+	if key not in part_catalogues.keys():
+		if len(part_catalogues) >= MAX_PART_CATALOGUES:
+			part_catalogues.clear()
+		if typed_input(job, 'params'):
+			plot_params = bundle_plot_parameters(job['params'])
+		else:
+			plot_params = load_plot_parameters(job_input(job, 'params'))
+		if typed_input(job, 'parts'):
+			part_info = bundle_part_information(job['parts'])
+		else:
+			part_info = load_part_information(job_input(job, 'parts'))
+		part_catalogues[key] = PartCatalogue(plot_params, part_info)
+	return part_catalogues[key]
+
+
+###############################################################################
+# Render worker
+###############################################################################
+
+def job_input (job, key):
+	""" File (or inline data) of a job input.
+	"""
+	if key+'_data' in job.keys():
+		return StringIO(job[key+'_data'])
+	return job[key]
+
+
+def load_job (job):
+	""" Plot parameters, designs, regulation (None if not given) and part 
+	    renderers of a job. Each input is a file, inline CSV data or a typed
+	    JSON value.
+	"""
+	catalogue = part_catalogue(job)
+	plot_params = dict(catalogue.plot_params)
+	part_info = catalogue.part_info
+	if typed_input(job, 'designs'):
+		dna_designs = bundle_dna_designs(job['designs'], part_info)
+	else:
+		dna_designs = load_dna_designs(job_input(job, 'designs'), part_info)
+	regs_info = None
+	if typed_input(job, 'regulation'):
+		regs_info = bundle_regulatory_information(job['regulation'], part_info,
+			                                      dna_designs)
+	elif 'regulation' in job.keys() or 'regulation_data' in job.keys():
+		regs_info = load_regulatory_information(job_input(job, 'regulation'),
+			                                    part_info, dna_designs)
+	return plot_params, dna_designs, regs_info, catalogue.part_renderers
+
+
+def run_job (job):
+	""" Render a single worker job and return its result.
+	"""
+	result = {'id': None, 'status': 'ok'}
+	start_time = time.time()
+	try:
+		if not isinstance(job, dict):
+			raise ValueError('job must be a JSON object')
+		if 'id' in job.keys():
+			result['id'] = job['id']
+		plot_params, dna_designs, regs_info, part_renderers = load_job(job)
+		result['output'] = job['output']
+		if 'cache' in job.keys():
+			cache = render_cache(job['cache'], job.get('cache_size'))
+			result['cached'] = plot_designs_cached(cache, dna_designs, job['output'],
+				                                   plot_params, regs_info, part_renderers)
+		else:
+			plot_designs(dna_designs, job['output'], plot_params, regs_info,
+				         part_renderers)
+	except Exception as e:
+		# Drop any partly drawn figure so the next job starts clean
+		if 'matplotlib.pyplot' in sys.modules:
+			sys.modules['matplotlib.pyplot'].close('all')
+		result['status'] = 'error'
+		if isinstance(e, KeyError):
+			result['error'] = 'missing %s' % str(e)
+		else:
+			result['error'] = str(e)
+	result['time'] = time.time()-start_time
+	return result
+
+
+def serve_jobs (in_stream, out_stream, job_defaults=None):
+	""" Render jobs read as JSON lines from in_stream, writing a JSON line for
+	    each to out_stream. Keys missing from a job are taken from job_defaults.
+	    Returns False if the worker was asked to shut down.
+	"""
+	# readline() avoids the read-ahead buffering of file iteration on pipes
+	for line in iter(in_stream.readline, ''):
+		line = line.strip()
+		if line == '':
+			continue
+		try:
+			job = json.loads(line)
+		except ValueError as e:
+			job = None
+			result = {'id': None, 'status': 'error', 'error': 'invalid JSON: %s' % str(e)}
+		if job != None:
+			if isinstance(job, dict) and job.get('command') == 'shutdown':
+				out_stream.write(json.dumps({'id': job.get('id'), 'status': 'shutdown'}) + '\n')
+				out_stream.flush()
+				return False
+			if isinstance(job, dict) and job_defaults != None:
+				for k in job_defaults.keys():
+					if k not in job.keys():
+						job[k] = job_defaults[k]
+			result = run_job(job)
+		out_stream.write(json.dumps(result) + '\n')
+		out_stream.flush()
+	return True
+
+
+def warm_up ():
+	""" Draw a small labelled design so that fonts are loaded before any jobs.
+	"""
+	dpl.load_matplotlib()
+	import matplotlib.pyplot as plt
+	fig = plt.figure(figsize=(1,1))
+	ax = fig.add_subplot(1,1,1)
+	dr = dpl.DNARenderer()
+	design = [{'type':'Promoter', 'name':'p', 'fwd':True, 'opts':{'label':'p'}}]
+	dr.renderDNA(ax, design, dr.SBOL_part_renderers())
+	fig.canvas.draw()
+	plt.close('all')
+
+
+def run_worker (port=None, job_defaults=None):
+	""" Render jobs from stdin (or connections to a local port) until shut down.
+	"""
+	warm_up()
+	if port == None:
+		sys.stdout.write(json.dumps({'status': 'ready'}) + '\n')
+		sys.stdout.flush()
+		serve_jobs(sys.stdin, sys.stdout, job_defaults)
+	else:
+		import SocketServer
+
+		class WorkerRequestHandler (SocketServer.StreamRequestHandler):
+			""" Serves the jobs sent over a single worker connection.
+			"""
+			def handle (self):
+				if serve_jobs(self.rfile, self.wfile, self.server.job_defaults) == False:
+					self.server.running = False
+
+		server = SocketServer.TCPServer(('127.0.0.1', port), WorkerRequestHandler)
+		server.running = True
+		server.job_defaults = job_defaults
+		sys.stdout.write(json.dumps({'status': 'ready', 'port': server.server_address[1]}) + '\n')
+		sys.stdout.flush()
+		while server.running:
+			server.handle_request()
+		server.server_close()
+
+
+###############################################################################
+# Batch rendering
+###############################################################################
+
+BATCH_FILES = {'params':'plot_parameters.csv', 'parts':'part_information.csv',
+               'designs':'dna_designs.csv', 'regulation':'reg_information.csv'}
+
+def discover_jobs (directory):
+	""" Jobs for every set of CSV files in a job output directory.
+	"""
+	jobs = []
+	for filename in sorted(os.listdir(directory)):
+		if filename.endswith(BATCH_FILES['designs']):
+			prefix = os.path.join(directory, filename[:-len(BATCH_FILES['designs'])])
+			job = {'id': os.path.basename(prefix), 'output': prefix+'out.pdf'}
+			for key in BATCH_FILES.keys():
+				if os.path.exists(prefix+BATCH_FILES[key]):
+					job[key] = prefix+BATCH_FILES[key]
+			jobs.append(job)
+	return jobs
+
+
+def load_job_list (filename):
+	""" Jobs for the CSV quadruples listed (one per line) in a file.
+	"""
+	jobs = []
+	job_reader = csv.reader(open_csv(filename), delimiter=',')
+	for row in job_reader:
+		row = [x.strip() for x in row]
+		if len(row) < 3 or row[2] == '' or row[0].startswith('#'):
+			continue
+		job = {'id': row[2], 'designs': row[2]}
+		if row[0] != '':
+			job['params'] = row[0]
+		if row[1] != '':
+			job['parts'] = row[1]
+		if len(row) > 3 and row[3] != '':
+			job['regulation'] = row[3]
+		if len(row) > 4 and row[4] != '':
+			job['output'] = row[4]
+		elif row[2].endswith(BATCH_FILES['designs']):
+			job['output'] = row[2][:-len(BATCH_FILES['designs'])]+'out.pdf'
+		else:
+			job['output'] = os.path.splitext(row[2])[0]+'_out.pdf'
+		jobs.append(job)
+	return jobs
+
+
+def render_batch (jobs, workers=None):
+	""" Render jobs across a pool of processes (all CPUs if workers is None).
+	    Failed jobs are reported in the results rather than stopping the batch.
+
+	Parameters
+    ----------
+    jobs : list(dict)
+    	Jobs in the format used by the render worker.
+
+    workers : int (default=None)
+    	Number of worker processes.
+
+    Returns
+    -------
+    results : list(dict)
+    	Result of each job (in the order given), see run_job().
+	"""
+	import multiprocessing
+	if workers == None:
+		workers = multiprocessing.cpu_count()
+	workers = max(1, min(workers, len(jobs)))
+	if workers == 1:
+		return [run_job(job) for job in jobs]
+	# Load fonts once so that the forked workers start warm
+	warm_up()
+	pool = multiprocessing.Pool(workers)
+	try:
+		results = pool.map(run_job, jobs, 1)
+	finally:
+		pool.close()
+		pool.join()
+	return results
+
+
+def print_batch_summary (results, total_time):
+	""" Print the time taken and any error for each job of a batch.
+	"""
+	num_ok = 0
+	for result in results:
+		if result['status'] == 'ok':
+			num_ok += 1
+			status = 'ok'
+			if 'cached' in result.keys() and result['cached'] == True:
+				status = 'cached'
+			print '%-40s %-6s %7.2fs  %s' % (result['id'], status, result['time'], result['output'])
+		else:
+			print '%-40s error  %7.2fs  %s' % (result['id'], result['time'], result['error'])
+	print 'rendered %d of %d in %.2fs' % (num_ok, len(results), total_time)
+
+
+def save_profile (summary_filename=None, trace_filename=None):
+	""" Write the profiler summary and Chrome trace to the files given (if any).
+	"""
+	if profiler == None:
+		return
+	if summary_filename:
+		profiler.save(summary_filename)
+	if trace_filename:
+		profiler.save(trace_filename, trace=True)
+
+
+def is_valid_file(parser, arg):
+    if not os.path.exists(arg):
+        parser.error("The file %s does not exist!" % arg)
+    else:
+        return open(arg, 'r')  # return an open file handle
+
+
+def main():	
+	# Parse the arguments
+	parser = ArgumentParser(description="file paths as arguments")
+	parser.add_argument("-params", dest="params", required=False,
+					help="plot_params.csv", metavar="FILE",
+                    type=lambda x: is_valid_file(parser, x))
+	parser.add_argument("-parts", dest="parts", required=False,
+					help="parts_information.csv", metavar="FILE",
+                    type=lambda x: is_valid_file(parser, x))
+	parser.add_argument("-regulation", dest="regulation", required=False,
+					help="reg_information.csv", metavar="FILE",
+                    type=lambda x: is_valid_file(parser, x))
+	parser.add_argument("-designs", dest="designs", required=False,
+					help="dna_designs.csv", metavar="FILE",
+                    type=lambda x: is_valid_file(parser, x))
+	parser.add_argument("-output", dest="output_pdf", required=False,
+					help="output filename (pdf, or svg to draw without matplotlib)")
+	parser.add_argument("-stream", dest="stream", action="store_true",
+					help="draw pages of designs as they are read (in file order)")
+	parser.add_argument("-profile", dest="profile", required=False,
+					help="write a JSON summary of the time taken by each stage",
+					metavar="FILE")
+	parser.add_argument("-trace", dest="trace", required=False,
+					help="write a Chrome trace of the stages of drawing", metavar="FILE")
+	parser.add_argument("-worker", dest="worker", action="store_true",
+					help="render jobs read as JSON lines (see usage)")
+	parser.add_argument("-port", dest="port", type=int, required=False,
+					help="serve worker jobs on this local port (0 picks a free port)")
+	parser.add_argument("-batch", dest="batch", nargs="+", required=False,
+					help="job output directories or CSV quadruple lists to render",
+					metavar="DIR_OR_LIST")
+	parser.add_argument("-workers", dest="workers", type=int, required=False,
+					help="number of processes for -batch and -bundle (default: all CPUs)")
+	parser.add_argument("-bundle", dest="bundle", required=False,
+					help="JSON bundle of assignments to render ('-' for stdin)",
+					metavar="FILE")
+	parser.add_argument("-cache", dest="cache", required=False,
+					help="render cache directory", metavar="DIR")
+	parser.add_argument("-cache_size", dest="cache_size", type=float, required=False,
+					help="maximum size of the render cache in MB (default: %d)" %
+					(dnacache.DEFAULT_MAX_BYTES/(1024*1024)))
+	parser.add_argument("-cache_stats", dest="cache_stats", action="store_true",
+					help="print render cache statistics")
+	parser.add_argument("-cache_purge", dest="cache_purge", action="store_true",
+					help="remove all figures from the render cache")
+	args = parser.parse_args()
+
+	# Parameters and parts given with -batch, -bundle or -worker are shared by
+	# every assignment that does not give its own
+	job_defaults = {}
+	if args.params:
+		job_defaults['params'] = args.params.name
+	if args.parts:
+		job_defaults['parts'] = args.parts.name
+	if args.cache:
+		job_defaults['cache'] = args.cache
+		if args.cache_size != None:
+			job_defaults['cache_size'] = args.cache_size
+	if args.cache_stats or args.cache_purge:
+		if not args.cache:
+			parser.error('-cache is required')
+		cache = render_cache(args.cache, args.cache_size)
+		if args.cache_purge:
+			cache.purge()
+		if args.cache_stats:
+			stats = cache.stats()
+			print 'hits %d  misses %d  entries %d  size %.1f of %.1f MB' % (stats['hits'],
+			      stats['misses'], stats['entries'], stats['bytes']/(1024.0*1024.0),
+			      stats['max_bytes']/(1024.0*1024.0))
+		return
+	if args.worker:
+		run_worker(args.port, job_defaults)
+		return
+	if args.batch or args.bundle:
+		jobs = []
+		if args.bundle:
+			if args.bundle != '-' and not os.path.exists(args.bundle):
+				parser.error("The file %s does not exist!" % args.bundle)
+			jobs = load_bundle(args.bundle)
+			# The output given is used by a bundle holding a single assignment
+			if args.output_pdf and len(jobs) == 1 and 'output' not in jobs[0].keys():
+				jobs[0]['output'] = args.output_pdf
+		for path in args.batch or []:
+			if os.path.isdir(path):
+				jobs += discover_jobs(path)
+			else:
+				jobs += load_job_list(path)
+		for job in jobs:
+			for k in job_defaults.keys():
+				if k not in job.keys():
+					job[k] = job_defaults[k]
+		start_time = time.time()
+		results = render_batch(jobs, args.workers)
+		print_batch_summary(results, time.time()-start_time)
+		if len([r for r in results if r['status'] != 'ok']) > 0:
+			sys.exit(1)
+		return
+	for arg, name in [(args.params, '-params'), (args.parts, '-parts'),
+		              (args.designs, '-designs'), (args.output_pdf, '-output')]:
+		if arg == None:
+			parser.error('argument %s is required' % name)
+
+	global profiler
+	if args.profile or args.trace:
+		profiler = dpl.Profiler()
+
+	# Process arguments
+	with stage('parse_params'):
+		plot_params = load_plot_parameters(args.params.name)
+	with stage('parse_parts'):
+		part_info = load_part_information(args.parts.name)
+	if args.stream:
+		regulations = None
+		if(args.regulation):
+			with stage('parse_regulation'):
+				regulations = load_regulations(args.regulation.name)
+		with stage('plot'):
+			plot_dna_stream(args.designs.name, part_info, args.output_pdf, plot_params,
+				            regulations)
+		save_profile(args.profile, args.trace)
+		return
+	with stage('parse_designs'):
+		dna_designs = load_dna_designs (args.designs.name, part_info)
+
+#	for param in plot_params.items():
+#		print param
+#	for part in part_info.items():
+#		print part
+#	for dna in dna_designs.items():
+#		print dna[0]
+#		for construct in dna[1]:
+#			print construct
+	
+	regs_info = None
+	if(args.regulation):
+		with stage('parse_regulation'):
+			regulations = load_regulations(args.regulation.name)
+		with stage('resolve_regulation'):
+			regs_info = resolve_regulation(regulations, dna_designs)
+		
+#		for reg in regs_info.items():
+#			print reg
+
+	with stage('plot'):
+		if args.cache:
+			plot_designs_cached(render_cache(args.cache, args.cache_size), dna_designs,
+				                args.output_pdf, plot_params, regs_info)
+		else:
+			plot_designs(dna_designs, args.output_pdf, plot_params, regs_info)
+	save_profile(args.profile, args.trace)
+
+if __name__ == "__main__":
+ 	main()
@@ -7,6 +7,8 @@
 	Usage:
 	------
 	python quick.py -input "p.gray p.lightblue i.lightred r.green c.orange t.purple -t.black -c.yellow -p.yellow" -output out.pdf
+	python quick.py -batch SPEC_FILENAME [-outdir OUT_DIR] [-format pdf] [-workers NUM_WORKERS]
+	python quick.py -batch SPEC_FILENAME -sheet OUT_FILENAME [-cols 4] [-rows 10]
 	allowed part types: 
 	   p: promoter   i: ribozyme   r: rbs   c: cds   t: terminator   s: spacer   =: scar
 
@@ -15,6 +17,19 @@
 	allowed colors
 	   black, gray, red, orange, yellow, green, blue, purple, lightred, lightorange, 
 	   lightyellow, lightgreen, lightblue, lightpurple
+
+	Batch mode:
+	-----------
+	Reads one spec per line from SPEC_FILENAME ('-' for stdin) and draws each
+	in-process across a pool of worker processes (all CPUs by default) to
+	OUT_DIR/NAME.FORMAT. A line can give its NAME before a tab (otherwise
+	the spec number is used, e.g., quick_000), and names must be unique. Blank
+	lines and lines starting with '#' are ignored. A summary of the time taken
+	and any errors is printed.
+
+	With -sheet, the specs are instead packed into a grid (cols by rows) on
+	letter size contact sheets captioned with their names (PDF output is a
+	single multi-page file and other formats a numbered file per sheet).
 """
 #    Quickly Plot SBOL Designs
 #    Copyright (C) 2014 by
@@ -23,14 +38,14 @@
 #    All rights reserved.
 #    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
 
-# Set the backend to use (important for headless servers)
-import matplotlib
-matplotlib.use('Agg')
-
-# Other modules we require
+# Modules we require (matplotlib is imported, with the Agg backend set by 
+# dnaplotlib, once the arguments have been checked)
 import argparse
 import dnaplotlib as dpl
-import matplotlib.pyplot as plt
+import multiprocessing
+import os
+import sys
+import time
 
 def process_arguments (input):
 	# Types mapping
@@ -71,7 +86,7 @@ def process_arguments (input):
 				part_fwd = True
 				if part_short_type[0] == '-':
 					part_fwd = False
-					part_short_type = el[1:]
+					part_short_type = part_short_type[1:]
 				if part_short_type in types.keys():
 					part_type = types[part_short_type]
 					part_color = part_parts[1]
@@ -85,16 +100,9 @@ def process_arguments (input):
 	return part_list
 
 
-def main():
-	# Parse the command line inputs
-	parser = argparse.ArgumentParser(description="one line quick plot")
-	parser.add_argument("-input",  dest="input",  required=True,  help="\"p.gray p.lightblue i.lightred r.green c.orange t.purple -t.black -c.yellow -p.yellow\"", metavar="string")
-	parser.add_argument("-output", dest="output", required=False, help="output pdf filename")
-	args = parser.parse_args()
-
-	# Process the arguments
-	design = process_arguments(args.input)
-
+def plot_design (design, out_filename):
+	""" Draw a design (list of parts) to a file.
+	"""
 	# Create objects for plotting (dnaplotlib)
 	dr = dpl.DNARenderer(linewidth=1.15, backbone_pad_left=3, backbone_pad_right=3)
 	reg_renderers = dr.std_reg_renderers()
@@ -102,6 +110,8 @@ def main():
 	regs = None
 
 	# Generate the figure
+	dpl.load_matplotlib()
+	import matplotlib.pyplot as plt
 	fig = plt.figure(figsize=(5.0,5.0))
 	ax = fig.add_subplot(1,1,1)
 	
@@ -125,11 +135,154 @@ def main():
 	if fig_x_dim < 1.0:
 		fig_x_dim = 1.0
 	fig_y_dim = 1.2
-	plt.gcf().set_size_inches( (fig_x_dim, fig_y_dim) )
+	fig.set_size_inches( (fig_x_dim, fig_y_dim) )
 	
 	# Save the figure
-	plt.tight_layout()
-	fig.savefig(args.output, transparent=True)
+	fig.tight_layout()
+	fig.savefig(out_filename, transparent=True)
+	plt.close(fig)
+
+
+###############################################################################
+# Batch mode
+###############################################################################
+
+def load_specs (source):
+	""" (name, spec) of each spec in a file ('-' for stdin or a file-like 
+	    object), with names defaulting to the spec number.
+	"""
+	if hasattr(source, 'read'):
+		lines = source.readlines()
+	elif source == '-':
+		lines = sys.stdin.readlines()
+	else:
+		f = open(source, 'r')
+		try:
+			lines = f.readlines()
+		finally:
+			f.close()
+	specs = []
+	for line in lines:
+		line = line.strip()
+		if line == '' or line.startswith('#'):
+			continue
+		if '\t' in line:
+			name, spec = line.split('\t', 1)
+			name = os.path.basename(name.strip())
+		else:
+			name = 'quick_%03d' % len(specs)
+			spec = line
+		specs.append((name, spec.strip()))
+	return specs
+
+
+def render_spec (job):
+	""" Draw a spec job ({'id', 'spec', 'output'}), returning its result with
+	    the status ('ok' or 'error'), time taken and any error.
+	"""
+	start_time = time.time()
+	result = {'id': job['id'], 'output': job['output'], 'status': 'ok'}
+	try:
+		plot_design(process_arguments(job['spec']), job['output'])
+	except Exception as e:
+		if 'matplotlib.pyplot' in sys.modules:
+			sys.modules['matplotlib.pyplot'].close('all')
+		result['status'] = 'error'
+		result['error'] = str(e)
+	result['time'] = time.time()-start_time
+	return result
+
+
+def render_specs (specs, out_dir, out_format='pdf', workers=None):
+	""" Draw (name, spec) pairs to out_dir/name.out_format across a pool of
+	    processes (all CPUs if workers is None). Returns the result of each.
+	    Names must be unique (so that no output overwrites another).
+	"""
+	names = set()
+	for name, spec in specs:
+		if name in names:
+			raise ValueError('duplicate spec name: %s' % name)
+		names.add(name)
+	if not os.path.isdir(out_dir):
+		os.makedirs(out_dir)
+	jobs = []
+	for name, spec in specs:
+		jobs.append({'id': name, 'spec': spec, 
+		             'output': os.path.join(out_dir, name+'.'+out_format)})
+	if workers == None:
+		workers = multiprocessing.cpu_count()
+	workers = max(1, min(workers, len(jobs)))
+	if workers == 1:
+		return [render_spec(job) for job in jobs]
+	# Load pyplot and the matplotlib classes used by dnaplotlib before forking
+	# so that the workers start warm (imported for this side effect only)
+	dpl.load_matplotlib()
+	__import__('matplotlib.pyplot')
+	pool = multiprocessing.Pool(workers)
+	try:
+		results = pool.map(render_spec, jobs, 1)
+	finally:
+		pool.close()
+		pool.join()
+	return results
+
+
+def plot_sheets (specs, out_filename, cols=None, rows=None):
+	""" Draw (name, spec) pairs packed onto contact sheets.
+	"""
+	import plot_SBOL_designs as psd
+	plot_params = {'linewidth': 1.15, 'backbone_pad_left': 3, 'backbone_pad_right': 3,
+	               'axis_y': 35}
+	if cols != None:
+		plot_params['sheet_cols'] = cols
+	if rows != None:
+		plot_params['sheet_rows'] = rows
+	dr = psd.design_renderer(plot_params)
+	designs = [(name, process_arguments(spec)) for name, spec in specs]
+	formats = [(psd.output_format(out_filename), 300)]
+	psd.plot_contact_sheets(dr, designs, out_filename, plot_params, formats)
+
+
+def main():
+	# Parse the command line inputs
+	parser = argparse.ArgumentParser(description="one line quick plot")
+	parser.add_argument("-input",  dest="input",  required=False, help="\"p.gray p.lightblue i.lightred r.green c.orange t.purple -t.black -c.yellow -p.yellow\"", metavar="string")
+	parser.add_argument("-output", dest="output", required=False, help="output pdf filename")
+	parser.add_argument("-batch",  dest="batch",  required=False, help="file of specs, one per line ('-' for stdin)")
+	parser.add_argument("-outdir", dest="outdir", required=False, default=".", help="directory batch outputs are written to")
+	parser.add_argument("-format", dest="format", required=False, default="pdf", help="format of batch outputs (e.g., pdf, png or svg)")
+	parser.add_argument("-workers", dest="workers", required=False, type=int, help="number of worker processes for batch mode")
+	parser.add_argument("-sheet",  dest="sheet",  required=False, help="draw the batch on contact sheets saved to this file")
+	parser.add_argument("-cols",   dest="cols",   required=False, type=int, help="designs across each contact sheet")
+	parser.add_argument("-rows",   dest="rows",   required=False, type=int, help="designs down each contact sheet")
+	args = parser.parse_args()
+
+	if args.batch != None and args.sheet != None:
+		plot_sheets(load_specs(args.batch), args.sheet, args.cols, args.rows)
+		return
+	if args.batch != None:
+		start_time = time.time()
+		try:
+			results = render_specs(load_specs(args.batch), args.outdir, args.format,
+				                   args.workers)
+		except ValueError as e:
+			parser.error(str(e))
+		num_ok = 0
+		for result in results:
+			if result['status'] == 'ok':
+				num_ok += 1
+				print '%-30s ok     %7.2fs  %s' % (result['id'], result['time'], result['output'])
+			else:
+				print '%-30s error  %7.2fs  %s' % (result['id'], result['time'], result['error'])
+		print 'rendered %d of %d in %.2fs' % (num_ok, len(results), time.time()-start_time)
+		if num_ok < len(results):
+			sys.exit(1)
+		return
+	if args.input == None or args.output == None:
+		parser.error('-input and -output are required (or -batch)')
+
+	# Process the arguments and plot the design
+	plot_design(process_arguments(args.input), args.output)
 	
 
 # Enable the script to be run from the command line	
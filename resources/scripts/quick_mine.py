@@ -4,7 +4,7 @@
 
  	Usage:
     ------
-    python quick.py -input "p.gray p.lightblue i.lightred r.green c.orange t.purple -t.black -c.yellow -p.yellow" -output out.pdf -clean true
+    python quick_mine.py -input "p.gray p.lightblue i.lightred r.green c.orange t.purple -t.black -c.yellow -p.yellow" -output out.pdf
     allowed part types: 
      p: promoter   i: ribozyme   r: rbs   c: cds   t: terminator   s: spacer   =: scar
 
@@ -22,8 +22,8 @@
 #    OSI Non-Profit Open Software License ("Non-Profit OSL") 3.0 license.
 
 from argparse import ArgumentParser
-import os.path
-import os
+from StringIO import StringIO
+import plot_SBOL_designs as psd
 import re
 
 
@@ -104,14 +104,10 @@ def process_arguments (input):
 	return part_list
 		#print 'partname', part_name,'partcolor',colors[part_color]
 	
-def write_files (part_list):
+def write_files (part_list, file_plotparams, file_partinfo, file_dnadesign):
 
 	types = get_part_types()
 
-	file_plotparams = open('plot_parameters.csv', 'w')
-	file_partinfo   = open('part_information.csv', 'w')
-	file_dnadesign  = open('dna_designs.csv', 'w')
-	
 	file_plotparams.write(get_plot_param_defaults())
 	file_partinfo.write("part_name,type,x_extent,y_extent,start_pad,end_pad,color,hatch,arrowhead_height,arrowhead_length,linestyle,linewidth\n")
 	file_dnadesign.write("design_name,parts,\n")
@@ -131,9 +127,9 @@ def write_files (part_list):
 		#part_information name does not start with r if reverse
 		file_partinfo.write(part_info_line+'\n')
 
-		#dna_design name starts with r if reverse
+		#dna_design name starts with - if reverse
 		if(direction == '-'):
-			name = "r" + name
+			name = "-" + name
 		
 		dnadesign_string += name + ","
 		
@@ -148,7 +144,6 @@ def main():
 	parser = ArgumentParser(description="one line quick plot")
 	parser.add_argument("-input",  dest="input",  required=True,  help="\"p.gray p.lightblue i.lightred r.green c.orange t.purple -t.black -c.yellow -p.yellow\"", metavar="string")
 	parser.add_argument("-output", dest="output", required=False, help="output pdf filename")
-	parser.add_argument("-clean",  dest="clean",  required=False, help="true/false: remove csv generated files")
 	#parser.add_argument("-reg",    dest="reg",    required=False, help="infer regulation arcs from colors")
 	args = parser.parse_args()
 
@@ -158,45 +153,31 @@ def main():
 	#input
 	part_list = process_arguments(args.input)
 	#output
-	output_pdf = "out.pdf"
+	out_pdf = "out.pdf"
 	if(args.output):
 		out_pdf = args.output
 
 	
 	######################################################################
-	#  write csvs
+	#  write csvs (in memory, so nothing is left in the current directory)
 	######################################################################
-	write_files(part_list)
+	file_plotparams = StringIO()
+	file_partinfo   = StringIO()
+	file_dnadesign  = StringIO()
+	write_files(part_list, file_plotparams, file_partinfo, file_dnadesign)
 
 
 	######################################################################
-	#  make figure
+	#  make figure (in this process)
 	######################################################################
-	# [TEG] Commented this out as we shouldn't use paths (instead add python to $PATH)
-	#command = "~/anaconda/bin/python -W ignore " + os.path.dirname(__file__) + "/plot_SBOL_designs.py"
-	command = "~/anaconda/bin/python -W ignore " + "/Users/peng/MIT-BroadFoundry/dnaplotlib/plot_SBOL_designs.py"
-	options = ""
-	options += " -params plot_parameters.csv"
-	options += " -parts part_information.csv"
-	options += " -designs dna_designs.csv "
-	options += " -output " + out_pdf
-	#options += " -regulation reg_information.csv"
+	file_plotparams.seek(0)
+	file_partinfo.seek(0)
+	file_dnadesign.seek(0)
+	plot_params = psd.load_plot_parameters(file_plotparams)
+	part_info = psd.load_part_information(file_partinfo)
+	dna_designs = psd.load_dna_designs(file_dnadesign, part_info)
 	print 'writing ' + out_pdf
-	os.system(command + options)
-
-
-	######################################################################
-	#  remove csvs
-	######################################################################
-	if(args.clean):
-		if(os.path.isfile('plot_parameters.csv')):
-			os.remove('plot_parameters.csv')
-		if(os.path.isfile('part_information.csv')):
-			os.remove('part_information.csv')
-		if(os.path.isfile('dna_designs.csv')):
-			os.remove('dna_designs.csv')
-		if(os.path.isfile('reg_information.csv')):
-			os.remove('reg_information.csv')
+	psd.plot_designs(dna_designs, out_pdf, plot_params, None)
 
 
 
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+    Tests of dnacache (run from resources/scripts with
+    python -m unittest discover tests).
+"""
+
+from multiprocessing.pool import ThreadPool
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dnacache
+
+class RenderCacheTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.cache = dnacache.RenderCache(self.tmp_dir)
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir, True)
+
+	def test_concurrent_counts(self):
+		pool = ThreadPool(8)
+		try:
+			pool.map(self.cache.count, ['hits', 'misses', 'hits']*100)
+		finally:
+			pool.close()
+			pool.join()
+		stats = self.cache.stats()
+		self.assertEqual((stats['hits'], stats['misses']), (200, 100))
+		# The counts are kept in a file of fixed size
+		size = os.path.getsize(os.path.join(self.tmp_dir, dnacache.STATS_FILE))
+		self.cache.count('hits')
+		self.assertEqual(os.path.getsize(os.path.join(self.tmp_dir, dnacache.STATS_FILE)),
+		                 size)
+		self.cache.purge()
+		self.assertEqual(self.cache.stats()['hits'], 0)
+
+	def test_library_versions_in_key(self):
+		library_version = dnacache.library_version
+		designs = {'a': [{'type': 'CDS', 'fwd': True}]}
+		keys = []
+		try:
+			for version in ['1.0', '2.0']:
+				dnacache.library_version = lambda name: version
+				self.cache.version = None
+				keys.append(self.cache.key(designs, None, {}, 'png'))
+		finally:
+			dnacache.library_version = library_version
+		self.assertNotEqual(keys[0], keys[1])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+    Tests of dnadesign (run from resources/scripts with
+    python -m unittest discover tests).
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dnadesign
+import dnalayout
+import dnaplotlib as dpl
+
+try:
+	import matplotlib
+	import numpy as np
+except ImportError:
+	matplotlib = None
+	np = None
+
+def mixed_design ():
+	""" Design with parts holding every form of key a CompactDesign stores.
+	"""
+	red = {'color': [1.0, 0.0, 0.0], 'label': 'r'}
+	return [{'type': 'Promoter', 'name': 'p1', 'fwd': True, 'opts': red},
+	        {'type': 'RBS', 'name': 'r1', 'fwd': False, 'start': 2, 'end': 1.5},
+	        {'type': 'CDS', 'name': 'g1', 'opts': {'color': [1.0, 0.0, 0.0],
+	                                               'label': 'r'}},
+	        {'type': 'Terminator', 'fwd': 'True', 'start': '3', 'extra': [1, 2]},
+	        {'name': 'untyped'},
+	        {'type': 'Unknown', 'name': 'u1', 'fwd': True, 'opts': red},
+	        {'type': 'CDS', 'name': 'g2', 'fwd': True, 'start': 7.0, 'end': 9}]
+
+def regulated_design ():
+	""" Design (with regulation) drawn entirely by the standard renderers.
+	"""
+	parts = []
+	types = ['Promoter', 'RBS', 'CDS', 'Terminator']
+	for j in range(12):
+		opts = {'color': [0.1*(j % 4), 0.5, 0.2]}
+		if j % 3 == 0:
+			opts['label'] = 'p%d' % j
+		parts.append({'type': types[j % 4], 'name': 'p%d' % j, 'fwd': j % 5 != 4,
+		              'opts': opts})
+	regs = [{'type': 'Repression', 'from_part': parts[2], 'to_part': parts[0]},
+	        {'type': 'Activation', 'from_part': parts[6], 'to_part': parts[9],
+	         'opts': {'color': [0.0, 0.6, 0.0]}},
+	        {'type': 'Repression', 'from_part': parts[10], 'to_part': parts[4]}]
+	return parts, regs
+
+class CompactDesignTest (unittest.TestCase):
+
+	def test_round_trip(self):
+		parts = mixed_design()
+		design = dnadesign.CompactDesign.from_parts(parts)
+		self.assertEqual(len(design), len(parts))
+		round_trip = design.to_parts()
+		self.assertEqual(round_trip, parts)
+		for part, copy in zip(parts, round_trip):
+			for k in ['start', 'end']:
+				if k in part.keys():
+					self.assertEqual(type(copy[k]), type(part[k]))
+		self.assertEqual(list(design), parts)
+		self.assertEqual(design[-1], parts[-1])
+		self.assertRaises(IndexError, design.__getitem__, len(parts))
+		# Equal options share an entry of the style table
+		self.assertEqual(len(design.table.styles), 1)
+
+	def test_records_match_parts(self):
+		parts = mixed_design()
+		design = dnadesign.CompactDesign.from_parts(parts)
+		records = list(dnadesign.part_records(design))
+		part_records = list(dnadesign.part_records(parts))
+		self.assertEqual(len(records), len(parts))
+		for i in range(len(parts)):
+			# Records differ only in their key (and the extra keys they refer to)
+			self.assertEqual(records[i][0], i)
+			self.assertEqual(part_records[i][0], id(parts[i]))
+			self.assertEqual(records[i][1:7], part_records[i][1:7])
+			self.assertEqual(dnadesign.part_key(design, i), records[i][0])
+			self.assertEqual(dnadesign.part_key(parts, i), part_records[i][0])
+		self.assertEqual(records[3][7], {'fwd': 'True', 'start': '3', 'extra': [1, 2]})
+
+	def test_layout_matches_parts(self):
+		parts, regs = regulated_design()
+		design = dnadesign.CompactDesign.from_parts(parts)
+		compact_regs = dnadesign.compact_regulation(parts, regs)
+		layout = dnalayout.layout_design(parts, regs)
+		compact_layout = dnalayout.layout_design(design, compact_regs)
+		self.assertEqual(len(compact_layout.parts), len(layout.parts))
+		for placed, compact_placed in zip(layout.parts, compact_layout.parts):
+			self.assertEqual(vars(compact_placed), vars(placed))
+		self.assertEqual(len(compact_layout.arcs), len(regs))
+		for arc, compact_arc in zip(layout.arcs, compact_layout.arcs):
+			self.assertTrue(compact_arc.reg is compact_regs[regs.index(arc.reg)])
+			for k in ['from_index', 'to_index', 'start', 'end', 'above', 'height_index']:
+				self.assertEqual(getattr(compact_arc, k), getattr(arc, k))
+
+@unittest.skipIf(matplotlib == None, 'matplotlib and numpy are not installed')
+class CompactRenderTest (unittest.TestCase):
+
+	def render(self, parts, regs):
+		""" RGB pixels of a design and the parts given to its regulation renderers.
+		"""
+		dpl.load_matplotlib()
+		from matplotlib.figure import Figure
+		from matplotlib.backends.backend_agg import FigureCanvasAgg
+		fig = Figure(figsize=(4.0, 1.0), dpi=60)
+		canvas = FigureCanvasAgg(fig)
+		ax = fig.add_axes([0.0, 0.0, 1.0, 1.0])
+		dr = dpl.DNARenderer()
+		reg_parts = []
+		reg_renderers = {}
+		for reg_type, renderer in dr.std_reg_renderers().items():
+			def record (ax, type, num, from_part, to_part, scale, linewidth,
+				        arc_height_index, opts, renderer=renderer):
+				reg_parts.append((from_part, to_part))
+				renderer(ax, type, num, from_part, to_part, scale, linewidth,
+					     arc_height_index, opts)
+			reg_renderers[reg_type] = record
+		start, end = dr.renderDNA(ax, parts, dr.SBOL_part_renderers(), regs,
+			                      reg_renderers)
+		ax.set_xlim([start-5.0, end+5.0])
+		ax.set_ylim([-40.0, 40.0])
+		ax.set_axis_off()
+		canvas.draw()
+		width, height = canvas.get_width_height()
+		pixels = np.frombuffer(canvas.tostring_rgb(), dtype=np.uint8)
+		return pixels.reshape((height, width, 3)), reg_parts
+
+	def test_render_matches_parts(self):
+		parts, regs = regulated_design()
+		design = dnadesign.CompactDesign.from_parts(parts)
+		pixels, reg_parts = self.render(parts, regs)
+		compact_pixels, compact_reg_parts = self.render(design,
+			                                 dnadesign.compact_regulation(parts, regs))
+		self.assertTrue(np.array_equal(compact_pixels, pixels))
+		self.assertEqual(compact_reg_parts, reg_parts)
+		# Regulation is given copies of the parts (with the extents drawn)
+		layout = dnalayout.layout_design(parts)
+		for from_part, to_part in reg_parts:
+			self.assertFalse(any([to_part is part for part in parts]))
+			placed = layout.parts[int(from_part['name'][1:])]
+			self.assertEqual((from_part['start'], from_part['end']),
+				             (placed.extent_start, placed.extent_end))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+    Tests of dnalayout (run from resources/scripts with
+    python -m unittest discover tests).
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dnalayout
+
+def clashes_above (arc, r):
+	""" Clash test of the original renderDNA for arcs above the backbone.
+	"""
+	if  (arc[0] >= r[0] and arc[0] <= r[1]):
+		return True
+	elif(arc[0] >= r[1] and arc[0] <= r[0]):
+		return True
+	elif(arc[1] >= r[0] and arc[0] <= r[1]):
+		return True
+	elif(arc[1] >= r[1] and arc[0] <= r[0]):
+		return True
+	return False
+
+def clashes_below (arc, r):
+	""" Clash test of the original renderDNA for arcs below the backbone.
+	"""
+	if  (arc[0] > r[0] and arc[0] < r[1]):
+		return True
+	elif(arc[0] > r[1] and arc[0] < r[0]):
+		return True
+	elif(arc[1] > r[0] and arc[0] < r[1]):
+		return True
+	elif(arc[1] > r[1] and arc[0] < r[0]):
+		return True
+	return False
+
+def quadratic_arc_height_indices (arcs):
+	""" Arc height indices assigned as by the original renderDNA, comparing
+	    every arc with all the earlier arcs on the same side of the backbone.
+	"""
+	pos_arc_ranges = []
+	neg_arc_ranges = []
+	heights = []
+	for arc_min, arc_max, above in arcs:
+		arcrange = [arc_min, arc_max, 1]
+		if above:
+			arc_ranges = pos_arc_ranges
+			clashes = clashes_above
+		else:
+			arc_ranges = neg_arc_ranges
+			clashes = clashes_below
+		current_max = 1
+		for r in arc_ranges:
+			if clashes(arcrange, r) and r[2] > current_max:
+				current_max = r[2]
+		for r in arc_ranges:
+			if clashes(arcrange, r):
+				arcrange[2] = current_max + 1
+		arc_ranges.append(arcrange)
+		heights.append(arcrange[2])
+	return heights
+
+def random_arcs (rng, num_arcs, num_points):
+	""" Random arcs between a few points (so many are nested, touching,
+	    identical or of zero length), ordered shortest first as in renderDNA.
+	"""
+	arcs = []
+	for i in range(num_arcs):
+		a = rng.randint(0, num_points)
+		b = rng.randint(0, num_points)
+		if rng.random() < 0.1:
+			b = a
+		arcs.append((min(a, b)+0.5, max(a, b)+0.5, rng.random() < 0.5))
+	arcs.sort(key=lambda x: x[1]-x[0])
+	return arcs
+
+class ArcHeightTest (unittest.TestCase):
+
+	def assertMatchesQuadratic(self, arcs):
+		self.assertEqual(dnalayout.arc_height_indices(arcs),
+		                 quadratic_arc_height_indices(arcs))
+
+	def test_empty(self):
+		self.assertEqual(dnalayout.arc_height_indices([]), [])
+
+	def test_nested(self):
+		for above in [True, False]:
+			self.assertMatchesQuadratic([(4.0, 5.0, above), (3.0, 6.0, above),
+			                             (2.0, 7.0, above), (1.0, 8.0, above)])
+
+	def test_touching(self):
+		for above in [True, False]:
+			self.assertMatchesQuadratic([(1.0, 2.0, above), (2.0, 3.0, above),
+			                             (3.0, 4.0, above), (1.0, 3.0, above)])
+
+	def test_identical(self):
+		for above in [True, False]:
+			self.assertMatchesQuadratic([(1.0, 3.0, above)]*4)
+
+	def test_zero_length(self):
+		for above in [True, False]:
+			self.assertMatchesQuadratic([(2.0, 2.0, above), (2.0, 2.0, above),
+			                             (1.0, 1.0, above), (1.0, 3.0, above),
+			                             (2.0, 2.0, above), (3.0, 5.0, above)])
+
+	def test_random(self):
+		rng = random.Random(2014)
+		for trial in range(500):
+			arcs = random_arcs(rng, rng.randint(1, 40), rng.randint(1, 12))
+			self.assertMatchesQuadratic(arcs)
+
+	def test_random_unsorted(self):
+		# Heights follow the order arcs are given in, whatever their lengths
+		rng = random.Random(2015)
+		for trial in range(200):
+			arcs = random_arcs(rng, rng.randint(1, 40), rng.randint(1, 12))
+			rng.shuffle(arcs)
+			self.assertMatchesQuadratic(arcs)
+
+class UnplacedPartTest (unittest.TestCase):
+
+	def design(self):
+		parts = [{'type': 'Promoter', 'name': 'p1', 'fwd': True},
+		         {'type': 'Custom', 'name': 'c1', 'fwd': True, 'renderer': None},
+		         {'type': 'CDS', 'name': 'g1', 'fwd': True}]
+		regs = [{'type': 'Repression', 'from_part': parts[1], 'to_part': parts[0]}]
+		return parts, regs
+
+	def test_regulation_of_unplaced_part(self):
+		parts, regs = self.design()
+		self.assertRaisesRegexp(ValueError, 'part c1', dnalayout.layout_design,
+			                    parts, regs)
+
+	def test_regulation_of_drawn_part(self):
+		parts, regs = self.design()
+		layout = dnalayout.layout_design(parts)
+		drawn_parts = {id(parts[1]): dict(parts[1], start=20.0, end=30.0)}
+		arcs = layout.place_arcs(regs, None, drawn_parts)
+		self.assertEqual(len(arcs), 1)
+		self.assertEqual(arcs[0].start, 25.0)
+		self.assertEqual(arcs[0].from_index, None)
+		self.assertEqual(arcs[0].to_index, 0)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+"""
+    Tests of dnaplotlib (run from resources/scripts with
+    python -m unittest discover tests).
+"""
+
+from multiprocessing.pool import ThreadPool
+import copy
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dnaplotlib as dpl
+
+try:
+	import matplotlib
+	import numpy as np
+except ImportError:
+	matplotlib = None
+	np = None
+
+def sample_design (i):
+	""" Design with labelled, reversed and regulated parts (varying with i).
+	"""
+	parts = []
+	types = ['Promoter', 'RBS', 'CDS', 'Terminator']
+	for j in range(8+i):
+		opts = {'color': [0.1*(j % 10), 0.5, 1.0-0.1*(j % 10)]}
+		if j % 3 == 0:
+			opts['label'] = 'p%d' % j
+		parts.append({'type': types[j % 4], 'name': 'p%d' % j, 'fwd': j % 5 != 4,
+		              'opts': opts})
+	regs = [{'type': 'Repression', 'from_part': parts[2], 'to_part': parts[0],
+	         'opts': {'color': [1.0, 0.0, 0.0]}},
+	        {'type': 'Activation', 'from_part': parts[6], 'to_part': parts[4],
+	         'opts': {'color': [0.0, 0.6, 0.0]}}]
+	return parts, regs
+
+def render_pixels (dr, parts, regs):
+	""" RGB pixels of a design drawn to its own Agg figure (without pyplot).
+	"""
+	dpl.load_matplotlib()
+	from matplotlib.figure import Figure
+	from matplotlib.backends.backend_agg import FigureCanvasAgg
+	fig = Figure(figsize=(4.0, 1.0), dpi=60)
+	canvas = FigureCanvasAgg(fig)
+	ax = fig.add_axes([0.0, 0.0, 1.0, 1.0])
+	start, end = dr.renderDNA(ax, parts, dr.SBOL_part_renderers(), regs,
+		                      dr.std_reg_renderers())
+	ax.set_xlim([start-5.0, end+5.0])
+	ax.set_ylim([-40.0, 40.0])
+	ax.set_axis_off()
+	canvas.draw()
+	width, height = canvas.get_width_height()
+	return np.frombuffer(canvas.tostring_rgb(), dtype=np.uint8).reshape((height, width, 3))
+
+@unittest.skipIf(matplotlib == None, 'matplotlib and numpy are not installed')
+class ArtistBatchTest (unittest.TestCase):
+
+	def setUp(self):
+		dpl.load_matplotlib()
+		from matplotlib.figure import Figure
+		self.ax = Figure().add_subplot(1, 1, 1)
+		self.batch = dpl.ArtistBatch(self.ax)
+
+	def test_plain_artists_batched(self):
+		self.batch.add_line(dpl.Line2D([0, 1], [0, 1]))
+		self.batch.add_patch(dpl.Polygon([[0, 0], [1, 0], [1, 1]],
+			                             path_effects=[dpl.miter_join()]))
+		self.assertEqual(self.ax.lines, [])
+		self.assertEqual(self.ax.patches, [])
+		self.assertEqual(len(self.batch.flush()), 2)
+
+	def test_styled_artists_not_batched(self):
+		from matplotlib.patheffects import withStroke
+		halo = [withStroke(linewidth=3, foreground='w')]
+		lines = [dpl.Line2D([0, 1], [0, 1], dashes=[2, 3]),
+		         dpl.Line2D([0, 1], [0, 1], marker='o'),
+		         dpl.Line2D([0, 1], [0, 1], path_effects=halo)]
+		for line in lines:
+			self.batch.add_line(line)
+		patch = dpl.Polygon([[0, 0], [1, 0], [1, 1]], path_effects=halo)
+		self.batch.add_patch(patch)
+		self.assertEqual(self.ax.lines, lines)
+		self.assertEqual(self.ax.patches, [patch])
+		self.assertEqual(self.batch.flush(), [])
+		self.assertEqual(lines[1].get_marker(), 'o')
+		self.assertEqual(patch.get_path_effects(), halo)
+
+	def test_dashed_glyph(self):
+		dr = dpl.DNARenderer(batch_artists=True, glyph_cache=dpl.GlyphCache())
+		parts = [{'type': 'Scar', 'name': 's', 'fwd': True, 'opts': {'linestyle': '--'}}]
+		for i in range(2):
+			dr.renderDNA(self.ax, parts, dr.SBOL_part_renderers())
+			self.assertTrue(len(self.ax.lines) > 0)
+			self.assertTrue(all([line.is_dashed() for line in self.ax.lines]))
+			self.ax.cla()
+
+@unittest.skipIf(matplotlib == None, 'matplotlib and numpy are not installed')
+class ConcurrentRenderTest (unittest.TestCase):
+
+	def check_concurrent(self, dr):
+		designs = [sample_design(i) for i in range(6)]
+		designs_before = copy.deepcopy(designs)
+		serial = [render_pixels(dr, parts, regs) for parts, regs in designs]
+		rc_before = dict(matplotlib.rcParams)
+		pool = ThreadPool(4)
+		try:
+			# Every design drawn several times at once by the shared renderer
+			jobs = [designs[i % len(designs)] for i in range(4*len(designs))]
+			concurrent = pool.map(lambda d: render_pixels(dr, d[0], d[1]), jobs)
+		finally:
+			pool.close()
+			pool.join()
+		for i in range(len(jobs)):
+			self.assertTrue(np.array_equal(concurrent[i], serial[i % len(designs)]))
+		self.assertEqual(designs, designs_before)
+		self.assertEqual(dict(matplotlib.rcParams), rc_before)
+
+	def test_concurrent(self):
+		self.check_concurrent(dpl.DNARenderer())
+
+	def test_concurrent_batched(self):
+		self.check_concurrent(dpl.DNARenderer(batch_artists=True))
+
+	def test_concurrent_glyph_cache(self):
+		self.check_concurrent(dpl.DNARenderer(glyph_cache=dpl.GlyphCache()))
+
+@unittest.skipIf(matplotlib == None, 'matplotlib and numpy are not installed')
+class GlyphCacheTest (unittest.TestCase):
+
+	def check_cached(self, batch_artists):
+		designs = [sample_design(i) for i in range(4)]
+		# Parts with options the glyphs are drawn from (and a custom renderer)
+		parts, regs = designs[0]
+		parts[1]['opts'] = dict(parts[1]['opts'], x_extent=20, linewidth=3,
+		                        label_y_offset=-5, label_color=(1.0, 0.0, 0.0))
+		parts[5]['renderer'] = box_renderer
+		uncached = [render_pixels(dpl.DNARenderer(batch_artists=batch_artists), p, r)
+		            for p, r in designs]
+		cache = dpl.GlyphCache()
+		dr = dpl.DNARenderer(batch_artists=batch_artists, glyph_cache=cache)
+		for rep in range(2):
+			for i in range(len(designs)):
+				cached = render_pixels(dr, designs[i][0], designs[i][1])
+				self.assertTrue(np.array_equal(cached, uncached[i]))
+		# Glyphs are reused for parts of the same type, options and direction
+		self.assertTrue(cache.hits > cache.misses)
+		self.assertTrue(cache.misses > 0)
+
+	def test_cached_matches_uncached(self):
+		self.check_cached(False)
+
+	def test_cached_matches_uncached_batched(self):
+		self.check_cached(True)
+
+def long_design (num_parts, labels=False):
+	""" Long design (without custom renderers) with arcs along its length.
+	"""
+	parts = []
+	types = ['Promoter', 'RBS', 'CDS', 'Terminator']
+	for j in range(num_parts):
+		opts = {'color': [0.1*(j % 10), 0.5, 0.2]}
+		if labels:
+			opts['label'] = 'p%d' % j
+		parts.append({'type': types[j % 4], 'name': 'p%d' % j, 'fwd': j % 7 != 6,
+		              'opts': opts})
+	regs = []
+	for j in range(0, num_parts-8, 10):
+		regs.append({'type': 'Repression', 'from_part': parts[j+6], 'to_part': parts[j]})
+	return parts, regs
+
+@unittest.skipIf(matplotlib == None, 'matplotlib and numpy are not installed')
+class ViewportTest (unittest.TestCase):
+
+	def setUp(self):
+		dpl.load_matplotlib()
+		from matplotlib.figure import Figure
+		from matplotlib.backends.backend_agg import FigureCanvasAgg
+		self.fig = Figure(figsize=(4.0, 1.0), dpi=60)
+		self.canvas = FigureCanvasAgg(self.fig)
+		self.ax = self.fig.add_axes([0.0, 0.0, 1.0, 1.0])
+		self.dr = dpl.DNARenderer()
+
+	def render(self, parts, regs, xlim, viewport=None, lod=None):
+		""" Extent of a design, the artists drawn and the pixels of xlim.
+		"""
+		self.ax.cla()
+		extent = self.dr.renderDNA(self.ax, parts, self.dr.SBOL_part_renderers(), regs,
+			                       self.dr.std_reg_renderers(), viewport, lod)
+		num_artists = len(self.ax.lines) + len(self.ax.patches) + len(self.ax.texts)
+		self.ax.set_xlim(xlim)
+		self.ax.set_ylim([-40.0, 40.0])
+		self.ax.set_axis_off()
+		self.canvas.draw()
+		width, height = self.canvas.get_width_height()
+		pixels = np.frombuffer(self.canvas.tostring_rgb(), dtype=np.uint8)
+		return extent, num_artists, pixels.reshape((height, width, 3)).copy()
+
+	def test_culled_matches_full(self):
+		parts, regs = long_design(400)
+		full_extent = self.render(parts, regs, [0.0, 1.0])[0]
+		for x_min in [-10.0, full_extent[1]*0.4, full_extent[1]-100.0]:
+			viewport = (x_min, x_min+100.0)
+			extent, num_full, full = self.render(parts, regs, viewport)
+			culled_extent, num_culled, culled = self.render(parts, regs, viewport, viewport)
+			# Parts outside the window are still placed, but not drawn
+			self.assertEqual(culled_extent, extent)
+			self.assertTrue(num_culled*5 < num_full)
+			self.assertTrue(np.array_equal(culled, full))
+
+	def test_culled_cost_follows_window(self):
+		counts = []
+		for num_parts in [200, 800]:
+			parts, regs = long_design(num_parts)
+			counts.append(self.render(parts, regs, (0.0, 100.0), (0.0, 100.0))[1])
+		self.assertEqual(counts[0], counts[1])
+
+	def test_level_of_detail(self):
+		parts, regs = long_design(400, labels=True)
+		extent, num_full = self.render(parts, regs, [0.0, 1.0])[:2]
+		self.assertEqual(len(self.ax.texts), len(parts))
+		# Labels are omitted before parts are collapsed
+		lod = dpl.LevelOfDetail(min_part_pixels=1.0, min_label_pixels=1000.0,
+			                    pixels_per_unit=1.0)
+		self.render(parts, regs, [0.0, 1.0], None, lod)
+		self.assertEqual(len(self.ax.texts), 0)
+		self.assertEqual(len([p for p in self.ax.patches
+			                  if p.get_facecolor()[:3] == lod.block_color]), 0)
+		# Every part is collapsed into a single block
+		lod = dpl.LevelOfDetail(min_part_pixels=1000.0, pixels_per_unit=1.0)
+		lod_extent = self.render(parts, [], [0.0, 1.0], None, lod)[0]
+		self.assertEqual(lod_extent, extent)
+		self.assertEqual(len(self.ax.patches), 1)
+		self.assertEqual(len(self.ax.lines), 1)
+		self.assertEqual(tuple(self.ax.patches[0].get_facecolor()[:3]), lod.block_color)
+		# Nothing is left out when everything is large enough to see
+		lod = dpl.LevelOfDetail(min_part_pixels=0.1, min_label_pixels=0.1, 
+			                    pixels_per_unit=1000.0)
+		self.assertEqual(self.render(parts, regs, [0.0, 1.0], None, lod)[1], num_full)
+
+def box_renderer (ax, type, num, start, end, prev_end, scale, linewidth, opts):
+	""" Custom renderer drawing a box 10 wide after the previous part.
+	"""
+	ax.add_patch(dpl.Polygon([[prev_end, -2], [prev_end+10, -2], [prev_end+10, 2],
+	                          [prev_end, 2]], linewidth=linewidth))
+	return prev_end, prev_end+10
+
+@unittest.skipIf(matplotlib == None, 'matplotlib and numpy are not installed')
+class UnplacedPartTest (unittest.TestCase):
+
+	def setUp(self):
+		dpl.load_matplotlib()
+		from matplotlib.figure import Figure
+		self.ax = Figure().add_subplot(1, 1, 1)
+		self.arcs = []
+
+	def record_arc(self, ax, type, num, from_part, to_part, scale, linewidth,
+		           arc_height_index, opts):
+		self.arcs.append((from_part['start'], from_part['end'], to_part['start'], 
+			              to_part['end']))
+
+	def test_regulation_of_custom_part(self):
+		# Parts with a custom renderer or no renderer at all have no layout rule
+		parts = [{'type': 'Promoter', 'name': 'p1', 'fwd': True},
+		         {'type': 'Box', 'name': 'b1', 'fwd': True, 'renderer': box_renderer},
+		         {'type': 'Unknown', 'name': 'u1', 'fwd': True}]
+		regs = [{'type': 'Repression', 'from_part': parts[1], 'to_part': parts[0]},
+		        {'type': 'Repression', 'from_part': parts[2], 'to_part': parts[1]}]
+		parts_before = copy.deepcopy(parts)
+		dr = dpl.DNARenderer()
+		reg_renderers = {'Repression': self.record_arc}
+		start, end = dr.renderDNA(self.ax, parts, dr.SBOL_part_renderers(), regs,
+			                      reg_renderers)
+		self.assertEqual(parts, parts_before)
+		promoter = dr.layout(parts, dr.SBOL_part_renderers()).parts[0]
+		box = (promoter.extent_end, promoter.extent_end+10)
+		self.assertEqual(sorted(self.arcs), sorted([box+(promoter.extent_start, 
+			                                             promoter.extent_end),
+		                                            (2, 3)+box]))
+		self.arcs = []
+		dr.render_editable(self.ax, parts, dr.SBOL_part_renderers(), regs, reg_renderers)
+		self.assertEqual(len(self.arcs), 2)
+
+@unittest.skipIf(matplotlib == None, 'matplotlib and numpy are not installed')
+class DesignHandleTest (unittest.TestCase):
+
+	def test_update_self_regulation(self):
+		dpl.load_matplotlib()
+		from matplotlib.figure import Figure
+		ax = Figure().add_subplot(1, 1, 1)
+		parts, regs = sample_design(0)
+		regs.append({'type': 'Repression', 'from_part': parts[3], 'to_part': parts[3]})
+		regs_before = copy.deepcopy(regs)
+		dr = dpl.DNARenderer()
+		handle = dr.render_editable(ax, parts, dr.SBOL_part_renderers(), regs,
+			                        dr.std_reg_renderers())
+		part = {'type': 'CDS', 'name': 'new', 'fwd': True}
+		handle.update(3, part)
+		self.assertEqual(regs, regs_before)
+		self.assertTrue(handle.regs[2] is not regs[2])
+		self.assertTrue(handle.regs[2]['from_part'] is part)
+		self.assertTrue(handle.regs[2]['to_part'] is part)
+		self.assertTrue(handle.regs[0] is regs[0])
+
+@unittest.skipIf(matplotlib == None, 'matplotlib and numpy are not installed')
+class TraceDecimationTest (unittest.TestCase):
+
+	def spiked_trace(self, n):
+		data = np.zeros(n, dtype=np.float32)
+		data[n//3] = 100.0
+		return data
+
+	def test_lttb_few_points(self):
+		data = self.spiked_trace(1000003)
+		for num_points in [0, 1, 2, 3]:
+			x, y = dpl.decimate_lttb(data, 0, len(data), num_points)
+			self.assertEqual(len(x), 3)
+			# The first, last and extreme points are kept
+			self.assertEqual(list(x), [0.5, len(data)//3+0.5, len(data)-0.5])
+			self.assertEqual(list(y), [0.0, 100.0, 0.0])
+
+	def test_lttb_short_trace(self):
+		x, y = dpl.decimate_lttb(np.arange(3, dtype=np.float32), 0, 3, 1)
+		self.assertEqual(list(y), [0.0, 1.0, 2.0])
+
+	def test_tiny_axis(self):
+		dpl.load_matplotlib()
+		from matplotlib.figure import Figure
+		from matplotlib.backends.backend_agg import FigureCanvasAgg
+		data = self.spiked_trace(1000003)
+		fig = Figure(figsize=(1.0, 1.0), dpi=100)
+		FigureCanvasAgg(fig)
+		# An axis 2 pixels wide (fewer pixels than LTTB points)
+		ax = fig.add_axes([0.0, 0.0, 0.02, 1.0])
+		ax.set_xlim([0, len(data)])
+		self.assertEqual(dpl.trace_pixels(ax, 0, len(data)), 2)
+		line = dpl.draw_trace(ax, data, method='lttb')
+		self.assertTrue(len(line.get_xdata()) <= 3)
+		self.assertEqual(max(line.get_ydata()), 100.0)
+		envelope = dpl.draw_trace(ax, data, method='minmax')
+		self.assertTrue(len(envelope.get_xy()) <= 2*3+1)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+    Tests of dnasvg (run from resources/scripts with
+    python -m unittest discover tests).
+"""
+
+import os
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dnalayout
+import dnaplotlib as dpl
+import dnasvg
+
+try:
+	import matplotlib
+except ImportError:
+	matplotlib = None
+
+def regulated_design ():
+	""" Design with arcs to forward, reverse and unflagged parts.
+	"""
+	parts = [{'type': 'Promoter', 'name': 'p1'},
+	         {'type': 'CDS', 'name': 'g1', 'fwd': True},
+	         {'type': 'Terminator', 'name': 't1', 'fwd': False},
+	         {'type': 'Promoter', 'name': 'p2', 'fwd': True},
+	         {'type': 'CDS', 'name': 'g2'}]
+	regs = [{'type': 'Repression', 'from_part': parts[1], 'to_part': parts[0]},
+	        {'type': 'Activation', 'from_part': parts[4], 'to_part': parts[2]},
+	        {'type': 'Repression', 'from_part': parts[1], 'to_part': parts[3]},
+	        {'type': 'Activation', 'from_part': parts[0], 'to_part': parts[4]}]
+	return parts, regs
+
+def arc_points (elements):
+	""" Points of the arc (the first polyline) of a regulation's elements.
+	"""
+	points = re.search('points="([^"]*)"', elements[0]).group(1)
+	return [tuple([float(v) for v in p.split(',')]) for p in points.split(' ')]
+
+class RegulationTest (unittest.TestCase):
+
+	def setUp(self):
+		self.sr = dnasvg.SVGRenderer()
+		self.parts, self.regs = regulated_design()
+		self.layout = dnalayout.layout_design(self.parts, self.regs)
+
+	def svg_arcs(self):
+		arcs = {}
+		for arc in self.layout.arcs:
+			arcs[id(arc.reg)] = arc_points(self.sr.regulation(arc, arc.reg))
+		return arcs
+
+	def test_arcs_follow_layout(self):
+		arcs = self.svg_arcs()
+		for arc in self.layout.arcs:
+			points = arcs[id(arc.reg)]
+			self.assertAlmostEqual(points[0][0], arc.start, 3)
+			self.assertAlmostEqual(points[1][1], arc.top, 3)
+			self.assertAlmostEqual(points[2][0], arc.end, 3)
+
+	def test_unflagged_parts_above(self):
+		# Only arcs to the reverse terminator are drawn below the backbone
+		arcs = self.svg_arcs()
+		for reg in self.regs:
+			above = arcs[id(reg)][1][1] > 0
+			self.assertEqual(above, reg['to_part'] is not self.parts[2])
+
+	@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+	def test_arcs_match_renderer(self):
+		dpl.load_matplotlib()
+		from matplotlib.figure import Figure
+		ax = Figure().add_subplot(1, 1, 1)
+		drawn = {}
+		def record (ax_drawn, type, num, from_part, to_part, scale, linewidth,
+			        arc_height_index, opts):
+			num_lines = len(ax.lines)
+			dpl.regulation(ax_drawn, type, num, from_part, to_part, scale, linewidth,
+				           arc_height_index, opts)
+			away, across, toward = ax.lines[num_lines:num_lines+3]
+			drawn[(from_part['name'], to_part['name'])] = (zip(away.get_xdata(), away.get_ydata()) +
+				                                           zip(toward.get_xdata(), toward.get_ydata()))
+		dr = dpl.DNARenderer()
+		dr.renderDNA(ax, self.parts, dr.SBOL_part_renderers(), self.regs,
+			         {'Repression': record, 'Activation': record})
+		arcs = self.svg_arcs()
+		self.assertEqual(len(drawn), len(self.regs))
+		for reg in self.regs:
+			points = drawn[(reg['from_part']['name'], reg['to_part']['name'])]
+			for p, q in zip(points, arcs[id(reg)]):
+				self.assertAlmostEqual(p[0], q[0], 3)
+				self.assertAlmostEqual(p[1], q[1], 3)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+"""
+    Tests of plot_SBOL_designs (run from resources/scripts with
+    python -m unittest discover tests).
+"""
+
+from StringIO import StringIO
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plot_SBOL_designs as psd
+
+try:
+	import matplotlib
+except ImportError:
+	matplotlib = None
+
+def sample_designs (names):
+	""" Two small designs (named as given) with a regulation arc in each.
+	"""
+	dna_designs = {}
+	regs_info = {}
+	for i in range(len(names)):
+		promoter = {'type': 'Promoter', 'name': 'pTac', 'fwd': True, 'start': 1, 'end': 2,
+		            'opts': {'color': [0.0, 0.0, 0.0]}}
+		cds = {'type': 'CDS', 'name': 'YFP', 'fwd': True, 'start': 2, 'end': 3,
+		       'opts': {'color': [1.0, 0.8, 0.0]}}
+		dna_designs[names[i]] = [promoter, cds]
+	for i, name in enumerate(sorted(dna_designs.keys())):
+		design = dna_designs[name]
+		regs_info[i] = [{'type': 'Repression', 'from_part': design[1],
+		                 'to_part': design[0], 'opts': {'color': [1.0, 0.0, 0.0]}}]
+	return dna_designs, regs_info
+
+@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+class ExportFigureTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		psd.dpl.load_matplotlib()
+		import matplotlib.pyplot as plt
+		self.plt = plt
+		dna_designs, regs_info = sample_designs(['a', 'b'])
+		plot_params = {'axis_y': 35}
+		self.fig = plt.figure()
+		dr = psd.design_renderer(plot_params)
+		psd.draw_designs(self.fig, dr, dna_designs, sorted(dna_designs.keys()),
+			             regs_info, 0, 2, plot_params)
+
+	def tearDown(self):
+		self.plt.close(self.fig)
+		shutil.rmtree(self.tmp_dir, True)
+
+	def test_raster_drawn_once_per_dpi(self):
+		import matplotlib.image as mpimg
+		import numpy as np
+		draws = []
+		canvas_draw = self.fig.canvas.draw
+		def draw (*args, **kwargs):
+			draws.append(self.fig.dpi)
+			return canvas_draw(*args, **kwargs)
+		self.fig.canvas.draw = draw
+		out_filename = os.path.join(self.tmp_dir, 'out.png')
+		formats = psd.output_formats(out_filename, {'output_formats': 
+			                         'png:40;rgba:40;png:80;svg:40'})
+		dpi_before = self.fig.dpi
+		psd.export_figure(self.fig, out_filename, formats)
+		self.assertEqual(draws, [40, 80])
+		self.assertEqual(self.fig.dpi, dpi_before)
+		images = {}
+		for dpi in [40, 80]:
+			expected = os.path.join(self.tmp_dir, 'expected_%d.png' % dpi)
+			self.fig.savefig(expected, transparent=True, dpi=dpi, format='png')
+			images[dpi] = mpimg.imread(os.path.join(self.tmp_dir, 'out_%ddpi.png' % dpi))
+			self.assertTrue(np.array_equal(images[dpi], mpimg.imread(expected)))
+		rgba = open(os.path.join(self.tmp_dir, 'out.rgba'), 'rb').read()
+		self.assertEqual(len(rgba), images[40].shape[0]*images[40].shape[1]*4)
+		self.assertTrue(os.path.exists(os.path.join(self.tmp_dir, 'out.svg')))
+
+class RenderCacheTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.cache = psd.render_cache(os.path.join(self.tmp_dir, 'cache'))
+
+	def tearDown(self):
+		del psd.render_caches[os.path.join(self.tmp_dir, 'cache')]
+		shutil.rmtree(self.tmp_dir, True)
+
+	def render(self, names, plot_params):
+		dna_designs, regs_info = sample_designs(names)
+		out_filename = os.path.join(self.tmp_dir, '%s.png' % names[0])
+		return psd.plot_designs_cached(self.cache, dna_designs, out_filename,
+			                           dict(plot_params), regs_info)
+
+	@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+	def test_contact_sheet_names_in_key(self):
+		# Captions show the design names, so renamed designs must be redrawn
+		plot_params = {'contact_sheet': 'Y', 'sheet_cols': 2, 'sheet_rows': 1,
+		               'sheet_x': 2.0, 'sheet_y': 1.0, 'dpi': 50}
+		self.assertFalse(self.render(['first_a', 'first_b'], plot_params))
+		self.assertFalse(self.render(['second_a', 'second_b'], plot_params))
+		self.assertEqual(self.cache.stats()['misses'], 2)
+		self.assertTrue(self.render(['first_a', 'first_b'], plot_params))
+
+	def test_title_names_in_key(self):
+		dna_designs_a, regs_a = sample_designs(['first_a', 'first_b'])
+		dna_designs_b, regs_b = sample_designs(['second_a', 'second_b'])
+		plot_params = {'show_title': 'Y'}
+		self.assertNotEqual(self.cache.key(dna_designs_a, regs_a, plot_params, 'png'),
+		                    self.cache.key(dna_designs_b, regs_b, plot_params, 'png'))
+
+	def test_undrawn_names_not_in_key(self):
+		dna_designs_a, regs_a = sample_designs(['first_a', 'first_b'])
+		dna_designs_b, regs_b = sample_designs(['second_a', 'second_b'])
+		plot_params = {'show_title': 'N', 'contact_sheet': 'N'}
+		self.assertEqual(self.cache.key(dna_designs_a, regs_a, plot_params, 'png'),
+		                 self.cache.key(dna_designs_b, regs_b, plot_params, 'png'))
+
+class PartCatalogueTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.job = {'params': self.write('params.csv', 'parameter,value\nlinewidth,1\n'),
+		            'parts': self.write('parts.csv', 'part_name,type,color\n'
+		                                'pTac,Promoter,0.00;0.00;0.00\n'
+		                                'YFP,CDS,1.00;0.80;0.00\n'
+		                                'gX,Unknown,0.00;0.00;0.00\n'),
+		            'designs_data': 'design_name,parts\nd1,pTac,YFP,-gX\n',
+		            'output': os.path.join(self.tmp_dir, 'out.pdf')}
+		self.loads = []
+		self.load_part_information = psd.load_part_information
+		def load (filename):
+			self.loads.append(filename)
+			return self.load_part_information(filename)
+		psd.load_part_information = load
+		psd.part_catalogues.clear()
+
+	def tearDown(self):
+		psd.load_part_information = self.load_part_information
+		psd.part_catalogues.clear()
+		shutil.rmtree(self.tmp_dir, True)
+
+	def write(self, filename, text):
+		filename = os.path.join(self.tmp_dir, filename)
+		f = open(filename, 'w')
+		f.write(text)
+		f.close()
+		return filename
+
+	def test_files_compiled_once(self):
+		catalogue = psd.part_catalogue(self.job)
+		for i in range(3):
+			self.assertTrue(psd.part_catalogue(dict(self.job)) is catalogue)
+		self.assertEqual(len(self.loads), 1)
+		# Modified files are compiled again
+		mtime = os.path.getmtime(self.job['parts'])
+		os.utime(self.job['parts'], (mtime+10, mtime+10))
+		self.assertFalse(psd.part_catalogue(self.job) is catalogue)
+		self.assertEqual(len(self.loads), 2)
+
+	def test_part_renderers(self):
+		plot_params, dna_designs, regs_info, part_renderers = psd.load_job(self.job)
+		dr = psd.dpl.DNARenderer()
+		sbol_renderers = dr.SBOL_part_renderers()
+		self.assertEqual(part_renderers, {'Promoter': sbol_renderers['Promoter'],
+		                                  'CDS': sbol_renderers['CDS']})
+		# Renderers are looked up by type, so the parts are left as loaded
+		for part in dna_designs['d1']:
+			self.assertFalse('renderer' in part.keys())
+		self.assertEqual([dr.part_renderer(p, part_renderers) for p in dna_designs['d1']],
+		                 [sbol_renderers['Promoter'], sbol_renderers['CDS'], None])
+
+PARAMS_DATA = 'parameter,value\nlinewidth,1\naxis_y,35\n'
+PARTS_DATA = ('part_name,type,color\npTac,Promoter,0.00;0.00;0.00\n'
+              'YFP,CDS,1.00;0.80;0.00\nT1,Terminator,0.00;0.00;0.00\n')
+REGULATION_DATA = 'from_partname,type,to_partname,color\nYFP,Repression,pTac,1.0;0.0;0.0\n'
+
+class BatchRenderTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir, True)
+
+	def job(self, job_id, **kwargs):
+		job = {'id': job_id, 'params_data': PARAMS_DATA, 'parts_data': PARTS_DATA,
+		       'designs_data': 'design_name,parts\nd1,pTac,YFP,T1\nd2,pTac,-YFP\n',
+		       'regulation_data': REGULATION_DATA,
+		       'output': os.path.join(self.tmp_dir, '%s.pdf' % job_id)}
+		for k in kwargs.keys():
+			if kwargs[k] == None:
+				del job[k]
+			else:
+				job[k] = kwargs[k]
+		return job
+
+	def jobs(self):
+		return [self.job('first'),
+		        self.job('missing_parts', parts=os.path.join(self.tmp_dir, 'none.csv'),
+		                 parts_data=None),
+		        self.job('no_output', output=None),
+		        'not a job',
+		        self.job('last')]
+
+	def check_results(self, results):
+		self.assertEqual([r['id'] for r in results],
+		                 ['first', 'missing_parts', 'no_output', None, 'last'])
+		self.assertEqual([r['status'] for r in results],
+		                 ['ok', 'error', 'error', 'error', 'ok'])
+		self.assertTrue('none.csv' in results[1]['error'])
+		self.assertEqual(results[2]['error'], "missing 'output'")
+		self.assertEqual(results[3]['error'], 'job must be a JSON object')
+		# Jobs after the failures are still rendered
+		for result in [results[0], results[4]]:
+			self.assertTrue(os.path.getsize(result['output']) > 0)
+			self.assertTrue(result['time'] >= 0.0)
+
+	@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+	def test_failures_isolated(self):
+		self.check_results(psd.render_batch(self.jobs(), workers=1))
+
+	@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+	def test_failures_isolated_in_pool(self):
+		self.check_results(psd.render_batch(self.jobs(), workers=2))
+
+	def test_summary(self):
+		results = [{'id': 'a', 'status': 'ok', 'time': 1.5, 'output': 'a.pdf'},
+		           {'id': 'b', 'status': 'ok', 'time': 0.25, 'output': 'b.pdf',
+		            'cached': True},
+		           {'id': 'c', 'status': 'error', 'time': 0.5, 'error': "missing 'output'"}]
+		stdout = sys.stdout
+		sys.stdout = StringIO()
+		try:
+			psd.print_batch_summary(results, 2.25)
+			lines = sys.stdout.getvalue().splitlines()
+		finally:
+			sys.stdout = stdout
+		self.assertEqual([line.split() for line in lines],
+		                 [['a', 'ok', '1.50s', 'a.pdf'],
+		                  ['b', 'cached', '0.25s', 'b.pdf'],
+		                  ['c', 'error', '0.50s', 'missing', "'output'"],
+		                  ['rendered', '2', 'of', '3', 'in', '2.25s']])
+
+DESIGNS_DATA = ('design_name,parts\nd1,pTac,YFP,T1\nd2,pTac,-YFP\n'
+                'd3,pTac,YFP,YFP,YFP,T1\nd4,-T1\nd5,pTac,YFP,-T1,pTac\n')
+
+def pdf_page_count (filename):
+	""" Number of pages of a PDF file written by matplotlib.
+	"""
+	return len(re.findall('/Type /Page\\b', open(filename, 'rb').read()))
+
+@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+class PagingTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.part_info = psd.load_part_information(StringIO(PARTS_DATA))
+		self.dna_designs = psd.load_dna_designs(StringIO(DESIGNS_DATA), self.part_info)
+		self.regs_info = psd.resolve_regulation(psd.load_regulations(
+			             StringIO(REGULATION_DATA)), self.dna_designs)
+		self.out_filename = os.path.join(self.tmp_dir, 'out.pdf')
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir, True)
+
+	def plot(self, designs_per_page):
+		plot_params = {'output_formats': 'pdf;png:20', 'designs_per_page': designs_per_page}
+		psd.plot_dna(self.dna_designs, self.out_filename, plot_params, self.regs_info)
+		return psd.output_formats(self.out_filename, plot_params)
+
+	def test_pages(self):
+		formats = self.plot(2)
+		self.assertEqual(pdf_page_count(self.out_filename), 3)
+		for page_num in [1, 2, 3]:
+			png = psd.export_page_filename(self.out_filename, 'png', 20, formats, page_num)
+			self.assertTrue(os.path.getsize(png) > 0)
+		self.assertFalse(os.path.exists(psd.export_page_filename(self.out_filename, 
+			                            'png', 20, formats, 4)))
+
+	def test_single_page(self):
+		for designs_per_page in [0, 5, 10]:
+			formats = self.plot(designs_per_page)
+			self.assertEqual(pdf_page_count(self.out_filename), 1)
+			self.assertTrue(os.path.exists(psd.export_filename(self.out_filename, 'png',
+				                                               20, formats)))
+		self.assertFalse(os.path.exists(psd.export_page_filename(self.out_filename, 
+			                            'png', 20, formats, 1)))
+
+class StreamTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.part_info = psd.load_part_information(StringIO(PARTS_DATA))
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir, True)
+
+	def write(self, filename, text):
+		filename = os.path.join(self.tmp_dir, filename)
+		f = open(filename, 'w')
+		f.write(text)
+		f.close()
+		return filename
+
+	def test_iter_matches_load(self):
+		designs_filename = self.write('designs.csv', DESIGNS_DATA)
+		dna_designs = psd.load_dna_designs(designs_filename, self.part_info)
+		streamed = list(psd.iter_dna_designs(designs_filename, self.part_info))
+		self.assertEqual(streamed, sorted(dna_designs.items()))
+
+	def test_rows_read_as_taken(self):
+		designs = psd.iter_dna_designs(StringIO(DESIGNS_DATA+'d6,pTac,unknown\n'),
+			                           self.part_info)
+		self.assertEqual(next(designs)[0], 'd1')
+		self.assertRaises(KeyError, list, designs)
+
+	@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+	def test_stream_matches_pages(self):
+		import matplotlib.image as mpimg
+		import numpy as np
+		designs_filename = self.write('designs.csv', DESIGNS_DATA)
+		dna_designs = psd.load_dna_designs(designs_filename, self.part_info)
+		regulations = psd.load_regulations(StringIO(REGULATION_DATA))
+		regs_info = psd.resolve_regulation(regulations, dna_designs)
+		plot_params = {'output_formats': 'pdf;png:20', 'designs_per_page': 2}
+		loaded_filename = os.path.join(self.tmp_dir, 'loaded.pdf')
+		streamed_filename = os.path.join(self.tmp_dir, 'streamed.pdf')
+		psd.plot_dna(dna_designs, loaded_filename, dict(plot_params), regs_info)
+		psd.plot_dna_stream(designs_filename, self.part_info, streamed_filename,
+			                dict(plot_params), regulations)
+		self.assertEqual(pdf_page_count(streamed_filename), 3)
+		self.assertEqual(pdf_page_count(loaded_filename), 3)
+		formats = psd.output_formats(loaded_filename, plot_params)
+		for page_num in [1, 2, 3]:
+			loaded = mpimg.imread(psd.export_page_filename(loaded_filename, 'png', 20, 
+				                                           formats, page_num))
+			streamed = mpimg.imread(psd.export_page_filename(streamed_filename, 'png', 20,
+				                                             formats, page_num))
+			self.assertTrue(np.array_equal(streamed, loaded))
+
+@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+class ProfilerTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		part_info = psd.load_part_information(StringIO(PARTS_DATA))
+		self.dna_designs = psd.load_dna_designs(StringIO(DESIGNS_DATA), part_info)
+		self.regs_info = psd.resolve_regulation(psd.load_regulations(
+			             StringIO(REGULATION_DATA)), self.dna_designs)
+		psd.profiler = psd.dpl.Profiler()
+
+	def tearDown(self):
+		psd.profiler = None
+		shutil.rmtree(self.tmp_dir, True)
+
+	def load(self, filename):
+		f = open(os.path.join(self.tmp_dir, filename), 'r')
+		try:
+			return json.load(f)
+		finally:
+			f.close()
+
+	def test_output(self):
+		psd.plot_dna(self.dna_designs, os.path.join(self.tmp_dir, 'out.png'), 
+			         {'dpi': 20}, self.regs_info)
+		psd.save_profile(os.path.join(self.tmp_dir, 'profile.json'),
+			             os.path.join(self.tmp_dir, 'trace.json'))
+		summary = self.load('profile.json')
+		self.assertEqual(sorted(summary.keys()), ['artists', 'renderer', 'stage'])
+		num_designs = len(self.dna_designs)
+		num_parts = sum([len(d) for d in self.dna_designs.values()])
+		for name in ['renderDNA', 'arcs']:
+			self.assertEqual(summary['stage'][name]['calls'], num_designs)
+		for name in ['tight_layout', 'draw_raster']:
+			self.assertEqual(summary['stage'][name]['calls'], 1)
+		self.assertEqual(sum([r['calls'] for r in summary['renderer'].values()]), num_parts)
+		for category in ['renderer', 'stage']:
+			for totals in summary[category].values():
+				self.assertEqual(sorted(totals.keys()), ['calls', 'time'])
+				self.assertTrue(totals['time'] >= 0.0)
+		# Artists drawn for each design (by name)
+		self.assertEqual(sorted(summary['artists'].keys()), sorted(self.dna_designs.keys()))
+		for counts in summary['artists'].values():
+			self.assertEqual(sorted(counts.keys()), ['collections', 'lines', 'patches',
+				                                     'texts', 'total'])
+			self.assertEqual(counts['total'], sum([counts[k] for k in counts.keys()
+				                                   if k != 'total']))
+			self.assertTrue(counts['total'] > 0)
+		trace = self.load('trace.json')
+		self.assertEqual(trace['otherData']['artists'], summary['artists'])
+		events = trace['traceEvents']
+		self.assertEqual(len(events), sum([totals['calls'] for category in ['renderer', 'stage']
+			                               for totals in summary[category].values()]))
+		for event in events:
+			self.assertEqual(event['ph'], 'X')
+			self.assertTrue(event['cat'] in ['renderer', 'stage'])
+			self.assertTrue(event['ts'] >= 0.0 and event['dur'] >= 0.0)
+
+	def test_disabled(self):
+		psd.profiler = None
+		self.assertTrue(psd.stage('plot') is psd.dpl.NULL_STAGE)
+		psd.save_profile(os.path.join(self.tmp_dir, 'profile.json'))
+		self.assertFalse(os.path.exists(os.path.join(self.tmp_dir, 'profile.json')))
+		dr = psd.design_renderer({})
+		self.assertEqual(dr.profiler, None)
+
+BUNDLE = {'params': {'linewidth': 1.0, 'axis_y': 35.0},
+          'parts': [{'name': 'pTac', 'type': 'Promoter', 'color': [0.0, 0.0, 0.0]},
+                    {'name': 'YFP', 'type': 'CDS', 'color': [1.0, 0.8, 0.0]},
+                    {'name': 'T1', 'type': 'Terminator', 'color': [0.0, 0.0, 0.0]}],
+          'regulation': [{'from_partname': 'YFP', 'type': 'Repression',
+                          'to_partname': 'pTac', 'color': [1.0, 0.0, 0.0]}],
+          'assignments': [{'id': 'a', 'designs': {'d1': ['pTac', 'YFP', 'T1'],
+                                                  'd2': ['pTac', '-YFP']}},
+                          {'id': 'b', 'designs': {'d3': ['pTac', 'YFP', 'YFP', 'YFP', 'T1'],
+                                                  'd4': ['-T1'],
+                                                  'd5': ['pTac', 'YFP', '-T1', 'pTac']}}]}
+
+class BundleTest (unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		psd.part_catalogues.clear()
+		self.bundle_jobs = psd.load_bundle(StringIO(json.dumps(BUNDLE)))
+		designs = DESIGNS_DATA.splitlines()
+		self.csv_jobs = []
+		for job_id, rows in [('a', designs[1:3]), ('b', designs[3:])]:
+			self.csv_jobs.append({'id': job_id, 'params_data': PARAMS_DATA,
+			                      'parts_data': PARTS_DATA, 'regulation_data': REGULATION_DATA,
+			                      'designs_data': '\n'.join([designs[0]]+rows)+'\n'})
+
+	def tearDown(self):
+		psd.part_catalogues.clear()
+		shutil.rmtree(self.tmp_dir, True)
+
+	def test_assignments(self):
+		self.assertEqual([job['id'] for job in self.bundle_jobs], ['a', 'b'])
+		for job in self.bundle_jobs:
+			self.assertEqual(job['parts'], BUNDLE['parts'])
+			self.assertFalse('assignments' in job.keys())
+		jobs = psd.load_bundle(StringIO(json.dumps(BUNDLE['assignments'][0])))
+		self.assertEqual(jobs, [dict(BUNDLE['assignments'][0], id='a')])
+		jobs = psd.load_bundle(StringIO(json.dumps({'assignments': [{}, {}]})))
+		self.assertEqual([job['id'] for job in jobs], ['A000', 'A001'])
+		self.assertRaises(ValueError, psd.load_bundle, StringIO('[]'))
+
+	def test_bundle_matches_csv(self):
+		for bundle_job, csv_job in zip(self.bundle_jobs, self.csv_jobs):
+			self.assertEqual(psd.load_job(bundle_job), psd.load_job(csv_job))
+
+	@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+	def test_bundle_renders_as_csv(self):
+		import matplotlib.image as mpimg
+		import numpy as np
+		for bundle_job, csv_job in zip(self.bundle_jobs, self.csv_jobs):
+			images = []
+			for job, name in [(bundle_job, 'bundle'), (csv_job, 'csv')]:
+				job = dict(job, output=os.path.join(self.tmp_dir, '%s_%s.png' % (name, 
+					                                                               job['id'])))
+				if name == 'bundle':
+					job['params'] = dict(job['params'], dpi=30)
+				else:
+					job['params_data'] += 'dpi,30\n'
+				self.assertEqual(psd.run_job(job)['status'], 'ok')
+				images.append(mpimg.imread(job['output']))
+			self.assertTrue(np.array_equal(images[0], images[1]))
+
+if __name__ == '__main__':
+	unittest.main()
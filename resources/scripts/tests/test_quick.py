@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+"""
+    Tests of quick (run from resources/scripts with
+    python -m unittest discover tests).
+"""
+
+from StringIO import StringIO
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import quick
+
+try:
+	import matplotlib
+except ImportError:
+	matplotlib = None
+
+class BatchTest (unittest.TestCase):
+
+	def setUp(self):
+		self.out_dir = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.out_dir, True)
+
+	def test_duplicate_names(self):
+		# An unnamed spec is named by its number, so it can clash too
+		specs = quick.load_specs(StringIO('p.gray c.blue\nquick_000\tp.red t.black\n'))
+		self.assertRaises(ValueError, quick.render_specs, specs, self.out_dir, 'png', 1)
+		self.assertEqual(os.listdir(self.out_dir), [])
+
+	@unittest.skipIf(matplotlib == None, 'matplotlib is not installed')
+	def test_unique_names(self):
+		specs = quick.load_specs(StringIO('a\tp.gray c.blue\nb\tp.red -t.black\n'))
+		results = quick.render_specs(specs, self.out_dir, 'png', 1)
+		self.assertEqual([r['status'] for r in results], ['ok', 'ok'])
+		self.assertEqual(sorted(os.listdir(self.out_dir)), ['a.png', 'b.png'])
+
+if __name__ == '__main__':
+	unittest.main()